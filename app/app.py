@@ -1,39 +1,102 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi import FastAPI, HTTPException, Request, Depends, Header
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from pydantic_settings import BaseSettings
 from pydantic import BaseModel
+import asyncio
+import hmac
+import json
+import threading
 import uuid
 import os
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from app.config import settings
 from app.services.task_manager import TaskManager
+from app.services.scrape_executor import ScrapeExecutor, ExecutorSaturated
+from app.services.job_queue import QueueFull, get_job_queue
+from app.services.progress_broker import progress_broker
+from app.services.export_retention import ExportRetention
+from app.services.warehouse import get_warehouse
+from app.services.backfill import Backfill, backfill_run_id
+from app.worker import start_embedded_workers
+from app.exporter.formats import EXPORT_FORMATS, UnsupportedFormat, format_for_path, get_format
 from app.scraper.core import FBrefScraper
-from app.exporter.excel_exporter import ExcelExporter
+from app.scraper.driver_pool import driver_pool
+from app.scraper.fetchers import close_fetchers
+from app.scraper.fixtures import LEAGUES
+from app.scraper.page_cache import get_page_cache
+from app.scraper.rate_limit import rate_limiter
+from app.scraper.single_flight import AsyncSingleFlight, fixtures_flight, match_flight
+from app.utils.logger import get_logger
+from app.utils.metrics import CONTENT_TYPE_LATEST, render_metrics
+
+logger = get_logger(__name__)
 
 # Pydantic model for generate-report request
 class GenerateReportRequest(BaseModel):
     match_url: str
     match_id: str
-    format: str = "xlsx"
+    format: Optional[str] = None  # defaults to EXPORT_DEFAULT_FORMAT
+
+class BackfillRequest(BaseModel):
+    league: Optional[str] = None
+    season: Optional[str] = None
+    date_from: Optional[str] = None
+    date_to: Optional[str] = None
+    restart: bool = False
 
 # Global task manager
 task_manager = TaskManager()
 
+# Bounded pool that runs every blocking scrape off the event loop
+scrape_executor = ScrapeExecutor()
+
+# Identical concurrent fixture requests share one executor job
+fixtures_requests = AsyncSingleFlight()
+
+# Durable report job queue shared with the worker processes
+job_queue = get_job_queue()
+workers_stop = threading.Event()
+
+# Local store of scraped fixtures and matches
+warehouse = get_warehouse() if settings.WAREHOUSE_ENABLED else None
+
+# Running backfills: run_id -> (task_id, stop event)
+backfills: Dict[str, tuple] = {}
+backfills_lock = threading.Lock()
+
+# Deletes expired or oversized reports from the export directory
+export_retention = ExportRetention()
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    print("Starting FBref Scraper Web App...")
+    logger.info("Starting FBref Scraper Web App...")
     # Ensure data directory exists
-    os.makedirs("data/exports", exist_ok=True)
+    os.makedirs(settings.EXPORT_OUTPUT_DIR, exist_ok=True)
+    # Warm up the shared Chrome driver pool without blocking the event loop
+    await asyncio.to_thread(driver_pool.start)
+    # Development convenience: run report workers inside the API process
+    workers_stop.clear()
+    start_embedded_workers(settings.QUEUE_EMBEDDED_WORKERS, workers_stop)
+    if not settings.QUEUE_EMBEDDED_WORKERS:
+        logger.info("Report jobs are built by worker processes (python -m app.worker)")
+    export_retention.start(workers_stop)
     yield
     # Cleanup
-    print("Shutting down FBref Scraper Web App...")
+    logger.info("Shutting down FBref Scraper Web App...")
+    workers_stop.set()
+    with backfills_lock:
+        for _, stop_event in backfills.values():
+            stop_event.set()
     task_manager.cleanup()
+    scrape_executor.shutdown()
+    close_fetchers()
+    await asyncio.to_thread(driver_pool.shutdown)
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -41,6 +104,26 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Clients allowed on admin endpoints while no SECURITY_ADMIN_TOKEN is configured
+LOOPBACK_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+def require_admin(request: Request, x_admin_token: Optional[str] = Header(None)):
+    """Guard admin endpoints: the X-Admin-Token header must match
+    SECURITY_ADMIN_TOKEN, and without a configured token only loopback
+    clients get in (fail closed)"""
+    token = settings.SECURITY_ADMIN_TOKEN
+    if token:
+        if not x_admin_token or not hmac.compare_digest(x_admin_token, token):
+            raise HTTPException(status_code=403, detail="Admin token required")
+    elif not request.client or request.client.host not in LOOPBACK_HOSTS:
+        raise HTTPException(status_code=403, detail="Set security.admin_token to use admin endpoints remotely")
+
+def require_warehouse():
+    """The local warehouse, or 404 when it is disabled"""
+    if warehouse is None:
+        raise HTTPException(status_code=404, detail="Warehouse is disabled")
+    return warehouse
+
 # Mount static files and templates
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 templates = Jinja2Templates(directory="app/templates")
@@ -54,147 +137,318 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
 @app.get("/", response_class=HTMLResponse)
 async def read_root(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 @app.get("/api/leagues")
 async def get_supported_leagues():
-    """Get list of supported leagues"""
-    return {
-        "leagues": [
-            {"id": "9", "name": "Premier League"},
-            {"id": "12", "name": "La Liga"},
-            {"id": "11", "name": "Serie A"},
-            {"id": "20", "name": "Bundesliga"},
-            {"id": "13", "name": "Ligue 1"}
-        ]
-    }
+    """Get list of known leagues (fixtures of unlisted competitions are returned too)"""
+    return {"leagues": [{"id": lid, "name": name} for lid, name in LEAGUES.items()]}
 
 @app.get("/api/fixtures")
 async def get_fixtures(date: str, league: Optional[str] = None):
     """Get fixtures for a specific date and league"""
     try:
-        scraper = FBrefScraper()
-        fixtures = scraper.get_fixtures_by_date(date, league)
+        # Fresh stored fixtures are answered without taking an executor slot
+        if warehouse:
+            fixtures = await asyncio.to_thread(warehouse.fresh_fixtures, date, league)
+            if fixtures is not None:
+                return {"fixtures": fixtures, "date": date, "league": league, "source": "warehouse"}
+        fixtures = await fixtures_requests.do(
+            (date, league),
+            lambda: scrape_executor.run(FBrefScraper().get_fixtures_by_date, date, league)
+        )
         return {"fixtures": fixtures, "date": date, "league": league}
+    except ExecutorSaturated as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def trigger_match_scrapes(transitions: List[Dict]) -> int:
+    """Queue match report scrapes for fixtures that just finished"""
+    triggered = 0
+    for fixture in transitions:
+        if fixture["state"] != "finished" or fixture["previous_state"] == "finished":
+            continue
+        if warehouse.has_match(fixture["match_id"]):
+            continue
+        try:
+            scrape_executor.submit(FBrefScraper().scrape_match_data, fixture["match_url"], True)
+        except ExecutorSaturated:
+            logger.warning("Scrape queue full, deferring match scrape for %s", fixture['match_url'])
+            break
+        triggered += 1
+    return triggered
+
+@app.get("/api/fixtures/changes")
+async def get_fixture_changes(date: str, league: Optional[str] = None, cursor: int = 0,
+                              store=Depends(require_warehouse)):
+    """Fixtures that are new or changed since `cursor`; finished matches get scraped"""
+    async def refresh():
+        transitions = await scrape_executor.run(FBrefScraper().refresh_fixtures, date, league)
+        return await asyncio.to_thread(trigger_match_scrapes, transitions)
+
+    try:
+        triggered = await fixtures_requests.do(("refresh", date, league), refresh)
+    except ExecutorSaturated as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+    changes = await asyncio.to_thread(store.fixture_changes, date, league, cursor)
+    return {**changes, "date": date, "league": league, "match_scrapes_triggered": triggered}
+
 @app.post("/api/generate-report")
-async def generate_report(
-    background_tasks: BackgroundTasks,
-    request: GenerateReportRequest
-):
-    """Start generating a report for a specific match"""
-    task_id = str(uuid.uuid4())
-    
-    # Initialize task
-    task_manager.create_task(task_id, {
-        "match_url": request.match_url,
-        "match_id": request.match_id,
-        "format": request.format,
-        "status": "initializing",
-        "progress": 0,
-        "message": "Starting report generation..."
-    })
-    
-    # Start background task
-    background_tasks.add_task(
-        generate_report_task, 
-        task_id, 
-        request.match_url, 
-        request.match_id, 
-        request.format
-    )
-    
-    return {"task_id": task_id, "status": "started"}
+async def generate_report(request: GenerateReportRequest):
+    """Queue report generation for a specific match"""
+    try:
+        export_format = get_format(request.format)
+    except UnsupportedFormat as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-@app.get("/api/progress/{task_id}")
-async def get_progress(task_id: str):
-    """Get progress of a report generation task"""
-    task = task_manager.get_task(task_id)
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+    try:
+        job = await asyncio.to_thread(job_queue.enqueue, request.match_url, request.match_id,
+                                      export_format.name)
+    except QueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
     
-    return {
+    status = "reused" if job.get("reused") else "deduplicated" if job["deduplicated"] else "started"
+    return {"task_id": job["task_id"], "status": status}
+
+@app.post("/api/backfill")
+async def start_backfill(request: BackfillRequest, store=Depends(require_warehouse)):
+    """Start (or resume) a season or date-range backfill; progress via /api/progress/{task_id}"""
+    run_id = backfill_run_id(request.league, request.season, request.date_from, request.date_to)
+    with backfills_lock:
+        if run_id in backfills:
+            return {"task_id": backfills[run_id][0], "run_id": run_id, "status": "running"}
+        stop_event = threading.Event()
+        try:
+            backfill = Backfill(
+                league=request.league, season=request.season, date_from=request.date_from,
+                date_to=request.date_to, store=store, stop_event=stop_event, restart=request.restart,
+                progress=lambda snapshot: task_manager.update_task(task_id, {
+                    **snapshot,
+                    "status": "running",
+                    "message": f"Backfill {snapshot['progress']}% at {snapshot['pages_per_minute']} pages/min",
+                })
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        task_id = str(uuid.uuid4())
+        task_manager.create_task(task_id, {"status": "running", "run_id": run_id,
+                                           "message": "Backfill started"})
+        backfills[run_id] = (task_id, stop_event)
+
+    def run():
+        try:
+            result = backfill.run()
+            task_manager.update_task(task_id, {
+                **result,
+                "progress": 100 if result["status"] == "completed" else result["progress"],
+                "message": f"Backfill {result['status']}: {result['matches_done']} matches scraped, "
+                           f"{result['matches_skipped']} already stored"
+            })
+        except Exception as e:
+            logger.error("Backfill %s failed: %s", run_id, e)
+            task_manager.update_task(task_id, {"status": "error", "message": f"Backfill failed: {e}"})
+        finally:
+            with backfills_lock:
+                backfills.pop(run_id, None)
+
+    threading.Thread(target=run, name=f"backfill-{run_id}", daemon=True).start()
+    return {"task_id": task_id, "run_id": run_id, "status": "started"}
+
+@app.delete("/api/backfill/{task_id}")
+async def stop_backfill(task_id: str):
+    """Stop a running backfill after its current page; its checkpoint is kept"""
+    with backfills_lock:
+        for run_id, (running_task_id, stop_event) in backfills.items():
+            if running_task_id == task_id:
+                stop_event.set()
+                return {"task_id": task_id, "run_id": run_id, "status": "stopping"}
+    raise HTTPException(status_code=404, detail="No running backfill with this task id")
+
+def get_task_status(task_id: str) -> Optional[Dict]:
+    """Report jobs live in the durable queue; other tasks in the TaskManager.
+    Blocks on SQLite, so async handlers call it through asyncio.to_thread"""
+    return job_queue.get(task_id) or task_manager.get_task(task_id)
+
+# Task statuses after which no further progress is published
+FINISHED_STATUSES = ("completed", "error", "stopped")
+
+# Throughput and ETA fields of backfill tasks
+BACKFILL_PROGRESS_FIELDS = ("run_id", "dates_done", "dates_total", "matches_done", "matches_skipped",
+                            "matches_total", "pages_fetched", "pages_per_minute", "eta_seconds")
+
+def progress_payload(task_id: str, task: Dict) -> Dict:
+    """Progress fields exposed to clients by polling and streaming endpoints"""
+    payload = {
         "task_id": task_id,
         "status": task.get("status", "unknown"),
+        "stage": task.get("stage"),
         "progress": task.get("progress", 0),
         "message": task.get("message", ""),
         "match_url": task.get("match_url"),
-        "match_id": task.get("match_id")
+        "match_id": task.get("match_id"),
+        "attempts": task.get("attempts")
     }
+    if task.get("run_id"):
+        payload["backfill"] = {
+            **{key: task.get(key) for key in BACKFILL_PROGRESS_FIELDS},
+            "matches_failed": len(task.get("matches_failed") or [])
+        }
+    return payload
+
+@app.get("/api/progress/{task_id}")
+async def get_progress(task_id: str):
+    """Get progress of a report generation task"""
+    task = await asyncio.to_thread(get_task_status, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    return progress_payload(task_id, task)
+
+@app.get("/api/progress/{task_id}/stream")
+async def stream_progress(task_id: str, request: Request):
+    """Push progress updates as server-sent events until the task finishes"""
+    if not await asyncio.to_thread(get_task_status, task_id):
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    async def event_stream():
+        changed = progress_broker.subscribe(task_id)
+        last_payload = None
+        try:
+            while not await request.is_disconnected():
+                changed.clear()
+                task = await asyncio.to_thread(get_task_status, task_id)
+                if not task:
+                    yield "event: gone\ndata: {}\n\n"
+                    return
+                payload = progress_payload(task_id, task)
+                if payload != last_payload:
+                    yield f"data: {json.dumps(payload)}\n\n"
+                    last_payload = payload
+                if payload["status"] in FINISHED_STATUSES:
+                    return
+                try:
+                    # Updates from this process wake us immediately; the timeout
+                    # picks up jobs advanced by external worker processes
+                    await asyncio.wait_for(changed.wait(), timeout=settings.QUEUE_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+        finally:
+            progress_broker.unsubscribe(task_id, changed)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.get("/api/download/{task_id}")
-async def download_report(task_id: str):
-    """Download generated report"""
-    task = task_manager.get_task(task_id)
+async def download_report(task_id: str, request: Request):
+    """Download generated report (supports Range, If-Range and If-None-Match)"""
+    task = await asyncio.to_thread(get_task_status, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
     if task["status"] != "completed":
         raise HTTPException(status_code=400, detail="Report not ready")
     
-    if "file_path" not in task or not os.path.exists(task["file_path"]):
+    if not task.get("file_path"):
         raise HTTPException(status_code=500, detail="Report file not found")
+    try:
+        stat_result = os.stat(task["file_path"])
+    except FileNotFoundError:
+        raise HTTPException(status_code=410, detail="Report file has expired, generate the report again")
     
+    export_format = format_for_path(task["file_path"]) or get_format("xlsx")
+
     # Generate a better filename
-    filename = f"fbref_report_{task_id}.xlsx"
-    if "match_id" in task:
-        filename = f"fbref_report_{task['match_id']}.xlsx"
+    filename = f"fbref_report_{task_id}{export_format.suffix}"
+    if task.get("match_id"):
+        filename = f"fbref_report_{task['match_id']}{export_format.suffix}"
     
-    return StreamingResponse(
-        open(task["file_path"], "rb"),
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    # FileResponse streams from disk (zero-copy where the server supports
+    # pathsend), answers Range/If-Range itself and derives the ETag from
+    # the file's size and mtime
+    response = FileResponse(
+        task["file_path"],
+        media_type=export_format.media_type,
+        filename=filename,
+        stat_result=stat_result,
+        headers={"Cache-Control": "private, max-age=0, must-revalidate"}
     )
-
-async def generate_report_task(task_id: str, match_url: str, match_id: str, format: str):
-    """Background task to generate report - FIXTURES ONLY VERSION"""
-    try:
-        task_manager.update_task(task_id, {
-            "status": "discovering_fixture", 
-            "progress": 20,
-            "message": "Discovering fixture details..."
-        })
-        
-        scraper = FBrefScraper()
-        exporter = ExcelExporter()
-        
-        # Scrape match data ONLY (no player data)
-        task_manager.update_task(task_id, {
-            "status": "scraping_teams", 
-            "progress": 60,
-            "message": "Scraping team statistics..."
-        })
-        match_data = scraper.scrape_match_data(match_url)
-        
-        # SKIP PLAYER DATA COLLECTION FOR NOW
-        task_manager.update_task(task_id, {
-            "status": "building_file", 
-            "progress": 80,
-            "message": "Building Excel file with fixture data..."
-        })
-        
-        # Pass empty dict for player_data
-        file_path = exporter.export_match_report(match_data, {}, task_id)
-        
-        task_manager.update_task(task_id, {
-            "status": "completed", 
-            "progress": 100,
-            "file_path": file_path,
-            "message": "Fixture report generation complete"
-        })
-        
-    except Exception as e:
-        error_message = f"Error generating report: {str(e)}"
-        print(error_message)
-        task_manager.update_task(task_id, {
-            "status": "error",
-            "progress": 100,
-            "message": error_message
+    if etag_matches(request.headers.get("if-none-match"), response.headers["etag"]):
+        return Response(status_code=304, headers={
+            "ETag": response.headers["etag"],
+            "Cache-Control": response.headers["cache-control"]
         })
+    return response
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in candidates)
+
+@app.get("/api/exports")
+async def export_stats():
+    """Export directory usage and retention sweeper counters"""
+    return export_retention.stats()
+
+@app.get("/api/formats")
+async def list_formats():
+    """Report formats accepted by /api/generate-report"""
+    return {
+        "default": get_format().name,
+        "formats": [{"name": f.name, "media_type": f.media_type, "suffix": f.suffix}
+                    for f in EXPORT_FORMATS.values()]
+    }
+
+@app.get("/api/warehouse/fixtures")
+async def query_stored_fixtures(date: Optional[str] = None, date_from: Optional[str] = None,
+                                date_to: Optional[str] = None, league: Optional[str] = None,
+                                team: Optional[str] = None, limit: int = 500,
+                                store=Depends(require_warehouse)):
+    """Stored fixtures filtered by date range, league id and team (home or away)"""
+    fixtures = await asyncio.to_thread(store.query_fixtures, date, date_from, date_to, league, team, limit)
+    return {"fixtures": fixtures, "count": len(fixtures)}
+
+@app.get("/api/warehouse/matches")
+async def query_stored_matches(date_from: Optional[str] = None, date_to: Optional[str] = None,
+                               league: Optional[str] = None, team: Optional[str] = None,
+                               limit: int = 500, store=Depends(require_warehouse)):
+    """Stored match reports filtered by date range, league id and team"""
+    matches = await asyncio.to_thread(store.query_matches, date_from, date_to, league, team, limit)
+    return {"matches": matches, "count": len(matches)}
+
+@app.get("/api/warehouse/matches/{match_id}")
+async def get_stored_match(match_id: str, tables: bool = True, store=Depends(require_warehouse)):
+    """A stored match report; team tables as row records unless tables=false"""
+    match_data = await asyncio.to_thread(store.get_match, match_id)
+    if match_data is None:
+        raise HTTPException(status_code=404, detail="Match not stored")
+    for side in ("home_team", "away_team"):
+        match_data[side] = {
+            name: json.loads(df.to_json(orient="records")) if tables else {"rows": len(df), "columns": list(df.columns)}
+            for name, df in match_data[side].items()
+        }
+    return match_data
+
+@app.get("/api/warehouse/stats")
+async def warehouse_stats(store=Depends(require_warehouse)):
+    return await asyncio.to_thread(store.stats)
+
+@app.get("/api/jobs")
+async def list_jobs(status: Optional[str] = None, limit: int = 50):
+    """Recent report jobs and queue counts by status"""
+    stats = await asyncio.to_thread(job_queue.stats)
+    jobs = await asyncio.to_thread(job_queue.list_jobs, status, limit)
+    return {"stats": stats, "jobs": jobs}
 
 # Health check endpoint
 @app.get("/api/health")
@@ -202,9 +456,55 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "FBref Scraper"}
 
-@app.get("/api/debug/fixtures")
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics: per-stage latency histograms, bytes and table counters"""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+@app.get("/api/driver-pool")
+async def driver_pool_stats():
+    """Driver pool occupancy and wait-time metrics"""
+    return driver_pool.stats()
+
+@app.get("/api/rate-limit")
+async def rate_limit_stats():
+    """Adaptive per-host request rates and response outcome counts"""
+    return rate_limiter.stats()
+
+@app.get("/api/executor")
+async def executor_stats():
+    """Scrape executor queue depth, rejection counts and coalesced scrapes"""
+    return {
+        **scrape_executor.stats(),
+        "coalesced": {"fixtures": fixtures_flight.stats(), "matches": match_flight.stats()}
+    }
+
+@app.get("/api/admin/cache", dependencies=[Depends(require_admin)])
+async def list_cache_entries(prefix: str = "", limit: int = 100):
+    """Inspect page cache usage and the most recently used entries"""
+    cache = get_page_cache()
+    return {"stats": cache.stats(), "entries": cache.entries(prefix, limit)}
+
+@app.delete("/api/admin/cache", dependencies=[Depends(require_admin)])
+async def invalidate_cache(url: Optional[str] = None, prefix: Optional[str] = None, all: bool = False):
+    """Invalidate one cached URL, every URL under a prefix, or the whole cache"""
+    cache = get_page_cache()
+    if url:
+        removed = 1 if cache.delete(url) else 0
+    elif prefix:
+        removed = cache.invalidate_prefix(prefix)
+    elif all:
+        removed = cache.clear()
+    else:
+        raise HTTPException(status_code=400, detail="Specify url, prefix or all=true")
+    return {"removed": removed}
+
+@app.get("/api/debug/fixtures", dependencies=[Depends(require_admin)])
 async def debug_fixtures(date: str, league: Optional[str] = None):
     """Debug endpoint to see raw fixture data"""
     scraper = FBrefScraper()
-    fixtures = scraper.get_fixtures_by_date(date, league)
+    try:
+        fixtures = await scrape_executor.run(scraper.get_fixtures_by_date, date, league)
+    except ExecutorSaturated as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
     return {"fixtures": fixtures}
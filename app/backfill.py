@@ -0,0 +1,75 @@
+"""Bulk backfill of a league season or a date range into the warehouse.
+
+    python -m app.backfill --league 9 --season 2023-2024
+    python -m app.backfill --from 2024-08-01 --to 2024-08-31 [--league 9]
+
+Interrupting a run (Ctrl+C) saves its checkpoint; running the same command
+again resumes it.
+"""
+import argparse
+import signal
+import threading
+from typing import Dict, Optional
+
+from app.services.backfill import Backfill
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _EtaText:
+    """Seconds shown as 12m05s, formatted only if the record is emitted"""
+
+    def __init__(self, seconds: int):
+        self.seconds = seconds
+
+    def __str__(self):
+        return f"{self.seconds // 60}m{self.seconds % 60:02d}s"
+
+
+def print_progress(snapshot: Dict):
+    eta = snapshot["eta_seconds"]
+    matches_total = snapshot["matches_total"]
+    logger.info(
+        "[%s] %3d%% dates %d/%d matches %d/%s (skipped %d, failed %d) %s pages/min ETA %s",
+        snapshot["run_id"], snapshot["progress"], snapshot["dates_done"], snapshot["dates_total"],
+        snapshot["matches_done"] + snapshot["matches_skipped"],
+        matches_total if matches_total is not None else "?",
+        snapshot["matches_skipped"], len(snapshot["matches_failed"]), snapshot["pages_per_minute"],
+        "?" if eta is None else _EtaText(eta)
+    )
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Backfill fixtures and match reports into the warehouse")
+    parser.add_argument("--league", help="FBref competition id, e.g. 9 for the Premier League")
+    parser.add_argument("--season", help="season such as 2023-2024 (requires --league)")
+    parser.add_argument("--from", dest="date_from", help="first date (YYYY-MM-DD) of a range backfill")
+    parser.add_argument("--to", dest="date_to", help="last date (YYYY-MM-DD) of a range backfill")
+    parser.add_argument("--restart", action="store_true", help="ignore a saved checkpoint")
+    args = parser.parse_args(argv)
+
+    stop_event = threading.Event()
+
+    def request_stop(signum, frame):
+        logger.info("Stopping backfill after the current page...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    try:
+        backfill = Backfill(league=args.league, season=args.season, date_from=args.date_from,
+                            date_to=args.date_to, progress=print_progress,
+                            stop_event=stop_event, restart=args.restart)
+    except ValueError as e:
+        parser.error(str(e))
+
+    result = backfill.run()
+    logger.info("Backfill %s %s: %d matches scraped, %d already stored, %d failed, %d pages fetched",
+                result['run_id'], result['status'], result['matches_done'], result['matches_skipped'],
+                len(result['matches_failed']), result['pages_fetched'])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,93 @@
+import logging
 import os
 import yaml
 from typing import List, Optional
 from pydantic_settings import BaseSettings
 
+from app.utils.logger import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
 class Settings(BaseSettings):
     # Application settings
     APP_NAME: str = "FBref Scraper"
     APP_VERSION: str = "1.0.0"
     APP_DEBUG: bool = False
 
+    # Logging settings
+    LOG_LEVEL: str = "INFO"  # DEBUG enables the expensive per-page debug output
+
     # Scraper settings
+    SCRAPER_BASE_URL: str = "https://fbref.com"
     SCRAPER_REQUEST_DELAY_MIN: int = 5
     SCRAPER_REQUEST_DELAY_MAX: int = 10
     SCRAPER_MAX_RETRIES: int = 3
     SCRAPER_BACKOFF_FACTOR: float = 1.5
     SCRAPER_TIMEOUT: int = 30
     SCRAPER_HEADLESS: bool = True
+    SCRAPER_FETCH_ENGINE: str = "auto"  # auto | http | selenium
+    SCRAPER_HTTP_POOL_SIZE: int = 10
+    SCRAPER_RATE_PER_MINUTE: float = 8.0
+    SCRAPER_RATE_BURST: int = 2
+    SCRAPER_RATE_MIN_PER_MINUTE: float = 2.0
+    SCRAPER_RATE_MAX_PER_MINUTE: float = 10.0
+    SCRAPER_RATE_INCREASE: float = 0.5  # req/min added per healthy response
+    SCRAPER_RATE_DECREASE: float = 0.5  # rate multiplier on throttling or slow responses
+    SCRAPER_SLOW_RESPONSE_SECONDS: float = 10.0
+    SCRAPER_PLAYER_CONCURRENCY: int = 4
+    SCRAPER_INCLUDE_PLAYERS: bool = False
+    SCRAPER_WORKERS: int = 4
+    SCRAPER_MAX_QUEUE: int = 16
 
     # Selenium settings
     SELENIUM_WINDOW_SIZE: str = "1920,1080"
-    SELENIUM_IMPLICIT_WAIT: int = 10
+    SELENIUM_CHROMEDRIVER_PATH: str = ""  # pinned binary; empty resolves once and caches the result
+    SELENIUM_CHROMEDRIVER_CACHE: str = "data/chromedriver.json"
+    SELENIUM_CHROMEDRIVER_DOWNLOAD: bool = True  # allow a one-time webdriver-manager download
+    SELENIUM_IMPLICIT_WAIT: int = 0  # explicit readiness waits make this unnecessary
+    SELENIUM_READY_TIMEOUT: float = 10
+    SELENIUM_BLOCK_RESOURCES: List[str] = ["images", "media", "fonts", "analytics", "ads"]
+    SELENIUM_BLOCK_URLS: List[str] = []  # extra CDP URL patterns such as "*example.com/tracker*"
+    SELENIUM_PAGE_LOAD_STRATEGY: str = "eager"  # normal | eager | none
     SELENIUM_PAGE_LOAD_TIMEOUT: int = 30
+    SELENIUM_POOL_SIZE: int = 2
+    SELENIUM_POOL_WARM_SIZE: int = 1
+    SELENIUM_POOL_MAX_PAGES: int = 50
+    SELENIUM_POOL_ACQUIRE_TIMEOUT: float = 120
+
+    # Report job queue settings
+    QUEUE_DB_PATH: str = "data/jobs.db"
+    QUEUE_LEASE_SECONDS: int = 600
+    QUEUE_POLL_INTERVAL: float = 2.0
+    QUEUE_RETRY_DELAY: float = 30.0
+    QUEUE_MAX_PENDING: int = 100
+    QUEUE_WORKER_PROCESSES: int = 2
+    QUEUE_EMBEDDED_WORKERS: int = 0
+    QUEUE_REUSE_SECONDS: int = 3600
+
+    # Warehouse settings
+    WAREHOUSE_ENABLED: bool = True
+    WAREHOUSE_DB_PATH: str = "data/warehouse.db"
+
+    # Page cache settings
+    CACHE_ENABLED: bool = True
+    CACHE_DIR: str = "data/cache"
+    CACHE_MAX_SIZE_MB: int = 500
+    CACHE_TTL_TODAY: int = 300
+    CACHE_TTL_FUTURE: int = 3600
+    CACHE_TTL_DEFAULT: int = 3600
 
     # Export settings
     EXPORT_DEFAULT_FORMAT: str = "xlsx"
     EXPORT_MAX_FILE_SIZE_MB: int = 50
     EXPORT_KEEP_FILES_HOURS: int = 24
     EXPORT_OUTPUT_DIR: str = "data/exports"
+    EXPORT_SWEEP_INTERVAL: int = 600
 
     # Security settings
     SECURITY_RATE_LIMIT_REQUESTS: int = 100
     SECURITY_RATE_LIMIT_PERIOD: int = 3600
+    SECURITY_ADMIN_TOKEN: str = ""
 
     class Config:
         env_file = ".env"
@@ -40,46 +97,29 @@ def load_settings() -> Settings:
     """Load settings from YAML file if exists, otherwise use defaults"""
     config_path = os.getenv('CONFIG_PATH', 'config/settings.yaml')
     
-    print(f"Looking for config at: {config_path}")
-    print(f"Config exists: {os.path.exists(config_path)}")
-    
     if os.path.exists(config_path):
         with open(config_path, 'r') as f:
             config_data = yaml.safe_load(f)
         
-        print("Original YAML structure:")
-        print(config_data)
-        
         # Flatten the nested YAML structure
         flattened_config = {}
         for section, values in config_data.items():
             if isinstance(values, dict):
                 for key, value in values.items():
-                    field_name = f"{section.upper()}_{key.upper()}"
-                    flattened_config[field_name] = value
-                    print(f"Mapping: {section}.{key} -> {field_name} = {value}")
+                    flattened_config[f"{section.upper()}_{key.upper()}"] = value
             else:
-                field_name = section.upper()
-                flattened_config[field_name] = values
-                print(f"Mapping: {section} -> {field_name} = {values}")
-        
-        print("Flattened config:")
-        print(flattened_config)
-        
-        # Check if all required fields are present
-        expected_fields = [name for name in Settings.__annotations__]
-        print("Expected fields in Settings:")
-        print(expected_fields)
-        
-        missing_fields = set(expected_fields) - set(flattened_config.keys())
-        extra_fields = set(flattened_config.keys()) - set(expected_fields)
+                flattened_config[section.upper()] = values
         
-        print(f"Missing fields: {missing_fields}")
-        print(f"Extra fields: {extra_fields}")
+        if logger.isEnabledFor(logging.DEBUG):
+            expected_fields = set(Settings.__annotations__)
+            logger.debug("Loaded %s: %d settings, missing %s, extra %s", config_path,
+                         len(flattened_config), sorted(expected_fields - set(flattened_config)),
+                         sorted(set(flattened_config) - expected_fields))
         
         return Settings(**flattened_config)
     
-    print("Using default settings (no YAML file found)")
+    logger.info("No config file at %s, using default settings", config_path)
     return Settings()
 
-settings = load_settings()
\ No newline at end of file
+settings = load_settings()
+configure_logging("DEBUG" if settings.APP_DEBUG else settings.LOG_LEVEL)
@@ -1,3 +1,6 @@
 from .excel_exporter import ExcelExporter
+from .columnar_exporter import ColumnarExporter
+from .formats import ExportFormat, UnsupportedFormat, get_format, format_for_path
 
-__all__ = ['ExcelExporter']
\ No newline at end of file
+__all__ = ['ExcelExporter', 'ColumnarExporter', 'ExportFormat', 'UnsupportedFormat',
+           'get_format', 'format_for_path']
@@ -0,0 +1,110 @@
+import io
+import json
+import os
+import zipfile
+from datetime import datetime
+from typing import Dict, Iterator, Tuple
+
+import pandas as pd
+
+from .headers import header_rows
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - only the Excel/CSV formats work without pyarrow
+    pa = None
+
+
+def report_tables(match_data: Dict, player_data: Dict = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """(name, DataFrame) for every non-empty table of a report, named like the Excel sheets"""
+    for side, label in (('home_team', 'Home'), ('away_team', 'Away')):
+        for table_name, data in match_data.get(side, {}).items():
+            df = _as_frame(data)
+            if df is not None:
+                yield f"{label}_{table_name}", df
+
+    names = {p['id']: p.get('name', p['id']) for p in match_data.get('players', [])}
+    for player_id, tables in (player_data or {}).items():
+        for table_name, data in (tables or {}).items():
+            df = _as_frame(data)
+            if df is not None:
+                df = df.assign(player_name=names.get(player_id, player_id))
+                df.attrs["labels"] = {**df.attrs.get("labels", {}), "player_name": "Player Name"}
+                yield f"Player_{player_id}_{table_name}", df
+
+
+def _as_frame(data):
+    if data is None or isinstance(data, str) or len(data) == 0:
+        return None
+    return data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+
+
+class ColumnarExporter:
+    """Writes a report as a zip bundle holding one typed file per table.
+
+    Parquet and Arrow IPC files keep the parser's column dtypes (nullable
+    integers included) under their data-stat column keys; CSV tables are
+    gzip-compressed and headed by FBref's labels. Each bundle carries
+    a metadata.json with the match info and the human-readable column labels.
+    """
+
+    def __init__(self, name: str, writer: str, extension: str, compression: str = None,
+                 output_dir: str = None):
+        from app.config import settings
+        if writer in ("parquet", "arrow") and pa is None:
+            raise RuntimeError(f"pyarrow is required for {name} exports")
+        self.name = name
+        self.writer = writer
+        self.extension = extension
+        self.compression = compression
+        self.output_dir = output_dir or settings.EXPORT_OUTPUT_DIR
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def export_match_report(self, match_data: Dict, player_data: Dict, task_id: str) -> str:
+        """Export match report as a zip of per-table files; returns the bundle path"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = os.path.join(self.output_dir, f"fbref_report_{task_id}_{timestamp}.{self.name}.zip")
+
+        tables = {}
+        # Table files are compressed already, so the bundle itself only stores them
+        with zipfile.ZipFile(filepath, "w", compression=zipfile.ZIP_STORED) as bundle:
+            for name, df in report_tables(match_data, player_data):
+                filename = f"{name}.{self.extension}"
+                with bundle.open(filename, "w") as member:
+                    self._write_table(df, member)
+                tables[filename] = {
+                    "rows": len(df),
+                    "columns": {str(column): str(dtype) for column, dtype in df.dtypes.items()},
+                    "labels": df.attrs.get("labels", {}),
+                }
+
+            metadata = {
+                "generated": datetime.now().isoformat(),
+                "task_id": task_id,
+                "match_info": match_data.get("match_info", {}),
+                "format": self.name,
+                "tables": tables,
+            }
+            bundle.writestr("metadata.json", json.dumps(metadata, indent=2, default=str),
+                            compress_type=zipfile.ZIP_DEFLATED)
+
+        return filepath
+
+    def _write_table(self, df: pd.DataFrame, stream):
+        if self.writer == "csv":
+            # CSV is read by people: FBref's labels (groups above them) as the header
+            headers = header_rows(df)
+            header = headers[0] if len(headers) == 1 else pd.MultiIndex.from_arrays(headers)
+            df.set_axis(header, axis=1).to_csv(stream, index=False,
+                                               compression={"method": "gzip", "mtime": 0})
+            return
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self.writer == "parquet":
+            pq.write_table(table, stream, compression=self.compression)
+        else:
+            # Arrow IPC needs a seekable sink for its footer
+            buffer = io.BytesIO()
+            feather.write_feather(table, buffer, compression=self.compression or "uncompressed")
+            stream.write(buffer.getvalue())
@@ -1,80 +1,183 @@
 import pandas as pd
 import os
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Iterable, Optional, Sequence, Set
 from urllib.parse import urljoin
 
+import xlsxwriter
+
+from .headers import header_rows
+
+# Excel caps sheet names at 31 characters
+MAX_SHEET_NAME = 31
+
 class ExcelExporter:
+    """Streams reports into xlsx workbooks.
+
+    Workbooks are opened in xlsxwriter's constant_memory mode: each row is
+    flushed to disk as soon as it is written, so memory stays flat no matter
+    how many matches or rows an export holds. Tables are written straight
+    from their DataFrame (or record list) without building per-sheet copies.
+    """
+
     def __init__(self, output_dir: str = None):
         from app.config import settings
         self.output_dir = output_dir or settings.EXPORT_OUTPUT_DIR
-        self.base_url = "https://fbref.com"
+        self.base_url = settings.SCRAPER_BASE_URL.rstrip("/")
         os.makedirs(self.output_dir, exist_ok=True)
-    
+
     def export_match_report(self, match_data: Dict, player_data: Dict, task_id: str) -> str:
-        """Export match report to Excel - FOCUSED ON FIXTURES ONLY (no player data)"""
+        """Export match report to Excel (player sheets only when player_data is given)"""
+        filepath = self._report_path(task_id)
+
+        workbook = self._open_workbook(filepath)
+        try:
+            used_names: Set[str] = set()
+            self._add_metadata_sheet(workbook, used_names, match_data, task_id, bool(player_data))
+            self._add_team_sheets(workbook, used_names, match_data)
+            if player_data:
+                self._add_player_sheets(workbook, used_names, match_data, player_data)
+        finally:
+            workbook.close()
+
+        return filepath
+
+    def export_matches(self, matches: Iterable[Dict], task_id: str,
+                       player_data: Optional[Dict[str, Dict]] = None) -> str:
+        """Export many matches into one workbook.
+
+        `matches` may be a generator so a season export never holds more than
+        one match in memory. A "Matches" index sheet lists every match and the
+        prefix of its sheets; `player_data` maps match_id to that match's
+        player tables.
+        """
+        filepath = self._report_path(task_id)
+
+        workbook = self._open_workbook(filepath)
+        try:
+            used_names: Set[str] = {'matches'}
+            index = workbook.add_worksheet('Matches')
+            header = ['Prefix', 'Match ID', 'Home Team', 'Away Team', 'Match URL']
+            index.write_row(0, 0, header, self._header_format)
+
+            count = 0
+            for count, match_data in enumerate(matches, 1):
+                prefix = f"M{count}"
+                match_info = match_data.get('match_info', {})
+                home_team, away_team = self._team_names(match_data)
+                index.write_row(count, 0, [
+                    prefix, match_info.get('match_id', 'Unknown'), home_team, away_team,
+                    self._absolute_url(match_info.get('url', ''))
+                ])
+                self._add_team_sheets(workbook, used_names, match_data, prefix=f"{prefix}_")
+                players = (player_data or {}).get(match_info.get('match_id'))
+                if players:
+                    self._add_player_sheets(workbook, used_names, match_data, players, prefix=f"{prefix}_")
+            index.write(count + 2, 0, f"Generated {datetime.now().isoformat()} for task {task_id}")
+        finally:
+            workbook.close()
+
+        return filepath
+
+    def _report_path(self, task_id: str) -> str:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"fbref_fixtures_report_{task_id}_{timestamp}.xlsx"
-        filepath = os.path.join(self.output_dir, filename)
-        
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            self._add_metadata_sheet(writer, match_data, task_id)
-            self._add_team_sheets(writer, match_data)
-            # Skip player sheets for now - focus on fixtures only
-            # self._add_player_sheets(writer, player_data)
-        
-        return filepath
-    
-    def _add_metadata_sheet(self, writer, match_data: Dict, task_id: str):
-        """Add metadata sheet with match information"""
-        # Get match info, handling nested structures
-        match_info = match_data.get('match_info', {})
-        match_url = match_info.get('url', '')
-        
+        return os.path.join(self.output_dir, filename)
+
+    def _open_workbook(self, filepath: str) -> xlsxwriter.Workbook:
+        workbook = xlsxwriter.Workbook(filepath, {'constant_memory': True, 'strings_to_urls': False})
+        self._header_format = workbook.add_format({'bold': True, 'border': 1})
+        return workbook
+
+    def _absolute_url(self, url: str) -> str:
         # Ensure proper URL formation
-        if match_url and not match_url.startswith(('http://', 'https://')):
-            match_url = urljoin(self.base_url, match_url.lstrip('/'))
-        
+        if url and not url.startswith(('http://', 'https://')):
+            return urljoin(self.base_url + '/', url.lstrip('/'))
+        return url
+
+    def _team_names(self, match_data: Dict):
         # Extract team names from the correct location in match_data
+        match_info = match_data.get('match_info', {})
         home_team = match_data.get('home_team', {}).get('name') or match_info.get('home_team', 'Unknown')
         away_team = match_data.get('away_team', {}).get('name') or match_info.get('away_team', 'Unknown')
-        
+        return home_team, away_team
+
+    def _add_metadata_sheet(self, workbook, used_names: Set[str], match_data: Dict,
+                            task_id: str, include_players: bool = False):
+        """Add metadata sheet with match information"""
+        match_info = match_data.get('match_info', {})
+        home_team, away_team = self._team_names(match_data)
+
         metadata = {
             'Generated': datetime.now().isoformat(),
             'Task ID': task_id,
-            'Match URL': match_url,
+            'Match URL': self._absolute_url(match_info.get('url', '')),
             'Match ID': match_info.get('match_id', 'Unknown'),
             'Home Team': home_team,
             'Away Team': away_team,
-            'Data Type': 'Fixtures Only (Player data disabled)',
+            'Data Type': 'Fixtures and Players' if include_players else 'Fixtures Only (Player data disabled)',
             'Sheets Included': 'Metadata, Home Team Tables, Away Team Tables'
+                               + (', Player Tables' if include_players else '')
         }
-        
-        df = pd.DataFrame(list(metadata.items()), columns=['Key', 'Value'])
-        df.to_excel(writer, sheet_name='Metadata', index=False)
-    
-    def _add_team_sheets(self, writer, match_data: Dict):
+
+        self._write_sheet(workbook, used_names, 'Metadata', [['Key', 'Value']], metadata.items())
+
+    def _add_team_sheets(self, workbook, used_names: Set[str], match_data: Dict, prefix: str = ""):
         """Add team data sheets - handle the actual scraper output structure"""
-        # Home team data (from scraper's actual structure)
-        home_team_data = match_data.get('home_team', {})
-        for sheet_name, data in home_team_data.items():
-            safe_name = self._sanitize_sheet_name(f"Home_{sheet_name}")
-            if data and len(data) > 0:
-                # Convert list of records to DataFrame
-                df = pd.DataFrame(data)
-                df.to_excel(writer, sheet_name=safe_name, index=False)
-        
-        # Away team data  
-        away_team_data = match_data.get('away_team', {})
-        for sheet_name, data in away_team_data.items():
-            safe_name = self._sanitize_sheet_name(f"Away_{sheet_name}")
-            if data and len(data) > 0:
-                df = pd.DataFrame(data)
-                df.to_excel(writer, sheet_name=safe_name, index=False)
-    
+        for side, label in (('home_team', 'Home'), ('away_team', 'Away')):
+            for sheet_name, data in match_data.get(side, {}).items():
+                self._write_table(workbook, used_names, f"{prefix}{label}_{sheet_name}", data)
+
+    def _add_player_sheets(self, workbook, used_names: Set[str], match_data: Dict,
+                           player_data: Dict, prefix: str = ""):
+        """Add one sheet per player table, named after the player"""
+        names = {p['id']: p.get('name', p['id']) for p in match_data.get('players', [])}
+        for player_id, tables in player_data.items():
+            for i, data in enumerate((tables or {}).values()):
+                self._write_table(workbook, used_names, f"{prefix}P{i}_{names.get(player_id, player_id)}", data)
+
+    def _write_table(self, workbook, used_names: Set[str], name: str, data):
+        """Stream one scraped table (typed DataFrame or list of records) into a sheet"""
+        if data is None or len(data) == 0 or isinstance(data, str):
+            return
+        if isinstance(data, pd.DataFrame):
+            # FBref's labels (and over-header groups), not the data-stat keys
+            headers = header_rows(data)
+            rows = data.itertuples(index=False, name=None)
+        else:
+            # Older callers pass records; keep first-seen key order
+            columns = list(dict.fromkeys(key for record in data for key in record))
+            headers = [columns]
+            rows = ([record.get(column) for column in columns] for record in data)
+        self._write_sheet(workbook, used_names, name, headers, rows)
+
+    def _write_sheet(self, workbook, used_names: Set[str], name: str,
+                     headers: Sequence[Sequence[str]], rows: Iterable[Sequence]):
+        worksheet = workbook.add_worksheet(self._unique_sheet_name(name, used_names))
+        for row_number, header in enumerate(headers):
+            worksheet.write_row(row_number, 0, header, self._header_format)
+        write = worksheet.write
+        for row_number, row in enumerate(rows, len(headers)):
+            for column_number, value in enumerate(row):
+                # Missing values (None, NaN, pd.NA) stay blank cells
+                if value is None or value is pd.NA or value != value:
+                    continue
+                write(row_number, column_number, value)
+
+    def _unique_sheet_name(self, name: str, used_names: Set[str]) -> str:
+        """Sanitised sheet name that does not collide (case-insensitively) with earlier sheets"""
+        base = self._sanitize_sheet_name(name) or 'Sheet'
+        candidate, n = base, 1
+        while candidate.lower() in used_names:
+            n += 1
+            suffix = f"~{n}"
+            candidate = base[:MAX_SHEET_NAME - len(suffix)] + suffix
+        used_names.add(candidate.lower())
+        return candidate
+
     def _sanitize_sheet_name(self, name: str) -> str:
         """Ensure sheet name is valid for Excel (max 31 chars, no invalid chars)"""
         # Remove invalid characters
         safe_name = "".join(c for c in name if c.isalnum() or c in ('_', ' ', '-'))
         # Truncate to 31 characters
-        return safe_name[:31]
\ No newline at end of file
+        return safe_name[:MAX_SHEET_NAME]
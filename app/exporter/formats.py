@@ -0,0 +1,81 @@
+from typing import Callable, Dict, Optional
+
+from .columnar_exporter import ColumnarExporter
+from .excel_exporter import ExcelExporter
+
+
+class UnsupportedFormat(ValueError):
+    """Raised for an export format that is not registered"""
+
+
+class ExportFormat:
+    """A named report format: how to build the exporter and how to serve the file"""
+
+    def __init__(self, name: str, suffix: str, media_type: str, factory: Callable[[], object]):
+        self.name = name
+        self.suffix = suffix
+        self.media_type = media_type
+        self.factory = factory
+
+    def exporter(self):
+        return self.factory()
+
+
+EXPORT_FORMATS: Dict[str, ExportFormat] = {}
+
+# Alternative names accepted in requests
+FORMAT_ALIASES = {
+    "excel": "xlsx",
+    "parquet-snappy": "parquet",
+    "feather": "arrow",
+    "ipc": "arrow",
+    "csv.gz": "csv",
+}
+
+
+def register_format(export_format: ExportFormat):
+    EXPORT_FORMATS[export_format.name] = export_format
+
+
+def get_format(name: Optional[str] = None) -> ExportFormat:
+    """Registered format for a name or alias (the configured default when empty)"""
+    if not name:
+        from app.config import settings
+        name = settings.EXPORT_DEFAULT_FORMAT
+    key = name.strip().lower()
+    key = FORMAT_ALIASES.get(key, key)
+    if key not in EXPORT_FORMATS:
+        supported = ", ".join(sorted(EXPORT_FORMATS))
+        raise UnsupportedFormat(f"Unsupported export format '{name}' (supported: {supported})")
+    return EXPORT_FORMATS[key]
+
+
+def format_for_path(path: str) -> Optional[ExportFormat]:
+    """Format of an already written report file, judged by its suffix"""
+    for export_format in EXPORT_FORMATS.values():
+        if path.endswith(export_format.suffix):
+            return export_format
+    return None
+
+
+register_format(ExportFormat(
+    "xlsx", ".xlsx",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ExcelExporter,
+))
+register_format(ExportFormat(
+    "parquet", ".parquet.zip", "application/zip",
+    lambda: ColumnarExporter("parquet", "parquet", "parquet", compression="snappy"),
+))
+register_format(ExportFormat(
+    "parquet-zstd", ".parquet-zstd.zip", "application/zip",
+    lambda: ColumnarExporter("parquet-zstd", "parquet", "parquet", compression="zstd"),
+))
+register_format(ExportFormat(
+    "arrow", ".arrow.zip", "application/zip",
+    lambda: ColumnarExporter("arrow", "arrow", "arrow", compression="lz4"),
+))
+register_format(ExportFormat(
+    "csv", ".csv.zip", "application/zip",
+    lambda: ColumnarExporter("csv", "csv", "csv.gz"),
+))
@@ -0,0 +1,20 @@
+from typing import List
+
+import pandas as pd
+
+
+def header_rows(df: pd.DataFrame) -> List[List[str]]:
+    """Display header rows of a parsed table: its over-header groups (when it
+    has any) above FBref's column labels.
+
+    Parsed tables are keyed by data-stat names; the labels travel in
+    ``df.attrs``. Columns without a label (added after parsing, or from
+    record lists) keep their key.
+    """
+    columns = [str(column) for column in df.columns]
+    labels = df.attrs.get("labels", {})
+    rows = [[labels.get(column, column) for column in columns]]
+    groups = df.attrs.get("groups")
+    if groups:
+        rows.insert(0, [groups.get(column, "") for column in columns])
+    return rows
@@ -3,6 +3,7 @@ from pydantic import BaseModel
 
 class Fixture(BaseModel):
     league: str
+    league_id: Optional[str] = None
     date: str
     time: str
     home_team: str
@@ -3,12 +3,18 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 from bs4 import BeautifulSoup
+import os
+import sys
 import time
 import pandas as pd
 
+if not __package__:
+    # Run as a script: make the app package importable for the shared driver resolution
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+from app.scraper.driver_binary import chromedriver_path
+
 def setup_driver():
     """Setup Chrome driver with anti-detection options"""
     chrome_options = Options()
@@ -25,7 +31,7 @@ def setup_driver():
     chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     
     # Initialize driver
-    service = Service(ChromeDriverManager().install())
+    service = Service(chromedriver_path())
     driver = webdriver.Chrome(service=service, options=chrome_options)
     
     # Additional anti-detection
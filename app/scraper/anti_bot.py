@@ -1,33 +1,60 @@
 import time
 import random
+from typing import Optional
+
 from app.config import settings
+from app.scraper.rate_limit import ERROR, OK, SLOW, THROTTLED
+
+CHALLENGE_MARKERS = (
+    "Just a moment...",
+    "cf-browser-verification",
+    "challenge-platform",
+    "Attention Required!",
+)
+
+CHALLENGE_STATUSES = {403, 429, 503}
+
+# Responses worth asking for again after a backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def classify_response(status: Optional[int], elapsed: float, head: str = "") -> str:
+    """Rate-limiter outcome of a response: throttled, error, slow or ok.
+
+    `head` is the start of the page (or just its title for browser loads),
+    searched for challenge markers.
+    """
+    if status in CHALLENGE_STATUSES or any(marker in head for marker in CHALLENGE_MARKERS):
+        return THROTTLED
+    if status is not None and status >= 500:
+        return ERROR
+    if elapsed > settings.SCRAPER_SLOW_RESPONSE_SECONDS:
+        return SLOW
+    return OK
+
 
 class AntiBotHandler:
+    """Retry policy for a single URL; attempts are counted by the caller, so
+    one handler can be shared by every thread and URL"""
+
     def __init__(self):
         self.delay_min = settings.SCRAPER_REQUEST_DELAY_MIN
         self.delay_max = settings.SCRAPER_REQUEST_DELAY_MAX
-        self.retry_count = 0
-    
-    def random_delay(self, min_delay=None, max_delay=None):
-        min_delay = min_delay or self.delay_min
-        max_delay = max_delay or self.delay_max
-        delay = random.uniform(min_delay, max_delay)
-        time.sleep(delay)
-    
-    def exponential_backoff(self, attempt):
-        base_delay = self.delay_min
-        backoff_delay = base_delay * (settings.SCRAPER_BACKOFF_FACTOR ** attempt)
-        max_delay = self.delay_max * 3
-        delay = min(backoff_delay, max_delay)
-        time.sleep(delay)
-    
-    def should_retry(self):
-        self.retry_count += 1
-        return self.retry_count <= settings.SCRAPER_MAX_RETRIES
-    
-    def reset_retry_count(self):
-        self.retry_count = 0
-    
+        self.max_retries = settings.SCRAPER_MAX_RETRIES
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Delay before retry number attempt + 1, with jitter so threads spread out"""
+        base_delay = self.delay_min * (settings.SCRAPER_BACKOFF_FACTOR ** attempt)
+        delay = min(base_delay, self.delay_max * 3)
+        return random.uniform(delay / 2, delay)
+
+    def exponential_backoff(self, attempt: int):
+        time.sleep(self.backoff_delay(attempt))
+
+    def should_retry(self, attempt: int) -> bool:
+        """Whether a URL whose attempt number `attempt` (0-based) failed gets another try"""
+        return attempt < self.max_retries
+
     def human_like_scroll(self, driver):
         scroll_actions = [
             lambda: driver.execute_script("window.scrollTo(0, document.body.scrollHeight/4);"),
@@ -36,4 +63,4 @@ class AntiBotHandler:
         ]
         for action in scroll_actions:
             action()
-            time.sleep(random.uniform(0.5, 1.5))
\ No newline at end of file
+            time.sleep(random.uniform(0.5, 1.5))
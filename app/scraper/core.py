@@ -1,68 +1,87 @@
-import time
-import random
 from typing import Dict, List, Optional
-from app.scraper.selenium_driver import get_driver
+from app.config import settings
+from app.scraper.fetchers import PageFetcher, get_fetcher
 from app.scraper.fixtures import FixtureScraper
 from app.scraper.match_data import MatchDataScraper
-from app.scraper.anti_bot import AntiBotHandler
-from app.config import settings
+from app.scraper.player_crawler import PlayerCrawler, ProgressCallback
+from app.scraper.single_flight import fixtures_flight, match_flight
+from app.services.warehouse import Warehouse, get_warehouse, has_team_tables
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class FBrefScraper:
-    def __init__(self):
-        self.driver = None
-        self.anti_bot = AntiBotHandler()
-        self.fixture_scraper = FixtureScraper()
-        self.match_scraper = MatchDataScraper()
-    
-    def get_fixtures_by_date(self, date: str, league: Optional[str] = None) -> List[Dict]:
-        """Get fixtures for a specific date"""
-        self._setup_driver()
-        
-        try:
-            fixtures = self.fixture_scraper.scrape_fixtures(self.driver, date, league)
-            return fixtures
-        finally:
-            self._teardown_driver()
-    
-    def scrape_match_data(self, match_url: str) -> Dict:
-        """Scrape comprehensive match data"""
-        self._setup_driver()
-        
-        try:
-            self.anti_bot.random_delay()
-            match_data = self.match_scraper.scrape_match(self.driver, match_url)
-            return match_data
-        finally:
-            self._teardown_driver()
-    
-    def scrape_player_data(self, match_data: Dict) -> Dict:
-        """Scrape player data for a match"""
-        self._setup_driver()
-        
-        try:
-            player_data = {}
-            players = match_data.get('players', [])
-            
-            for i, player in enumerate(players):
-                self.anti_bot.random_delay()
-                player_info = self.match_scraper.scrape_player(self.driver, player['url'])
-                player_data[player['id']] = player_info
-                
-                # Update progress
-                progress = 60 + (i / len(players)) * 30
-                # Would update task progress here
-            
-            return player_data
-        finally:
-            self._teardown_driver()
-    
-    def _setup_driver(self):
-        """Setup Selenium driver"""
-        if not self.driver:
-            self.driver = get_driver()
-    
-    def _teardown_driver(self):
-        """Close Selenium driver"""
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
\ No newline at end of file
+    def __init__(self, fetcher: PageFetcher = None, warehouse: Warehouse = None):
+        self.fetcher = fetcher or get_fetcher()
+        self.warehouse = warehouse or (get_warehouse() if settings.WAREHOUSE_ENABLED else None)
+        self.fixture_scraper = FixtureScraper(self.fetcher)
+        self.match_scraper = MatchDataScraper(self.fetcher)
+        self.player_crawler = PlayerCrawler(self.match_scraper)
+
+    def get_fixtures_by_date(self, date: str, league: Optional[str] = None,
+                             refresh: bool = False) -> List[Dict]:
+        """Get fixtures for a specific date, from the warehouse while fresh
+        (concurrent identical scrapes are shared)"""
+        if self.warehouse and not refresh:
+            stored = self.warehouse.fresh_fixtures(date, league)
+            if stored is not None:
+                return stored
+        fixtures = fixtures_flight.do((date, league), self._scrape_fixtures, date, league)
+        return list(fixtures)
+
+    def _scrape_fixtures(self, date: str, league: Optional[str]) -> List[Dict]:
+        fixtures = self.fixture_scraper.scrape_fixtures(date, league)
+        # An empty list may also mean the scrape failed, so only real results are recorded
+        if self.warehouse and fixtures:
+            self.warehouse.upsert_fixtures(date, league, fixtures)
+        return fixtures
+
+    def refresh_fixtures(self, date: str, league: Optional[str] = None) -> List[Dict]:
+        """Re-scrape a date's fixtures into the warehouse; returns only the rows
+        that are new or whose score, time or match report link changed"""
+        if not self.warehouse:
+            raise RuntimeError("Incremental fixture refresh needs the warehouse")
+        return fixtures_flight.do(("refresh", date, league), self._refresh_fixtures, date, league)
+
+    def _refresh_fixtures(self, date: str, league: Optional[str]) -> List[Dict]:
+        fixtures = self.fixture_scraper.scrape_fixtures(date, league)
+        if not fixtures:
+            return []
+        return self.warehouse.upsert_fixtures(date, league, fixtures)
+
+    def get_season_fixtures(self, league: str, season: str) -> List[Dict]:
+        """Every fixture of a league season from one schedule page, stored per date"""
+        fixtures = self.fixture_scraper.scrape_season(league, season)
+        if self.warehouse and fixtures:
+            by_date: Dict[str, List[Dict]] = {}
+            for fixture in fixtures:
+                by_date.setdefault(fixture['date'], []).append(fixture)
+            for date, day_fixtures in by_date.items():
+                self.warehouse.upsert_fixtures(date, league, day_fixtures)
+        return fixtures
+
+    def scrape_match_data(self, match_url: str, refresh: bool = False) -> Dict:
+        """Scrape comprehensive match data, from the warehouse while fresh
+        (concurrent callers share one scrape)"""
+        if self.warehouse and not refresh:
+            stored = self.warehouse.fresh_match(match_url)
+            if stored is not None:
+                return stored
+        return match_flight.do(match_url, self._scrape_match, match_url)
+
+    def _scrape_match(self, match_url: str) -> Dict:
+        match_data = self.match_scraper.scrape_match(match_url)
+        if match_data and not has_team_tables(match_data):
+            # Most likely an error or challenge page; never report or store it as the match
+            logger.warning("No team tables in the match page %s", match_url)
+            return {}
+        if self.warehouse and match_data:
+            self.warehouse.upsert_match(match_data)
+        return match_data
+
+    def scrape_player_data(self, match_data: Dict,
+                           progress_callback: Optional[ProgressCallback] = None) -> Dict:
+        """Scrape player data for a match, reporting progress after each player"""
+        players = match_data.get('players', [])
+        return self.player_crawler.crawl(players, progress_callback)
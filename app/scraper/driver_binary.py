@@ -0,0 +1,106 @@
+"""Resolve the ChromeDriver binary once and pin it.
+
+    python -m app.scraper.driver_binary [--install-to /usr/local/bin/chromedriver]
+
+Resolution order: the configured selenium.chromedriver_path, the path saved
+by an earlier resolution, a chromedriver on PATH, and only then a
+webdriver-manager download (unless selenium.chromedriver_download is off).
+Whatever is found is saved to selenium.chromedriver_cache and reused by
+every later driver and process, so normal startup does no network work.
+Run the command above at image build time to do the download up front.
+"""
+import argparse
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Dict, Optional
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_resolved: Optional[str] = None
+_lock = threading.Lock()
+
+
+def _is_executable(path: Optional[str]) -> bool:
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _load_cached() -> Optional[Dict]:
+    try:
+        with open(settings.SELENIUM_CHROMEDRIVER_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cached(path: str, source: str):
+    cache_path = settings.SELENIUM_CHROMEDRIVER_CACHE
+    try:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump({"path": path, "source": source, "resolved_at": time.time()}, f)
+    except OSError as e:
+        logger.warning("Could not save ChromeDriver path to %s: %s", cache_path, e)
+
+
+def _resolve() -> str:
+    pinned = settings.SELENIUM_CHROMEDRIVER_PATH
+    if pinned:
+        if not _is_executable(pinned):
+            raise FileNotFoundError(f"Configured ChromeDriver {pinned} does not exist or is not executable")
+        return pinned
+
+    cached = _load_cached()
+    if cached and _is_executable(cached.get("path")):
+        return cached["path"]
+
+    on_path = shutil.which("chromedriver")
+    if on_path:
+        _save_cached(on_path, "path")
+        return on_path
+
+    if not settings.SELENIUM_CHROMEDRIVER_DOWNLOAD:
+        raise FileNotFoundError(
+            "No ChromeDriver found and downloads are disabled; set selenium.chromedriver_path "
+            "or run python -m app.scraper.driver_binary where network access is available"
+        )
+    from webdriver_manager.chrome import ChromeDriverManager
+    logger.info("Resolving ChromeDriver with webdriver-manager (one-time network lookup)")
+    downloaded = ChromeDriverManager().install()
+    _save_cached(downloaded, "webdriver-manager")
+    return downloaded
+
+
+def chromedriver_path() -> str:
+    """Path of the ChromeDriver binary, resolved once per process"""
+    global _resolved
+    if _resolved is None:
+        with _lock:
+            if _resolved is None:
+                _resolved = _resolve()
+                logger.info("Using ChromeDriver at %s", _resolved)
+    return _resolved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resolve and pin the ChromeDriver binary")
+    parser.add_argument("--install-to", help="copy the binary here (e.g. a directory on PATH) and pin that copy")
+    args = parser.parse_args(argv)
+
+    path = chromedriver_path()
+    if args.install_to:
+        os.makedirs(os.path.dirname(os.path.abspath(args.install_to)), exist_ok=True)
+        shutil.copy2(path, args.install_to)
+        os.chmod(args.install_to, 0o755)
+        path = args.install_to
+        _save_cached(path, "installed")
+    print(path)
+
+
+if __name__ == "__main__":
+    main()
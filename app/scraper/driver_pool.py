@@ -0,0 +1,224 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from app.config import settings
+from app.scraper.selenium_driver import get_driver
+from app.utils.logger import get_logger
+from app.utils.metrics import span
+
+logger = get_logger(__name__)
+
+
+class DriverPoolTimeout(Exception):
+    """Raised when no driver becomes available within the acquire timeout"""
+
+
+class _PooledDriver:
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.pages = 0
+        self.created_at = time.time()
+        self.last_used_at = self.created_at
+
+
+class DriverPool:
+    """Bounded, thread-safe pool of warm Chrome drivers.
+
+    Drivers are created lazily up to ``max_size``, health-checked before they
+    are handed out and recycled after ``max_pages`` page loads or whenever a
+    caller reports them as broken.
+    """
+
+    def __init__(self, max_size: int = None, warm_size: int = None,
+                 max_pages: int = None, acquire_timeout: float = None):
+        self.max_size = max_size or settings.SELENIUM_POOL_SIZE
+        self.warm_size = min(
+            warm_size if warm_size is not None else settings.SELENIUM_POOL_WARM_SIZE,
+            self.max_size
+        )
+        self.max_pages = max_pages or settings.SELENIUM_POOL_MAX_PAGES
+        self.acquire_timeout = acquire_timeout or settings.SELENIUM_POOL_ACQUIRE_TIMEOUT
+
+        self._lock = threading.Condition()
+        self._idle: List[_PooledDriver] = []
+        self._leased: Dict[int, _PooledDriver] = {}
+        self._creating = 0
+        self._closed = False
+
+        # Metrics
+        self._acquires = 0
+        self._waits = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._created = 0
+        self._recycled = 0
+        self._health_failures = 0
+        self._timeouts = 0
+
+    def start(self):
+        """Warm up the pool (called from the application lifespan)"""
+        with self._lock:
+            self._closed = False
+        for _ in range(self.warm_size):
+            try:
+                entry = self._create()
+            except Exception as e:
+                logger.error("Driver pool warm-up failed: %s", e)
+                break
+            with self._lock:
+                self._idle.append(entry)
+                self._lock.notify()
+
+    def shutdown(self):
+        """Quit every idle driver and refuse further acquires"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._lock.notify_all()
+        for entry in idle:
+            self._quit(entry)
+
+    def acquire(self, timeout: float = None) -> WebDriver:
+        """Take a healthy driver from the pool, creating one if there is room"""
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        waited = False
+
+        while True:
+            entry = None
+            create = False
+            with self._lock:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Driver pool is shut down")
+                    if self._idle:
+                        entry = self._idle.pop()
+                        break
+                    if self._size() < self.max_size:
+                        self._creating += 1
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise DriverPoolTimeout(
+                            f"No driver available after {timeout:.1f}s "
+                            f"({len(self._leased)}/{self.max_size} leased)"
+                        )
+                    waited = True
+                    self._lock.wait(remaining)
+
+            if create:
+                try:
+                    entry = self._create()
+                finally:
+                    with self._lock:
+                        self._creating -= 1
+            elif not self._is_healthy(entry):
+                with self._lock:
+                    self._health_failures += 1
+                self._recycle(entry)
+                continue
+
+            with self._lock:
+                self._leased[id(entry.driver)] = entry
+                self._record_wait(time.monotonic() - started, waited)
+            return entry.driver
+
+    def release(self, driver: WebDriver, pages: int = 1, broken: bool = False):
+        """Return a driver to the pool, recycling it if worn out or broken"""
+        with self._lock:
+            entry = self._leased.pop(id(driver), None)
+        if entry is None:
+            return
+
+        entry.pages += pages
+        entry.last_used_at = time.time()
+
+        if broken or self._closed or entry.pages >= self.max_pages:
+            self._recycle(entry)
+            return
+
+        with self._lock:
+            self._idle.append(entry)
+            self._lock.notify()
+
+    @contextmanager
+    def lease(self, timeout: float = None, pages: int = 1):
+        """Context manager around acquire/release that recycles crashed drivers"""
+        driver = self.acquire(timeout)
+        broken = False
+        try:
+            yield driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, pages=pages, broken=broken)
+
+    def stats(self) -> Dict:
+        """Occupancy and wait-time metrics"""
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "size": self._size(),
+                "idle": len(self._idle),
+                "leased": len(self._leased),
+                "creating": self._creating,
+                "acquires": self._acquires,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "avg_wait_seconds": round(self._total_wait / self._acquires, 4) if self._acquires else 0.0,
+                "max_wait_seconds": round(self._max_wait, 4),
+                "drivers_created": self._created,
+                "drivers_recycled": self._recycled,
+                "health_check_failures": self._health_failures,
+            }
+
+    def _size(self) -> int:
+        return len(self._idle) + len(self._leased) + self._creating
+
+    def _create(self) -> _PooledDriver:
+        with span("driver_startup"):
+            driver = get_driver()
+        with self._lock:
+            self._created += 1
+        return _PooledDriver(driver)
+
+    def _recycle(self, entry: _PooledDriver):
+        with self._lock:
+            self._recycled += 1
+            self._lock.notify()
+        self._quit(entry)
+
+    def _record_wait(self, wait: float, waited: bool):
+        self._acquires += 1
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+        if waited:
+            self._waits += 1
+
+    @staticmethod
+    def _is_healthy(entry: _PooledDriver) -> bool:
+        try:
+            entry.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(entry: _PooledDriver):
+        try:
+            entry.driver.quit()
+        except Exception as e:
+            logger.warning("Error quitting pooled driver: %s", e)
+
+
+# Process-wide pool shared by every FBrefScraper instance
+driver_pool = DriverPool()
@@ -0,0 +1,303 @@
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.config import settings
+from app.scraper.anti_bot import (
+    CHALLENGE_MARKERS, CHALLENGE_STATUSES, RETRY_STATUSES, AntiBotHandler, classify_response
+)
+from app.scraper.driver_pool import driver_pool
+from app.scraper.page_cache import PageCache, get_page_cache
+from app.scraper.rate_limit import ERROR, parse_retry_after, rate_limiter
+from app.scraper.readiness import needs_scroll, wait_until_ready
+from app.scraper.selenium_driver import get_random_user_agent, safe_get
+from app.utils.logger import get_logger
+from app.utils.metrics import span
+
+logger = get_logger(__name__)
+
+# Markers a complete, server-rendered page of each type contains
+COMPLETENESS_MARKERS = {
+    "fixtures": 'id="content"',
+    "schedule": "<table",
+    "match": "<table",
+    "player": "<table",
+}
+
+
+
+class FetchError(Exception):
+    """Raised when a page could not be fetched"""
+
+
+class HttpStatusError(FetchError):
+    """Raised for an HTTP error status (4xx, or 5xx once retries are used up)"""
+
+    def __init__(self, url: str, status: int):
+        super().__init__(f"HTTP {status} for {url}")
+        self.url = url
+        self.status = status
+
+
+class FetchResult:
+    def __init__(self, url: str, html: str, engine: str, status: Optional[int] = None,
+                 headers: Optional[Dict[str, str]] = None, elapsed: float = 0.0):
+        self.url = url
+        self.html = html
+        self.engine = engine
+        self.status = status
+        self.headers = headers or {}
+        self.elapsed = elapsed
+
+
+def looks_challenged(result: FetchResult) -> bool:
+    """Detect anti-bot challenge pages and throttling responses"""
+    if result.status in CHALLENGE_STATUSES:
+        return True
+    head = result.html[:5000]
+    return any(marker in head for marker in CHALLENGE_MARKERS)
+
+
+def looks_incomplete(result: FetchResult, page_type: str) -> bool:
+    """Detect truncated pages or pages missing the content their type needs"""
+    if result.status is not None and result.status >= 400:
+        return True
+    marker = COMPLETENESS_MARKERS.get(page_type)
+    if marker and marker not in result.html:
+        return True
+    return "</html>" not in result.html[-2000:].lower()
+
+
+class PageFetcher:
+    """Interface for the engines that turn a URL into page HTML"""
+    engine = "base"
+
+    def fetch(self, url: str, page_type: str = "page",
+              headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        """Fetch a page; engines that speak HTTP honour extra request headers"""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class HttpFetcher(PageFetcher):
+    """Plain HTTP engine for FBref's server-rendered pages.
+
+    A single keep-alive session with a pooled adapter is shared by all
+    threads; gzip/brotli bodies are decoded transparently by urllib3. Every
+    response is fed back to the adaptive rate limiter, and 429/5xx answers
+    and connection errors are retried with backoff. Error statuses left
+    after that raise HttpStatusError, so an error page is never parsed as
+    data; challenge pages served with a 200 are returned as they are and
+    left to the fallback engine.
+    """
+    engine = "http"
+
+    def __init__(self, pool_size: int = None, timeout: float = None):
+        pool_size = pool_size or settings.SCRAPER_HTTP_POOL_SIZE
+        self.timeout = timeout or settings.SCRAPER_TIMEOUT
+        self.anti_bot = AntiBotHandler()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "User-Agent": get_random_user_agent(),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": "gzip, deflate, br",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Connection": "keep-alive",
+        })
+
+    def fetch(self, url: str, page_type: str = "page",
+              headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        attempt = 0
+        while True:
+            with span("rate_limit_wait"):
+                rate_limiter.acquire(url)
+            started = time.monotonic()
+            try:
+                with span("page_load", engine=self.engine, page_type=page_type) as load:
+                    response = self.session.get(url, headers=headers, timeout=self.timeout)
+                    load.set(bytes=len(response.content), status=response.status_code)
+            except requests.RequestException as e:
+                rate_limiter.record(url, ERROR)
+                if not self.anti_bot.should_retry(attempt):
+                    raise FetchError(f"HTTP fetch failed for {url}: {e}") from e
+                logger.info("HTTP fetch of %s failed (%s), retrying", url, e)
+                self.anti_bot.exponential_backoff(attempt)
+                attempt += 1
+                continue
+
+            elapsed = time.monotonic() - started
+            # Decoding runs charset detection over the whole body; do it once
+            html = response.text
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            rate_limiter.record(url, classify_response(response.status_code, elapsed, html[:5000]),
+                                retry_after)
+            if response.status_code in RETRY_STATUSES and self.anti_bot.should_retry(attempt):
+                logger.info("HTTP %d for %s, retry %d/%d", response.status_code, url,
+                            attempt + 1, self.anti_bot.max_retries)
+                # A Retry-After already paused the host's bucket for every thread
+                if retry_after is None:
+                    self.anti_bot.exponential_backoff(attempt)
+                attempt += 1
+                continue
+            if response.status_code >= 400:
+                raise HttpStatusError(url, response.status_code)
+
+            return FetchResult(
+                url=url,
+                html=html,
+                engine=self.engine,
+                status=response.status_code,
+                headers=dict(response.headers),
+                elapsed=elapsed
+            )
+
+    def close(self):
+        self.session.close()
+
+
+class SeleniumFetcher(PageFetcher):
+    """Headless Chrome engine backed by the shared driver pool"""
+    engine = "selenium"
+
+    def __init__(self, pool=None):
+        self.pool = pool or driver_pool
+        self.anti_bot = AntiBotHandler()
+
+    def fetch(self, url: str, page_type: str = "page",
+              headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        started = time.monotonic()
+        with self.pool.lease() as driver:
+            if not safe_get(driver, url, anti_bot=self.anti_bot, page_type=page_type):
+                raise FetchError(f"Failed to load {url}")
+
+            with span("page_ready", page_type=page_type) as wait:
+                wait.set(state=wait_until_ready(driver, page_type, settings.SELENIUM_READY_TIMEOUT))
+            if needs_scroll(driver, page_type):
+                with span("human_like_scroll", page_type=page_type):
+                    self.anti_bot.human_like_scroll(driver)
+
+            with span("page_source", engine=self.engine, page_type=page_type) as source:
+                html = driver.page_source
+                source.set(bytes=len(html))
+
+        return FetchResult(url=url, html=html, engine=self.engine,
+                           elapsed=time.monotonic() - started)
+
+
+class FallbackFetcher(PageFetcher):
+    """Try the HTTP engine first and fall back to Selenium when the response
+    looks challenged or incomplete, or the request failed to connect.
+
+    Other error statuses (404, 410, a 500 that outlasted its retries) are
+    raised: Chrome would only load the same error page, without a status.
+    """
+    engine = "auto"
+
+    def __init__(self, primary: PageFetcher = None, fallback: PageFetcher = None):
+        self.primary = primary or HttpFetcher()
+        self.fallback = fallback or SeleniumFetcher()
+
+    def fetch(self, url: str, page_type: str = "page",
+              headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        try:
+            result = self.primary.fetch(url, page_type, headers)
+            if result.status == 304:
+                return result
+            if not looks_challenged(result) and not looks_incomplete(result, page_type):
+                return result
+            logger.info("HTTP fetch of %s looks challenged or incomplete (status %s), "
+                        "falling back to Selenium", url, result.status)
+        except HttpStatusError as e:
+            if e.status not in CHALLENGE_STATUSES:
+                raise
+            logger.info("%s, falling back to Selenium", e)
+        except FetchError as e:
+            logger.info("%s, falling back to Selenium", e)
+        return self.fallback.fetch(url, page_type)
+
+    def close(self):
+        self.primary.close()
+        self.fallback.close()
+
+
+class CachingFetcher(PageFetcher):
+    """Serve pages from the on-disk cache, revalidating stale entries with
+    If-None-Match/If-Modified-Since before fetching them again"""
+    engine = "cache"
+
+    def __init__(self, inner: PageFetcher, cache: PageCache = None):
+        self.inner = inner
+        self.cache = cache or get_page_cache()
+
+    def fetch(self, url: str, page_type: str = "page",
+              headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        entry = self.cache.get(url)
+        cached_html = self.cache.read(entry) if entry else None
+
+        if cached_html is not None and entry.is_fresh():
+            self.cache.count("hits")
+            return FetchResult(url=url, html=cached_html, engine=self.engine, status=200)
+
+        request_headers = dict(headers or {})
+        if cached_html is not None:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+
+        self.cache.count("misses")
+        result = self.inner.fetch(url, page_type, request_headers or None)
+
+        if result.status == 304 and cached_html is not None:
+            self.cache.refresh(url, page_type, cached_html)
+            return FetchResult(url=url, html=cached_html, engine=self.engine, status=200,
+                               elapsed=result.elapsed)
+
+        if not looks_challenged(result) and not looks_incomplete(result, page_type):
+            self.cache.put(url, result.html, page_type, result.headers)
+        return result
+
+    def close(self):
+        self.inner.close()
+
+
+_FETCHER_FACTORIES = {
+    "http": HttpFetcher,
+    "selenium": SeleniumFetcher,
+    "auto": FallbackFetcher,
+}
+
+_fetchers: Dict[str, PageFetcher] = {}
+_fetchers_lock = threading.Lock()
+
+
+def get_fetcher(engine: str = None) -> PageFetcher:
+    """Return the process-wide fetcher for the configured engine"""
+    engine = (engine or settings.SCRAPER_FETCH_ENGINE).lower()
+    if engine not in _FETCHER_FACTORIES:
+        raise ValueError(
+            f"Unknown fetch engine '{engine}', expected one of {sorted(_FETCHER_FACTORIES)}"
+        )
+    with _fetchers_lock:
+        if engine not in _fetchers:
+            fetcher = _FETCHER_FACTORIES[engine]()
+            if settings.CACHE_ENABLED:
+                fetcher = CachingFetcher(fetcher)
+            _fetchers[engine] = fetcher
+        return _fetchers[engine]
+
+
+def close_fetchers():
+    """Close every fetcher created by get_fetcher (called on shutdown)"""
+    with _fetchers_lock:
+        for fetcher in _fetchers.values():
+            fetcher.close()
+        _fetchers.clear()
@@ -1,204 +1,242 @@
+import logging
 import re
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from selenium.webdriver.remote.webdriver import WebDriver
-from app.scraper.selenium_driver import safe_get, wait_for_element
+from lxml import etree
+from app.config import settings
+from app.scraper.fetchers import PageFetcher, FetchError, get_fetcher
+from app.scraper.parser import find_links, parse_document, text_of
+from app.utils.logger import get_logger
+from app.utils.metrics import span
+
+logger = get_logger(__name__)
+
+# Competition registry: FBref competition ID -> name. Containers for
+# competitions not listed here are still parsed, named after their heading.
+LEAGUES: Dict[str, str] = {
+    "9": "Premier League", "12": "La Liga", "11": "Serie A",
+    "20": "Bundesliga", "13": "Ligue 1",
+    "8": "Champions League", "19": "Europa League", "882": "Conference League",
+    "10": "Championship", "17": "Segunda División", "18": "Serie B",
+    "33": "2. Bundesliga", "60": "Ligue 2", "23": "Eredivisie",
+    "32": "Primeira Liga", "37": "Belgian Pro League", "40": "Scottish Premiership",
+    "26": "Süper Lig", "22": "Major League Soccer", "31": "Liga MX",
+    "24": "Campeonato Brasileiro Série A", "21": "Liga Profesional Argentina",
+    "1": "World Cup", "676": "European Championship", "685": "Copa América",
+}
+
+LEAGUE_IDS_BY_NAME = {name.lower(): lid for lid, name in LEAGUES.items()}
+
+SEASON_RE = re.compile(r'^\d{4}-\d{4}$')
+
+# all_sched_<season>_<competition>_<n>; the season is "2024-2025", "2025" or absent
+CONTAINER_ID_RE = re.compile(r'^all_sched_(?:\d{4}(?:-\d{4})?_)?(\d+)(?:_\d+)?$')
+COMP_HREF_RE = re.compile(r'/comps/(\d+)/')
+HEADER_SEASON_RE = re.compile(r'^\d{4}(?:-\d{4})?\s+')
+
+SCHEDULE_CONTAINERS = etree.XPath("//div[starts-with(@id, 'all_sched_')]")
+STATS_TABLE = etree.XPath(".//table[contains(concat(' ', normalize-space(@class), ' '), ' stats_table ')]")
+SCHEDULE_TABLE = etree.XPath("//table[starts-with(@id, 'sched_')]")
 
 class FixtureScraper:
-    def __init__(self):
-        self.base_url = "https://fbref.com"
+    def __init__(self, fetcher: PageFetcher = None, base_url: str = None):
+        self.base_url = (base_url or settings.SCRAPER_BASE_URL).rstrip("/")
+        self.fetcher = fetcher or get_fetcher()
     
     
-    def scrape_fixtures(self, driver: WebDriver, date: str, league: Optional[str] = None) -> List[Dict]:
+    def scrape_fixtures(self, date: str, league: Optional[str] = None) -> List[Dict]:
         """Scrape fixtures for a specific date, handling empty results gracefully"""
         url = f"{self.base_url}/en/matches/{date}"
         
         try:
-            print(f"DEBUG: Attempting to load URL: {url}")
-            if not safe_get(driver, url):
-                raise Exception(f"Failed to load fixtures page for {date}")
-            
-            print("DEBUG: Initial page source length:", len(driver.page_source))
-            wait_for_element(driver, "css selector", "div.section_wrapper, table.stats_table", timeout=10)
-            print("DEBUG: Page loaded, creating BeautifulSoup")
-            
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            print("DEBUG: Page structure:")
-            print("- Title:", soup.title.string if soup.title else "No title")
-            print("- Number of tables:", len(soup.find_all('table')))
-            print("- Number of sections:", len(soup.find_all('div', class_='section_wrapper')))
-            
-            if soup.find('div', class_='error') or soup.find('div', class_='status-code'):
-                print("DEBUG: Possible error page detected")
-            
-            fixtures = []
-            leagues_found = set()
-            big5_leagues = {
-                "9": "Premier League", "12": "La Liga", "11": "Serie A",
-                "20": "Bundesliga", "13": "Ligue 1"
-            }
-            
-            # Get all schedule tables and their containers
-            containers = soup.find_all('div', id=lambda x: x and x.startswith('all_sched_'))
-            print(f"DEBUG: Found {len(containers)} schedule containers")
-            
-            for container in containers:
-                container_id = container.get('id', '')
-                print(f"DEBUG: Processing container {container_id}")
-                
-                # Extract league ID from container
-                league_id = None
-                for lid in big5_leagues.keys():
-                    if f"_{lid}" in container_id.split("sched_")[-1]:
-                        league_id = lid
-                        print(f"DEBUG: Found league {lid} from container {container_id}")
-                        break
-                
-                if not league_id:
-                    # Try to find league from header
-                    header = container.find('h2')
-                    if header:
-                        header_text = header.get_text(strip=True)
-                        print(f"DEBUG: Found header: {header_text}")
-                        for lid, name in big5_leagues.items():
-                            if name.lower() in header_text.lower():
-                                league_id = lid
-                                break
-                
-                if not league_id:
-                    print(f"DEBUG: No league ID found for container {container_id}")
-                    continue
-                
-                league_name = big5_leagues[league_id]
-                leagues_found.add(league_name)
-                
-                # Apply league filter if specified
-                if league and league != league_id:
-                    continue
-                
-                # Find the table within the container
-                table = container.find('table', class_='stats_table')
-                if not table:
-                    print(f"DEBUG: No table found in container for {league_name}")
-                    continue
-                
-                # Parse fixtures from this table
-                table_fixtures = self._parse_league_section(table, league_name, date)
-                if table_fixtures:
-                    fixtures.extend(table_fixtures)
-                    print(f"DEBUG: Found {len(table_fixtures)} fixtures for {league_name}")
-                else:
-                    print(f"DEBUG: No fixtures found in table for {league_name}")
-            
-            # Provide helpful debug information
-            if not fixtures:
-                if league:
-                    league_name = big5_leagues.get(league, f"League {league}")
-                    print(f"INFO: No fixtures found for {league_name} on {date}")
-                else:
-                    if leagues_found:
-                        print(f"INFO: Big-5 leagues found but no fixtures: {leagues_found}")
-                    else:
-                        print(f"INFO: No Big-5 league sections found for {date}")
-            
-            return fixtures
+            logger.debug("Loading fixtures page %s", url)
+            try:
+                page = self.fetcher.fetch(url, page_type="fixtures")
+            except FetchError as e:
+                raise Exception(f"Failed to load fixtures page for {date}") from e
             
+            logger.debug("Fixtures page loaded via %s (%d chars)", page.engine, len(page.html))
+            return self.parse_fixtures(page.html, date, league)
+
         except Exception as e:
-            print(f"Error scraping fixtures for {date}: {e}")
+            logger.error("Error scraping fixtures for %s: %s", date, e)
             return []
-        
-  
+
+    def parse_fixtures(self, html_content: str, date: str, league: Optional[str] = None) -> List[Dict]:
+        """Fixtures of every competition on a matchday page (or just `league`)"""
+        with span("parse", page_type="fixtures", bytes=len(html_content)):
+            root = parse_document(html_content)
+
+        # Walking the whole tree only pays off when someone reads the output
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Page structure: title %r, %d tables, %d sections",
+                         root.findtext('.//title'),
+                         sum(1 for _ in root.iter('table')),
+                         len(root.find_class('section_wrapper')))
+            if root.find_class('error') or root.find_class('status-code'):
+                logger.debug("Possible error page detected")
+
+        fixtures = []
+        leagues_found = set()
+
+        containers = SCHEDULE_CONTAINERS(root)
+        logger.debug("Found %d schedule containers", len(containers))
+
+        for container in containers:
+            league_id = self._extract_league_id(container)
+            if not league_id:
+                logger.debug("No league ID found for container %s", container.get('id'))
+                continue
+
+            league_name = self._league_name(container, league_id)
+            leagues_found.add(league_name)
+
+            # Apply league filter if specified
+            if league and league != league_id:
+                continue
+
+            tables = STATS_TABLE(container)
+            if not tables:
+                logger.debug("No table found in container for %s", league_name)
+                continue
+            table = tables[0]
+
+            with span("table_extraction", page_type="fixtures", tables=1) as section:
+                table_fixtures = self._parse_league_section(table, league_name, date)
+                section.set(rows=len(table_fixtures))
+            for fixture in table_fixtures:
+                fixture['league_id'] = league_id
+            if table_fixtures:
+                fixtures.extend(table_fixtures)
+                logger.debug("Found %d fixtures for %s", len(table_fixtures), league_name)
+            else:
+                logger.debug("No fixtures found in table for %s", league_name)
+
+        if not fixtures:
+            if league:
+                logger.info("No fixtures found for %s on %s", LEAGUES.get(league, f"League {league}"), date)
+            elif leagues_found:
+                logger.info("Competitions found but no fixtures: %s", leagues_found)
+            else:
+                logger.info("No competition sections found for %s", date)
+
+        return fixtures
+
+    def scrape_season(self, league_id: str, season: str) -> List[Dict]:
+        """Scrape every fixture of a league season from its schedule page"""
+        if not SEASON_RE.match(season):
+            raise ValueError(f"Season must look like 2024-2025, got {season!r}")
+        league_name = LEAGUES.get(league_id, f"League {league_id}")
+        url = f"{self.base_url}/en/comps/{league_id}/{season}/schedule/"
+
+        try:
+            page = self.fetcher.fetch(url, page_type="schedule")
+        except FetchError as e:
+            raise Exception(f"Failed to load {season} schedule for league {league_id}") from e
+
+        tables = SCHEDULE_TABLE(parse_document(page.html))
+        tbody = tables[0].find('tbody') if tables else None
+        if tbody is None:
+            logger.info("No schedule table found for league %s %s", league_id, season)
+            return []
+
+        fixtures = []
+        for row in tbody.iter('tr'):
+            # A schedule row carries its own date; rows without one are spacers
+            fixture = self._parse_fixture_row(row, league_name, None)
+            if fixture:
+                fixture['league_id'] = league_id
+                fixtures.append(fixture)
+        return fixtures
+
     def _extract_league_id(self, section) -> Optional[str]:
-        """Extract league ID from section HTML"""
-        section_html = str(section)
-        patterns = [r'comps_(\d+)', r'sched_(\d+)']
-        for pattern in patterns:
-            match = re.search(pattern, section_html)
-            if match:
-                return match.group(1)
-        return None
+        """League ID from a schedule container's id, else its heading's competition link or name"""
+        match = CONTAINER_ID_RE.match(section.get('id') or '')
+        if match:
+            return match.group(1)
+        header = section.find('.//h2')
+        if header is None:
+            return None
+        for link in find_links(header, COMP_HREF_RE):
+            return COMP_HREF_RE.search(link.get('href')).group(1)
+        return LEAGUE_IDS_BY_NAME.get(HEADER_SEASON_RE.sub('', text_of(header)).lower())
+
+    def _league_name(self, section, league_id: str) -> str:
+        """Registry name of a competition, else the section heading without its season"""
+        if league_id in LEAGUES:
+            return LEAGUES[league_id]
+        header = section.find('.//h2')
+        name = HEADER_SEASON_RE.sub('', text_of(header)) if header is not None else ''
+        return name or f"League {league_id}"
 
     def _parse_league_section(self, section, league_name: str, date: str) -> List[Dict]:
         """Parse a league section for fixtures"""
         fixtures = []
         
         # If section is already a table, use it directly
-        if section.name == 'table':
+        if section.tag == 'table':
             table = section
         else:
-            table = section.find('table', class_='stats_table')
+            tables = STATS_TABLE(section)
+            table = tables[0] if tables else None
         
-        if not table:
-            print(f"DEBUG: No table found for {league_name}")
+        if table is None:
+            logger.debug("No table found for %s", league_name)
             return fixtures
         
         tbody = table.find('tbody')
-        if not tbody:
-            print(f"DEBUG: No tbody found for {league_name}")
+        if tbody is None:
+            logger.debug("No tbody found for %s", league_name)
             return fixtures
         
-        print(f"DEBUG: Processing {len(tbody.find_all('tr'))} rows for {league_name}")
+        rows = list(tbody.iter('tr'))
+        logger.debug("Processing %d rows for %s", len(rows), league_name)
         
-        for row in tbody.find_all('tr'):
+        for row in rows:
             fixture = self._parse_fixture_row(row, league_name, date)
             if fixture:
                 fixtures.append(fixture)
-                print(f"DEBUG: Added fixture: {fixture['home_team']} vs {fixture['away_team']}")
         
         return fixtures 
 
 
-    def _parse_fixture_row(self, row, league_name: str, date: str) -> Optional[Dict]:
-        """Parse a single fixture row using data-stat attributes - FIXED VERSION"""
+    def _parse_fixture_row(self, row, league_name: str, date: Optional[str]) -> Optional[Dict]:
+        """Parse a single fixture row from its data-stat cells; with no `date`
+        the row's own date cell is used (season schedules)"""
         try:
-            # Use data-stat attributes for reliable parsing
-            time_cell = row.find('td', {'data-stat': 'start_time'})
-            home_cell = row.find('td', {'data-stat': 'home_team'})
-            away_cell = row.find('td', {'data-stat': 'away_team'})
-            score_cell = row.find('td', {'data-stat': 'score'})
-            match_report_cell = row.find('td', {'data-stat': 'match_report'})
-            
-            # Extract text content
-            match_time = time_cell.get_text(strip=True) if time_cell else ''
-            
-            # Extract team names from anchor tags
-            home_team = ''
-            home_url = None
-            if home_cell:
-                home_link = home_cell.find('a')
-                if home_link:
-                    home_team = home_link.get_text(strip=True)
-                    home_url = home_link.get('href')
-                else:
-                    home_team = home_cell.get_text(strip=True)
-            
-            away_team = ''
-            away_url = None
-            if away_cell:
-                away_link = away_cell.find('a')
-                if away_link:
-                    away_team = away_link.get_text(strip=True)
-                    away_url = away_link.get('href')
-                else:
-                    away_team = away_cell.get_text(strip=True)
-            
-            score = score_cell.get_text(strip=True) if score_cell else ''
-            
+            # One pass over the row's cells instead of a search per field
+            cells = {}
+            for cell in row.iterchildren('td'):
+                stat = cell.get('data-stat')
+                if stat and stat not in cells:
+                    cells[stat] = cell
+
+            if date is None:
+                date_cell = cells.get('date')
+                date = text_of(date_cell) if date_cell is not None else ''
+                if not date:
+                    return None
+
+            time_cell = cells.get('start_time')
+            match_time = text_of(time_cell) if time_cell is not None else ''
+            home_team, home_url = self._team_cell(cells.get('home_team'))
+            away_team, away_url = self._team_cell(cells.get('away_team'))
+
             # Skip rows that are clearly not fixtures
             if not home_team or not away_team or home_team == 'Home' or away_team == 'Away':
                 return None
-            
-            # Extract match report URL
+
+            score_cell = cells.get('score')
+            score = text_of(score_cell) if score_cell is not None else ''
+
+            # Accept both match report and head-to-head links
             match_url = None
-            if match_report_cell:
-                report_link = match_report_cell.find('a')
-                if report_link and report_link.get('href'):
-                    href = report_link['href']
-                    # Accept both match report and head-to-head links
-                    if href and ('/matches/' in href or '/stathead/matchup' in href):
-                        match_url = href
-            
+            report_cell = cells.get('match_report')
+            report_link = report_cell.find('.//a') if report_cell is not None else None
+            if report_link is not None:
+                href = report_link.get('href')
+                if href and ('/matches/' in href or '/stathead/matchup' in href):
+                    match_url = href
+
             return {
                 'league': league_name,
                 'date': date,
@@ -211,8 +249,17 @@ class FixtureScraper:
                 'match_url': match_url,
                 'match_id': match_url.split('/')[-2] if match_url else f"{home_team}_{away_team}_{date}".replace(' ', '_')
             }
-            
+
         except Exception as e:
-            print(f"Error parsing fixture row: {e}")
+            logger.warning("Error parsing fixture row: %s", e)
             return None
-        
\ No newline at end of file
+
+    @staticmethod
+    def _team_cell(cell):
+        """(name, squad URL) of a home/away cell, preferring its link"""
+        if cell is None:
+            return '', None
+        link = cell.find('.//a')
+        if link is not None:
+            return text_of(link), link.get('href')
+        return text_of(cell), None
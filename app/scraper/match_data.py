@@ -1,144 +1,145 @@
 import re
 import pandas as pd
 from typing import Dict, List
-from bs4 import BeautifulSoup, Comment
-from selenium.webdriver.remote.webdriver import WebDriver
-from app.scraper.selenium_driver import safe_get, wait_for_element
-from app.scraper.anti_bot import AntiBotHandler
+from lxml.html import HtmlElement
+from app.config import settings
+from app.scraper.fetchers import PageFetcher, FetchError, get_fetcher
+from app.scraper.parser import parse_document, extract_tables, find_links, text_of
+from app.utils.logger import get_logger
+from app.utils.metrics import span
+
+SQUAD_LINK_RE = re.compile(r'/en/squads/')
+SQUAD_ID_RE = re.compile(r'/en/squads/([0-9a-f]{8})(/|$)')
+PLAYER_LINK_RE = re.compile(r'/en/players/')
+
+logger = get_logger(__name__)
 
 class MatchDataScraper:
-    def __init__(self):
-        self.anti_bot = AntiBotHandler()
-        self.base_url = "https://fbref.com"
-    
-    def scrape_match(self, driver: WebDriver, match_url: str) -> Dict:
+    def __init__(self, fetcher: PageFetcher = None, base_url: str = None):
+        self.base_url = (base_url or settings.SCRAPER_BASE_URL).rstrip("/")
+        self.fetcher = fetcher or get_fetcher()
+
+    def scrape_match(self, match_url: str) -> Dict:
         full_url = f"{self.base_url}{match_url}"
-        
+
         try:
-            if not safe_get(driver, full_url):
-                raise Exception("Failed to load match page")
-            
-            wait_for_element(driver, "tag name", "table")
-            self.anti_bot.human_like_scroll(driver)
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            return {
-                'match_info': self._extract_match_info(soup, match_url),
-                'home_team': self._extract_team_data(soup, 'home'),
-                'away_team': self._extract_team_data(soup, 'away'),
-                'players': self._extract_player_ids(soup)
-            }
+            try:
+                page = self.fetcher.fetch(full_url, page_type="match")
+            except FetchError as e:
+                raise Exception("Failed to load match page") from e
+
+            return self.parse_match(page.html, match_url)
         except Exception as e:
-            print(f"Error scraping match data: {e}")
+            logger.error("Error scraping match data for %s: %s", match_url, e)
             return {}
-    
-    def _extract_match_info(self, soup: BeautifulSoup, match_url: str) -> Dict:
+
+    def parse_match(self, html_content: str, match_url: str) -> Dict:
+        """Extract everything from a match report page with a single parse"""
+        with span("parse", page_type="match", bytes=len(html_content)):
+            root = parse_document(html_content)
+        with span("table_extraction", page_type="match") as extraction:
+            home_team = self._extract_team_data(root, 'home')
+            away_team = self._extract_team_data(root, 'away')
+            extraction.set(tables=len(home_team) + len(away_team))
+        return {
+            'match_info': self._extract_match_info(root, match_url),
+            'home_team': home_team,
+            'away_team': away_team,
+            'players': self._extract_player_ids(root)
+        }
+
+    def _extract_match_info(self, root: HtmlElement, match_url: str) -> Dict:
         match_info = {'url': match_url, 'match_id': match_url.split('/')[-2]}
-        team_elements = soup.find_all('a', href=re.compile(r'/en/squads/'))
         teams = []
-        for element in team_elements:
-            team_name = element.get_text(strip=True)
+        for element in find_links(root, SQUAD_LINK_RE):
+            team_name = text_of(element)
             if team_name and team_name not in teams:
                 teams.append(team_name)
                 match_info[f'team_{len(teams)}'] = team_name
                 match_info[f'team_{len(teams)}_url'] = element.get('href')
         return match_info
-    
-    def _extract_team_data(self, soup: BeautifulSoup, team_side: str) -> Dict:
+
+    def _squad_ids(self, root: HtmlElement) -> List[str]:
+        """Squad ids of the home and away team, from the scorebox when there is one"""
+        scorebox = root.find_class('scorebox')
+        squad_ids = []
+        for link in find_links(scorebox[0] if scorebox else root, SQUAD_ID_RE):
+            squad_id = SQUAD_ID_RE.search(link.get('href')).group(1)
+            if squad_id not in squad_ids:
+                squad_ids.append(squad_id)
+        return squad_ids[:2]
+
+    def _extract_team_data(self, root: HtmlElement, team_side: str) -> Dict[str, pd.DataFrame]:
+        """Typed DataFrames for every table belonging to one side, keyed by sheet name.
+
+        FBref keys a team's tables by its squad id (stats_<squad_id>_summary,
+        keeper_stats_<squad_id>, shots_<squad_id>); the scorebox lists the
+        home team first.
+        """
         team_data = {}
-        team_tables = soup.find_all('table', id=re.compile(f'.*_{team_side}.*'))
-        
+        squad_ids = self._squad_ids(root)
+        index = 0 if team_side == 'home' else 1
+        if index >= len(squad_ids):
+            return team_data
+        table_id_re = re.compile(f'(^|_){squad_ids[index]}(_|$)')
+        team_tables = [
+            table for table in root.iter('table')
+            if table_id_re.search(table.get('id', ''))
+        ]
+
         for i, table in enumerate(team_tables):
             table_id = table.get('id', f'unknown_{i}')
-            tables_data = self._extract_tables_from_html(str(table))
-            
+            tables_data = extract_tables(table)
+
             for j, table_df in enumerate(tables_data):
                 if not table_df.empty:
                     sheet_name = f"{team_side}_{table_id}_{j}"
-                    team_data[sheet_name] = table_df.to_dict('records')
-        
+                    team_data[sheet_name] = table_df
+
         return team_data
-    
-    def _extract_player_ids(self, soup: BeautifulSoup) -> List[Dict]:
+
+    def _extract_player_ids(self, root: HtmlElement) -> List[Dict]:
         players = []
-        player_links = soup.find_all('a', href=re.compile(r'/en/players/'))
-        
-        for link in player_links:
+        seen_ids = set()
+
+        for link in find_links(root, PLAYER_LINK_RE):
             href = link.get('href')
-            if href and 'matchlogs' not in href:
+            if 'matchlogs' not in href:
                 player_id = href.split('/')[-2]
-                player_name = link.get_text(strip=True)
-                if (player_id and player_name and 
-                    player_id not in [p['id'] for p in players] and
+                player_name = text_of(link)
+                if (player_id and player_name and
+                    player_id not in seen_ids and
                     len(player_name) > 1):
+                    seen_ids.add(player_id)
                     players.append({'id': player_id, 'name': player_name, 'url': href})
-        
+
         return players[:22]
-    
-    def scrape_player_data(self, driver: WebDriver, player_url: str) -> Dict:
+
+    def scrape_player_data(self, player_url: str) -> Dict:
         full_url = f"{self.base_url}{player_url}"
-        
+
         try:
-            if not safe_get(driver, full_url):
-                raise Exception("Failed to load player page")
-            
-            wait_for_element(driver, "tag name", "table")
-            self.anti_bot.random_delay()
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            player_data = {}
-            tables_data = self._extract_tables_from_html(driver.page_source)
-            
-            for i, table_df in enumerate(tables_data):
-                if not table_df.empty:
-                    player_data[f"player_table_{i}"] = table_df.to_dict('records')
-            
-            return player_data
+            try:
+                page = self.fetcher.fetch(full_url, page_type="player")
+            except FetchError as e:
+                raise Exception("Failed to load player page") from e
+
+            return self.parse_player(page.html)
         except Exception as e:
-            print(f"Error scraping player data: {e}")
+            logger.error("Error scraping player data for %s: %s", player_url, e)
             return {}
-    
+
+    def parse_player(self, html_content: str) -> Dict[str, pd.DataFrame]:
+        """Extract every table (including commented-out ones) from a player page"""
+        player_data = {}
+        with span("parse", page_type="player", bytes=len(html_content)):
+            root = parse_document(html_content)
+        with span("table_extraction", page_type="player") as extraction:
+            for i, table_df in enumerate(extract_tables(root)):
+                if not table_df.empty:
+                    player_data[f"player_table_{i}"] = table_df
+            extraction.set(tables=len(player_data))
+        return player_data
+
     def _extract_tables_from_html(self, html_content: str) -> List[pd.DataFrame]:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        tables_data = []
-        
-        for table in soup.find_all('table'):
-            df = self._parse_html_table(table)
-            if df is not None and not df.empty:
-                tables_data.append(df)
-        
-        comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-        for comment in comments:
-            comment_soup = BeautifulSoup(comment, 'html.parser')
-            for table in comment_soup.find_all('table'):
-                df = self._parse_html_table(table)
-                if df is not None and not df.empty:
-                    tables_data.append(df)
-        
-        return tables_data
-    
-    def _parse_html_table(self, table) -> pd.DataFrame:
-        try:
-            headers = []
-            header_row = table.find('thead')
-            if header_row:
-                for th in header_row.find_all('th'):
-                    header_text = th.get_text(strip=True)
-                    if header_text:
-                        headers.append(header_text)
-            
-            rows = []
-            for tr in table.find_all('tr'):
-                cells = tr.find_all(['td', 'th'])
-                if cells:
-                    rows.append([cell.get_text(strip=True) for cell in cells])
-            
-            if headers and rows:
-                max_cols = max(len(row) for row in rows)
-                if len(headers) < max_cols:
-                    headers.extend([f'Unnamed_{i}' for i in range(len(headers), max_cols)])
-                return pd.DataFrame(rows, columns=headers[:max_cols])
-        except Exception as e:
-            print(f"Error parsing table: {e}")
-        
-        return pd.DataFrame()
\ No newline at end of file
+        return extract_tables(parse_document(html_content))
@@ -0,0 +1,293 @@
+import gzip
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import date as date_cls
+from typing import Dict, List, Optional
+
+from app.config import settings
+
+FIXTURES_DATE_RE = re.compile(r"/en/matches/(\d{4}-\d{2}-\d{2})")
+MATCH_REPORT_RE = re.compile(r"/en/matches/[0-9a-f]{8}/")
+VENUE_DATE_RE = re.compile(r'data-venue-date="(\d{4}-\d{2}-\d{2})"')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    page_type TEXT,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL,
+    last_access REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access);
+CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries (digest);
+"""
+
+
+class CacheEntry:
+    def __init__(self, row: sqlite3.Row):
+        self.url = row["url"]
+        self.digest = row["digest"]
+        self.page_type = row["page_type"]
+        self.size = row["size"]
+        self.stored_at = row["stored_at"]
+        self.expires_at = row["expires_at"]
+        self.last_access = row["last_access"]
+        self.etag = row["etag"]
+        self.last_modified = row["last_modified"]
+
+    @property
+    def immutable(self) -> bool:
+        return self.expires_at is None
+
+    def is_fresh(self, now: float = None) -> bool:
+        return self.immutable or self.expires_at > (now or time.time())
+
+    def to_dict(self) -> Dict:
+        return {
+            "url": self.url,
+            "digest": self.digest,
+            "page_type": self.page_type,
+            "size": self.size,
+            "stored_at": self.stored_at,
+            "expires_at": self.expires_at,
+            "last_access": self.last_access,
+            "immutable": self.immutable,
+            "fresh": self.is_fresh(),
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+        }
+
+
+def ttl_for(url: str, page_type: str, html: str = "", today: date_cls = None) -> Optional[float]:
+    """Seconds a page stays fresh, or None when it can never change.
+
+    Fixtures pages for past dates and match reports of matches played before
+    today are immutable; today's fixtures are short-lived and future dates get
+    a medium TTL.
+    """
+    today_iso = (today or date_cls.today()).isoformat()
+
+    fixtures_date = FIXTURES_DATE_RE.search(url)
+    if page_type == "fixtures" or fixtures_date:
+        if not fixtures_date:
+            return settings.CACHE_TTL_TODAY
+        day = fixtures_date.group(1)
+        if day < today_iso:
+            return None
+        if day == today_iso:
+            return settings.CACHE_TTL_TODAY
+        return settings.CACHE_TTL_FUTURE
+
+    if page_type == "match" or MATCH_REPORT_RE.search(url):
+        venue_date = VENUE_DATE_RE.search(html)
+        if venue_date and venue_date.group(1) < today_iso:
+            return None
+        return settings.CACHE_TTL_TODAY
+
+    return settings.CACHE_TTL_DEFAULT
+
+
+class PageCache:
+    """Content-addressed on-disk HTML cache with an LRU size cap.
+
+    Bodies are stored gzip-compressed under the SHA-256 of their content, so
+    identical pages share one blob; a SQLite index maps URLs to blobs and
+    tracks expiry, validators (ETag/Last-Modified) and last access time.
+    """
+
+    def __init__(self, cache_dir: str = None, max_size_mb: int = None):
+        self.cache_dir = cache_dir or settings.CACHE_DIR
+        self.max_bytes = (max_size_mb or settings.CACHE_MAX_SIZE_MB) * 1024 * 1024
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(self.cache_dir, "index.db"), check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+        # Bumped from many fetch threads; += on an attribute is not atomic
+        self._counts = Counter()
+        self._counts_lock = threading.Lock()
+
+    def count(self, event: str):
+        """Record a "hits", "misses" or "revalidations" event for stats()"""
+        with self._counts_lock:
+            self._counts[event] += 1
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Index entry for a URL, fresh or not"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM entries WHERE url = ?", (url,)).fetchone()
+        return CacheEntry(row) if row else None
+
+    def read(self, entry: CacheEntry) -> Optional[str]:
+        """Decompressed body of an entry, marking it as recently used"""
+        try:
+            with gzip.open(self._blob_path(entry.digest), "rt", encoding="utf-8") as f:
+                html = f.read()
+        except (OSError, EOFError):
+            self.delete(entry.url)
+            return None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE url = ?", (time.time(), entry.url)
+            )
+        return html
+
+    def put(self, url: str, html: str, page_type: str = None, headers: Dict[str, str] = None):
+        """Store a page body and its validators"""
+        headers = headers or {}
+        body = html.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            # Worker processes share CACHE_DIR and thread idents repeat across processes
+            tmp_path = f"{blob_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+                f.write(body)
+            os.replace(tmp_path, blob_path)
+
+        now = time.time()
+        ttl = ttl_for(url, page_type, html)
+        with self._lock, self._conn:
+            previous = self._conn.execute(
+                "SELECT digest FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+            self._conn.execute(
+                """INSERT OR REPLACE INTO entries
+                   (url, digest, page_type, size, stored_at, expires_at, last_access, etag, last_modified)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (url, digest, page_type, os.path.getsize(blob_path), now,
+                 None if ttl is None else now + ttl, now,
+                 _header(headers, "ETag"), _header(headers, "Last-Modified"))
+            )
+            if previous and previous["digest"] != digest:
+                self._drop_blob_if_unreferenced(previous["digest"])
+        self._evict()
+
+    def refresh(self, url: str, page_type: str = None, html: str = ""):
+        """Extend an entry's lifetime after a successful revalidation (304)"""
+        now = time.time()
+        ttl = ttl_for(url, page_type, html)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE entries SET expires_at = ?, last_access = ? WHERE url = ?",
+                (None if ttl is None else now + ttl, now, url)
+            )
+        self.count("revalidations")
+
+    def delete(self, url: str) -> bool:
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT digest FROM entries WHERE url = ?", (url,)).fetchone()
+            if not row:
+                return False
+            self._conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+            self._drop_blob_if_unreferenced(row["digest"])
+        return True
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Delete every entry whose URL starts with prefix"""
+        with self._lock:
+            urls = [row["url"] for row in self._conn.execute(
+                "SELECT url FROM entries WHERE substr(url, 1, ?) = ?", (len(prefix), prefix)
+            )]
+        return sum(1 for url in urls if self.delete(url))
+
+    def clear(self) -> int:
+        return self.invalidate_prefix("")
+
+    def entries(self, prefix: str = "", limit: int = 100) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT * FROM entries WHERE substr(url, 1, ?) = ?
+                   ORDER BY last_access DESC LIMIT ?""",
+                (len(prefix), prefix, limit)
+            ).fetchall()
+        return [CacheEntry(row).to_dict() for row in rows]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) AS entries, COUNT(DISTINCT digest) AS blobs FROM entries"
+            ).fetchone()
+            size = self._total_size()
+        with self._counts_lock:
+            counts = dict(self._counts)
+        return {
+            "entries": row["entries"],
+            "blobs": row["blobs"],
+            "size_bytes": size,
+            "max_size_bytes": self.max_bytes,
+            "hits": counts.get("hits", 0),
+            "misses": counts.get("misses", 0),
+            "revalidations": counts.get("revalidations", 0),
+        }
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits its cap"""
+        with self._lock, self._conn:
+            total = self._total_size()
+            if total <= self.max_bytes:
+                return
+            for row in self._conn.execute(
+                "SELECT url, digest FROM entries ORDER BY last_access ASC"
+            ).fetchall():
+                if total <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM entries WHERE url = ?", (row["url"],))
+                total -= self._drop_blob_if_unreferenced(row["digest"])
+
+    def _total_size(self) -> int:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) AS size FROM "
+            "(SELECT digest, MAX(size) AS size FROM entries GROUP BY digest)"
+        ).fetchone()
+        return row["size"]
+
+    def _drop_blob_if_unreferenced(self, digest: str) -> int:
+        """Remove a blob nobody points to any more; returns the bytes freed"""
+        if self._conn.execute("SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+            return 0
+        path = self._blob_path(digest)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            return size
+        except OSError:
+            return 0
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.html.gz")
+
+
+def _header(headers: Dict[str, str], name: str) -> Optional[str]:
+    for key, value in headers.items():
+        if key.lower() == name.lower():
+            return value
+    return None
+
+
+_page_cache: Optional[PageCache] = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> PageCache:
+    """Process-wide page cache"""
+    global _page_cache
+    with _page_cache_lock:
+        if _page_cache is None:
+            _page_cache = PageCache()
+        return _page_cache
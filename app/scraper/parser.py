@@ -0,0 +1,185 @@
+from typing import Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.html import HtmlElement
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def parse_document(html_content: str) -> HtmlElement:
+    """Parse a page once into an lxml tree shared by every extractor"""
+    return lxml_html.document_fromstring(html_content)
+
+
+def text_of(element: HtmlElement) -> str:
+    """Equivalent of BeautifulSoup's ``get_text(strip=True)``"""
+    return "".join(part.strip() for part in element.itertext())
+
+
+def iter_comment_fragments(root: HtmlElement) -> Iterator[HtmlElement]:
+    """Yield the parsed contents of HTML comments that embed markup.
+
+    FBref ships many stats tables commented out; each such comment is parsed
+    exactly once, and comments without a table are skipped without parsing.
+    """
+    for comment in root.iter(etree.Comment):
+        text = comment.text
+        if not text or "<table" not in text:
+            continue
+        try:
+            yield lxml_html.fragment_fromstring(text, create_parent="div")
+        except etree.ParserError:
+            continue
+
+
+def iter_tables(root: HtmlElement, include_comments: bool = True) -> Iterator[HtmlElement]:
+    """Tables in document order, followed by tables hidden in comments"""
+    yield from root.iter("table")
+    if include_comments:
+        for fragment in iter_comment_fragments(root):
+            yield from fragment.iter("table")
+
+
+# Body rows FBref uses to repeat headers or separate groups
+SKIP_ROW_CLASSES = ("thead", "over_header", "spacer")
+
+
+def _column_keys(header_cells: List[HtmlElement]) -> List[str]:
+    """Unique column keys from data-stat attributes, falling back to labels"""
+    keys = []
+    seen = {}
+    for i, th in enumerate(header_cells):
+        key = th.get("data-stat") or text_of(th) or f"Unnamed_{i}"
+        if key in seen:
+            seen[key] += 1
+            key = f"{key}_{seen[key]}"
+        else:
+            seen[key] = 1
+        keys.append(key)
+    return keys
+
+
+def _over_headers(over_row: HtmlElement) -> List[str]:
+    """Expand an over_header row's colspans to one group label per column"""
+    groups = []
+    for th in over_row.iter("th", "td"):
+        try:
+            span = int(th.get("colspan", 1))
+        except ValueError:
+            span = 1
+        groups.extend([text_of(th)] * span)
+    return groups
+
+
+def _skip_row(tr: HtmlElement) -> bool:
+    row_class = tr.get("class", "")
+    return any(name in row_class for name in SKIP_ROW_CLASSES)
+
+
+def convert_numeric(values: List[Optional[str]]):
+    """Convert a column of cell strings in one vectorised step.
+
+    Returns an int64/Int64/float64 array when every non-empty cell is numeric
+    (thousands separators allowed), otherwise the values unchanged.
+    """
+    cleaned = []
+    missing = 0
+    for value in values:
+        if value:
+            cleaned.append(value.replace(",", "") if "," in value else value)
+        else:
+            cleaned.append("nan")
+            missing += 1
+    if missing == len(values):
+        return values
+
+    try:
+        numbers = np.array(cleaned, dtype=np.float64)
+    except ValueError:
+        return values
+
+    present = numbers[~np.isnan(numbers)] if missing else numbers
+    if not np.all(np.mod(present, 1) == 0):
+        return numbers
+    if missing:
+        return pd.array(numbers, dtype="Int64")
+    return numbers.astype(np.int64)
+
+
+def parse_table(table: HtmlElement) -> pd.DataFrame:
+    """Convert a table element to a typed, columnar DataFrame.
+
+    Columns are keyed by the header cells' ``data-stat`` attribute and cells
+    are matched to columns by their own ``data-stat``, so FBref's two-level
+    headers and ragged rows line up. Display labels and over-header groups
+    are kept in ``df.attrs``; numeric columns become Int64/float64.
+    """
+    try:
+        header_rows = table.xpath("./thead/tr")
+        if not header_rows:
+            return pd.DataFrame()
+        header_cells = list(header_rows[-1].iter("th", "td"))
+        if not header_cells:
+            return pd.DataFrame()
+
+        keys = _column_keys(header_cells)
+        stat_to_key = {
+            th.get("data-stat"): key for th, key in zip(header_cells, keys) if th.get("data-stat")
+        }
+        groups = _over_headers(header_rows[0]) if len(header_rows) > 1 else []
+
+        columns = {key: [] for key in keys}
+        n_rows = 0
+        for tr in table.xpath("./tbody/tr | ./tfoot/tr | ./tr"):
+            if _skip_row(tr):
+                continue
+            cells = list(tr.iter("td", "th"))
+            if not cells:
+                continue
+            for i, cell in enumerate(cells):
+                key = stat_to_key.get(cell.get("data-stat"))
+                if key is None and i < len(keys) and not stat_to_key:
+                    key = keys[i]
+                if key is not None and len(columns[key]) == n_rows:
+                    columns[key].append(text_of(cell))
+            n_rows += 1
+            for values in columns.values():
+                if len(values) < n_rows:
+                    values.append(None)
+
+        if not n_rows:
+            return pd.DataFrame()
+
+        df = pd.DataFrame({key: convert_numeric(values) for key, values in columns.items()})
+        df.attrs["table_id"] = table.get("id")
+        df.attrs["labels"] = {key: text_of(th) for th, key in zip(header_cells, keys)}
+        if groups:
+            df.attrs["groups"] = {key: group for key, group in zip(keys, groups) if group}
+        return df
+    except Exception as e:
+        logger.warning("Error parsing table: %s", e)
+
+    return pd.DataFrame()
+
+
+def extract_tables(root: HtmlElement, include_comments: bool = True) -> List[pd.DataFrame]:
+    """Non-empty DataFrames for every table under root (and in its comments)"""
+    tables_data = []
+    for table in iter_tables(root, include_comments):
+        df = parse_table(table)
+        if df is not None and not df.empty:
+            tables_data.append(df)
+    return tables_data
+
+
+def find_links(root: HtmlElement, href_pattern) -> Iterator[HtmlElement]:
+    """Anchors whose href matches a compiled regex, in document order"""
+    for link in root.iter("a"):
+        href = link.get("href")
+        if href and href_pattern.search(href):
+            yield link
@@ -0,0 +1,54 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+from app.config import settings
+from app.scraper.match_data import MatchDataScraper
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Called as progress_callback(completed, total, player) after each player page
+ProgressCallback = Callable[[int, int, Dict], None]
+
+
+class PlayerCrawler:
+    """Crawl player pages with bounded concurrency.
+
+    Politeness comes from the shared per-host rate limiter inside the
+    fetchers, so adding workers overlaps page loads and parsing without
+    raising the request rate against FBref.
+    """
+
+    def __init__(self, match_scraper: MatchDataScraper, max_workers: int = None):
+        self.match_scraper = match_scraper
+        self.max_workers = max_workers or settings.SCRAPER_PLAYER_CONCURRENCY
+
+    def crawl(self, players: List[Dict],
+              progress_callback: Optional[ProgressCallback] = None) -> Dict[str, Dict]:
+        """Scrape every player page; returns player id -> tables"""
+        player_data = {}
+        if not players:
+            return player_data
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="player-crawl") as executor:
+            # Each page runs in a copy of the caller's context so its spans
+            # land in the report's collect_spans() breakdown
+            futures = {
+                executor.submit(contextvars.copy_context().run,
+                                self.match_scraper.scrape_player_data, player['url']): player
+                for player in players
+            }
+            for completed, future in enumerate(as_completed(futures), start=1):
+                player = futures[future]
+                try:
+                    player_data[player['id']] = future.result()
+                except Exception as e:
+                    logger.error("Error crawling player %s: %s", player.get('name'), e)
+                    player_data[player['id']] = {}
+                if progress_callback:
+                    progress_callback(completed, len(players), player)
+
+        # Keep the match's player order regardless of completion order
+        return {player['id']: player_data[player['id']] for player in players}
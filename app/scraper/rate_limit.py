@@ -0,0 +1,178 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Outcomes fetchers report back after each request
+OK = "ok"
+SLOW = "slow"
+THROTTLED = "throttled"
+ERROR = "error"
+
+# Longest Retry-After honoured; anything longer is treated as this
+MAX_PAUSE_SECONDS = 300
+
+# Responses to requests already in flight carry no news about a cut just
+# made, so a host's rate is decreased at most once per this many seconds
+DECREASE_COOLDOWN_SECONDS = 10
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, up to ``capacity``"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        # No tokens accrue while the host asked us to back off
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until tokens are available; returns the time spent waiting.
+
+        Waiters reserve their token up front (the balance may go negative),
+        so concurrent callers are served in arrival order at the bucket rate.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = max(self._paused_until - now, 0.0)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def set_rate(self, rate: float):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def pause(self, seconds: float):
+        """Hold every caller for at least `seconds` and drop the saved-up burst"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+
+class HostRateLimiter:
+    """One adaptive token bucket per host, shared by every thread in the process.
+
+    Rates follow AIMD: each healthy response adds `increase` requests/minute
+    up to `max_rate`, while a throttled (429/403/503, challenge page) or slow
+    response multiplies the rate by `decrease`, down to `min_rate`. A
+    Retry-After on a throttled response also pauses the host's bucket, so
+    every thread backs off together. The limiter thus settles just under
+    the rate the host tolerates instead of sleeping a worst-case delay.
+    """
+
+    def __init__(self, requests_per_minute: float = None, burst: int = None,
+                 min_rate: float = None, max_rate: float = None,
+                 increase: float = None, decrease: float = None):
+        self.initial_rate = requests_per_minute or settings.SCRAPER_RATE_PER_MINUTE
+        self.burst = burst or settings.SCRAPER_RATE_BURST
+        self.min_rate = min_rate or settings.SCRAPER_RATE_MIN_PER_MINUTE
+        self.max_rate = max(max_rate or settings.SCRAPER_RATE_MAX_PER_MINUTE, self.initial_rate)
+        self.increase = increase if increase is not None else settings.SCRAPER_RATE_INCREASE
+        self.decrease = decrease or settings.SCRAPER_RATE_DECREASE
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._outcomes: Dict[str, Dict[str, int]] = {}
+        self._last_decrease: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.total_wait = 0.0
+        self.requests = 0
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.initial_rate / 60.0, self.burst)
+                self._outcomes[host] = {OK: 0, SLOW: 0, THROTTLED: 0, ERROR: 0}
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> float:
+        """Wait for the request budget of the URL's host"""
+        waited = self.bucket(urlsplit(url).netloc).acquire()
+        with self._lock:
+            self.requests += 1
+            self.total_wait += waited
+        return waited
+
+    def record(self, url: str, outcome: str, retry_after: Optional[float] = None):
+        """Feed a response outcome back into the host's rate"""
+        host = urlsplit(url).netloc
+        bucket = self.bucket(host)
+        with self._lock:
+            self._outcomes[host][outcome] += 1
+            per_minute = new_rate = bucket.rate * 60
+            if outcome == OK:
+                new_rate = min(per_minute + self.increase, self.max_rate)
+            elif outcome in (SLOW, THROTTLED):
+                now = time.monotonic()
+                if now - self._last_decrease.get(host, 0.0) >= DECREASE_COOLDOWN_SECONDS:
+                    self._last_decrease[host] = now
+                    new_rate = max(per_minute * self.decrease, self.min_rate)
+            if new_rate != per_minute:
+                bucket.set_rate(new_rate / 60.0)
+
+        if outcome == THROTTLED:
+            pause = min(retry_after, MAX_PAUSE_SECONDS) if retry_after else 0
+            if pause:
+                bucket.pause(pause)
+            logger.warning("%s throttled us; rate %s req/min%s", host,
+                           f"{per_minute:.1f} -> {new_rate:.1f}" if new_rate != per_minute else f"held at {new_rate:.1f}",
+                           f", pausing {pause:.0f}s" if pause else "")
+        elif outcome == SLOW and new_rate != per_minute:
+            logger.info("%s is responding slowly; rate %.1f -> %.1f req/min", host, per_minute, new_rate)
+
+    def current_rate(self, url: str) -> float:
+        """Current budget for the URL's host in requests/minute"""
+        return self.bucket(urlsplit(url).netloc).rate * 60
+
+    def stats(self) -> Dict:
+        with self._lock:
+            hosts = {
+                host: {"rate_per_minute": round(bucket.rate * 60, 2), **self._outcomes[host]}
+                for host, bucket in self._buckets.items()
+            }
+            return {
+                "requests": self.requests,
+                "total_wait_seconds": round(self.total_wait, 2),
+                "min_rate_per_minute": self.min_rate,
+                "max_rate_per_minute": self.max_rate,
+                "hosts": hosts,
+            }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+# Process-wide request budget shared by all fetchers
+rate_limiter = HostRateLimiter()
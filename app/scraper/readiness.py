@@ -0,0 +1,67 @@
+"""Per-page-type readiness checks for browser loads.
+
+FBref pages are server-rendered, so their tables are in the DOM as soon as
+it is parsed. A page counts as ready once its type's selector matches, or
+once the document has finished parsing without it (a date with no
+fixtures, an error page): waiting longer would not make it appear.
+"""
+from typing import Dict, NamedTuple, Optional
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PageReadiness(NamedTuple):
+    # CSS selector the page's data lives in
+    ready: str
+    # Content that may only render on scroll; the page is scrolled only when
+    # this is still missing once the page is ready
+    lazy: Optional[str] = None
+
+
+READINESS: Dict[str, PageReadiness] = {
+    "fixtures": PageReadiness(ready="div[id^='all_sched_'], table.stats_table"),
+    "schedule": PageReadiness(ready="table[id^='sched_']"),
+    "match": PageReadiness(ready="div.scorebox, table[id^='stats_'][id$='_summary']",
+                           lazy="table[id^='stats_'][id$='_summary']"),
+    "player": PageReadiness(ready="table[id^='stats_standard'], div[id^='all_stats_']"),
+}
+
+# Evaluated in the page: "found", "absent" (DOM parsed, selector missing) or "loading"
+_READY_SCRIPT = """
+if (document.querySelector(arguments[0])) return "found";
+return document.readyState === "loading" ? "loading" : "absent";
+"""
+
+
+def wait_until_ready(driver, page_type: str, timeout: float = 10) -> str:
+    """Wait for a page type's content; returns "found", "absent" or "timeout"
+    ("found" straight away for page types without a readiness rule)"""
+    spec = READINESS.get(page_type)
+    if spec is None:
+        return "found"
+
+    def settled(d):
+        state = d.execute_script(_READY_SCRIPT, spec.ready)
+        return state if state != "loading" else False
+
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(settled)
+    except TimeoutException:
+        logger.warning("%s page not ready after %ss", page_type, timeout)
+        return "timeout"
+    except Exception as e:
+        logger.warning("Readiness check for %s page failed: %s", page_type, e)
+        return "timeout"
+
+
+def needs_scroll(driver, page_type: str) -> bool:
+    """Whether the page's lazily rendered content is still missing"""
+    spec = READINESS.get(page_type)
+    if spec is None or spec.lazy is None:
+        return False
+    return not driver.execute_script("return !!document.querySelector(arguments[0]);", spec.lazy)
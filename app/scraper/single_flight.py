@@ -0,0 +1,80 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight block until it finishes and receive the same result (or
+    exception). Nothing is cached once the call completes.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            in_flight = len(self._calls)
+        return {"in_flight": in_flight, "executions": self.executions, "shared": self.shared}
+
+
+class AsyncSingleFlight:
+    """SingleFlight for coroutines on one event loop, so coalesced API
+    requests wait on a future instead of each holding an executor thread"""
+
+    def __init__(self):
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, coro_fn: Callable[[], Awaitable]) -> Any:
+        future = self._futures.get(key)
+        if future is None:
+            future = asyncio.ensure_future(coro_fn())
+            self._futures[key] = future
+            future.add_done_callback(lambda _: self._futures.pop(key, None))
+        # Shield so one disconnecting client does not cancel the shared work
+        return await asyncio.shield(future)
+
+
+# Process-wide flights for the scrapes users trigger most often
+fixtures_flight = SingleFlight()
+match_flight = SingleFlight()
@@ -1,3 +1,5 @@
 from .task_manager import TaskManager
+from .scrape_executor import ScrapeExecutor, ExecutorSaturated
+from .export_retention import ExportRetention
 
-__all__ = ['TaskManager']
\ No newline at end of file
+__all__ = ['TaskManager', 'ScrapeExecutor', 'ExecutorSaturated', 'ExportRetention']
\ No newline at end of file
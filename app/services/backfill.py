@@ -0,0 +1,204 @@
+import threading
+import time
+from datetime import date as date_cls, timedelta
+from typing import Callable, Dict, List, Optional
+
+from app.scraper.core import FBrefScraper
+from app.scraper.fetchers import FetchResult, PageFetcher, get_fetcher
+from app.services.warehouse import Warehouse, get_warehouse
+
+# Receives the run's progress snapshot after every unit of work
+BackfillProgress = Callable[[Dict], None]
+
+
+class CountingFetcher(PageFetcher):
+    """Counts pages requested through the scraper layer for throughput reporting"""
+
+    def __init__(self, inner: PageFetcher):
+        self.inner = inner
+        self.pages = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, url: str, page_type: str = "page", headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        with self._lock:
+            self.pages += 1
+        return self.inner.fetch(url, page_type=page_type, headers=headers)
+
+
+def backfill_run_id(league: Optional[str] = None, season: Optional[str] = None,
+                    date_from: Optional[str] = None, date_to: Optional[str] = None) -> str:
+    """Stable id for a backfill's parameters, so re-running it resumes the checkpoint"""
+    if season:
+        return f"season:{league}:{season}"
+    return f"range:{date_from}:{date_to}:{league or 'all'}"
+
+
+class Backfill:
+    """Bulk scrape of a league season or a date range, resumable from checkpoints.
+
+    The fixtures phase walks the season's schedule page (or every date's
+    fixtures page), storing fixtures in the warehouse; the match phase
+    scrapes every played match that is not stored yet. All pages go through
+    the normal scraper layer, so the shared per-host rate limiter, page cache
+    and warehouse apply. The checkpoint is saved after every date and match,
+    and stored matches are skipped, so a killed run continues where it
+    stopped; re-running a completed backfill only retries missing matches
+    unless `restart` is set.
+    """
+
+    def __init__(self, league: Optional[str] = None, season: Optional[str] = None,
+                 date_from: Optional[str] = None, date_to: Optional[str] = None,
+                 store: Warehouse = None, fetcher: PageFetcher = None,
+                 progress: Optional[BackfillProgress] = None,
+                 stop_event: Optional[threading.Event] = None, restart: bool = False):
+        if season and not league:
+            raise ValueError("A season backfill needs a league")
+        if not season and not (date_from and date_to):
+            raise ValueError("Give either a league and season or a date_from/date_to range")
+        if date_from and date_to and date_from > date_to:
+            raise ValueError("date_from must not be after date_to")
+
+        self.league = league
+        self.season = season
+        self.date_from = date_from
+        self.date_to = date_to
+        self.run_id = backfill_run_id(league, season, date_from, date_to)
+        self.store = store or get_warehouse()
+        self.fetcher = CountingFetcher(fetcher or get_fetcher())
+        self.scraper = FBrefScraper(fetcher=self.fetcher, warehouse=self.store)
+        self.progress = progress
+        self.stop_event = stop_event or threading.Event()
+
+        checkpoint = None if restart else self.store.load_checkpoint(self.run_id)
+        self.state = checkpoint or {
+            "run_id": self.run_id,
+            "status": "pending",
+            "fixtures_done": False,
+            "next_date": date_from,
+            "first_date": date_from,
+            "last_date": date_to,
+            "dates_done": 0,
+            "matches_done": 0,
+            "matches_skipped": 0,
+            "matches_failed": [],
+            "pages_fetched": 0,
+        }
+        self._started = time.time()
+        self._units_at_start = 0
+        self._pages_at_start = self.state["pages_fetched"]
+
+    def run(self) -> Dict:
+        """Run (or resume) the backfill; returns the final progress snapshot"""
+        self.state["status"] = "running"
+        self.state.pop("error", None)
+        # The match phase always re-walks its targets; matches stored by an
+        # earlier run are counted as skipped and earlier failures retried
+        self.state.update(matches_done=0, matches_skipped=0, matches_failed=[])
+        self._units_at_start = self._units_done()
+        try:
+            if not self.state["fixtures_done"]:
+                self._backfill_fixtures()
+            if not self.stop_event.is_set():
+                self._backfill_matches()
+            self.state["status"] = "stopped" if self.stop_event.is_set() else "completed"
+        except Exception as e:
+            self.state["status"] = "error"
+            self.state["error"] = str(e)
+            raise
+        finally:
+            self._checkpoint()
+        return self.snapshot()
+
+    def _backfill_fixtures(self):
+        if self.season:
+            fixtures = self.scraper.get_season_fixtures(self.league, self.season)
+            dates = sorted({fixture["date"] for fixture in fixtures})
+            if dates:
+                self.state["first_date"], self.state["last_date"] = dates[0], dates[-1]
+            self.state["dates_done"] = len(dates)
+        else:
+            day = date_cls.fromisoformat(self.state["next_date"])
+            last = date_cls.fromisoformat(self.date_to)
+            while day <= last:
+                if self.stop_event.is_set():
+                    return
+                self.scraper.get_fixtures_by_date(day.isoformat(), self.league)
+                day += timedelta(days=1)
+                self.state["next_date"] = day.isoformat()
+                self.state["dates_done"] += 1
+                self._checkpoint()
+        self.state["fixtures_done"] = True
+        self._checkpoint()
+
+    def _backfill_matches(self):
+        targets = self._match_targets()
+        self.state["matches_total"] = len(targets)
+        failed = set()
+        for fixture in targets:
+            if self.stop_event.is_set():
+                return
+            if self.store.has_match(fixture["match_id"]):
+                self.state["matches_skipped"] += 1
+                continue
+            match_data = self.scraper.scrape_match_data(fixture["match_url"], refresh=True)
+            if match_data:
+                self.state["matches_done"] += 1
+            else:
+                failed.add(fixture["match_url"])
+            self.state["matches_failed"] = sorted(failed)
+            self._checkpoint()
+
+    def _match_targets(self) -> List[Dict]:
+        """Played fixtures with a match report link in the backfill's window"""
+        if not self.state["first_date"]:
+            return []
+        fixtures = self.store.query_fixtures(
+            date_from=self.state["first_date"], date_to=self.state["last_date"],
+            league_id=self.league, limit=None
+        )
+        return [
+            fixture for fixture in fixtures
+            if fixture["score"] and fixture["match_url"] and "/en/matches/" in fixture["match_url"]
+        ]
+
+    def _units_done(self) -> int:
+        return (self.state["dates_done"] + self.state["matches_done"]
+                + self.state["matches_skipped"] + len(self.state["matches_failed"]))
+
+    def _checkpoint(self):
+        self.state["pages_fetched"] = self._pages_at_start + self.fetcher.pages
+        self.store.save_checkpoint(self.run_id, self.state)
+        if self.progress:
+            self.progress(self.snapshot())
+
+    def snapshot(self) -> Dict:
+        """Progress counters with pages/min and an ETA for this run"""
+        elapsed = max(time.time() - self._started, 1e-6)
+        if self.season:
+            dates_total = self.state["dates_done"]
+        else:
+            dates_total = (date_cls.fromisoformat(self.date_to) - date_cls.fromisoformat(self.date_from)).days + 1
+        matches_total = self.state.get("matches_total")
+        units_done = self._units_done()
+        units_total = dates_total + (matches_total or 0)
+
+        eta = None
+        units_this_run = units_done - self._units_at_start
+        if units_this_run > 0:
+            eta = round((units_total - units_done) * elapsed / units_this_run)
+
+        if matches_total is None:
+            # Match targets are only known once the fixtures phase is done
+            progress = int(self.state["dates_done"] / max(dates_total, 1) * 50)
+        else:
+            progress = int(units_done / max(units_total, 1) * 100)
+
+        return {
+            **self.state,
+            "dates_total": dates_total,
+            "matches_total": matches_total,
+            "progress": progress,
+            "pages_per_minute": round(self.fetcher.pages / elapsed * 60, 2),
+            "elapsed_seconds": round(elapsed),
+            "eta_seconds": eta,
+        }
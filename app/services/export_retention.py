@@ -0,0 +1,121 @@
+import os
+import shutil
+import threading
+import time
+from typing import Dict, Optional
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExportRetention:
+    """Keeps the export directory bounded.
+
+    A sweep deletes reports older than EXPORT_KEEP_FILES_HOURS and reports
+    larger than EXPORT_MAX_FILE_SIZE_MB, and records how much disk the
+    remaining exports use. Files modified within the last `settle_seconds`
+    are left alone so a report still being written is never removed.
+    """
+
+    def __init__(self, output_dir: str = None, keep_hours: float = None,
+                 max_file_size_mb: float = None, settle_seconds: float = 60):
+        self.output_dir = output_dir or settings.EXPORT_OUTPUT_DIR
+        self.keep_seconds = (keep_hours if keep_hours is not None else settings.EXPORT_KEEP_FILES_HOURS) * 3600
+        self.max_file_bytes = (max_file_size_mb if max_file_size_mb is not None
+                               else settings.EXPORT_MAX_FILE_SIZE_MB) * 1024 * 1024
+        self.settle_seconds = settle_seconds
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.files = 0
+        self.total_bytes = 0
+        self.expired_deleted = 0
+        self.oversized_deleted = 0
+        self.bytes_freed = 0
+        self.last_sweep: Optional[float] = None
+
+    def sweep(self) -> Dict:
+        """Delete expired and oversized exports; returns what this sweep removed"""
+        now = time.time()
+        files = total_bytes = expired = oversized = freed = 0
+        try:
+            entries = list(os.scandir(self.output_dir))
+        except FileNotFoundError:
+            entries = []
+
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            age = now - stat.st_mtime
+            if age >= self.settle_seconds:
+                reason = None
+                if age > self.keep_seconds:
+                    reason = "expired"
+                elif stat.st_size > self.max_file_bytes:
+                    reason = "oversized"
+                if reason:
+                    try:
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        continue
+                    logger.info("Deleted %s export %s (%d bytes)", reason, entry.name, stat.st_size)
+                    freed += stat.st_size
+                    if reason == "expired":
+                        expired += 1
+                    else:
+                        oversized += 1
+                    continue
+            files += 1
+            total_bytes += stat.st_size
+
+        with self._lock:
+            self.files = files
+            self.total_bytes = total_bytes
+            self.expired_deleted += expired
+            self.oversized_deleted += oversized
+            self.bytes_freed += freed
+            self.last_sweep = now
+        return {"expired": expired, "oversized": oversized, "bytes_freed": freed}
+
+    def start(self, stop_event: threading.Event, interval: float = None):
+        """Sweep now and then every `interval` seconds until stop_event is set"""
+        interval = interval or settings.EXPORT_SWEEP_INTERVAL
+
+        def run():
+            while True:
+                try:
+                    self.sweep()
+                except Exception as e:
+                    logger.error("Export retention sweep failed: %s", e)
+                if stop_event.wait(interval):
+                    return
+
+        self._thread = threading.Thread(target=run, name="export-retention", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = {
+                "output_dir": self.output_dir,
+                "files": self.files,
+                "total_bytes": self.total_bytes,
+                "expired_deleted": self.expired_deleted,
+                "oversized_deleted": self.oversized_deleted,
+                "bytes_freed": self.bytes_freed,
+                "last_sweep": self.last_sweep,
+                "keep_hours": self.keep_seconds / 3600,
+                "max_file_size_mb": self.max_file_bytes / (1024 * 1024),
+            }
+        try:
+            disk = shutil.disk_usage(self.output_dir)
+            stats["disk_free_bytes"] = disk.free
+            stats["disk_total_bytes"] = disk.total
+        except FileNotFoundError:
+            pass
+        return stats
@@ -0,0 +1,281 @@
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.services.progress_broker import progress_broker
+
+ACTIVE_STATUSES = ("queued", "running")
+
+# Columns workers may change through update(); a "status" update from the
+# report pipeline is stored as the job's stage, leaving the queue status alone
+UPDATABLE_FIELDS = ("stage", "progress", "message", "file_path", "error")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    match_url TEXT NOT NULL,
+    match_id TEXT,
+    format TEXT NOT NULL,
+    status TEXT NOT NULL,
+    stage TEXT,
+    progress INTEGER NOT NULL DEFAULT 0,
+    message TEXT,
+    file_path TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    next_run_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_runnable ON jobs (status, next_run_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_match ON jobs (match_url, format, status);
+"""
+
+
+class QueueFull(Exception):
+    """Raised when too many jobs are already waiting"""
+
+
+class JobQueue:
+    """Durable SQLite-backed queue of report jobs.
+
+    Workers lease jobs for a limited time and extend the lease while they
+    run; a job whose worker dies is picked up again once its lease expires.
+    Failed jobs are retried with exponential backoff up to
+    SCRAPER_MAX_RETRIES times. Identical active jobs (same match_url and
+    format) are deduplicated at enqueue time, and a report completed within
+    QUEUE_REUSE_SECONDS whose file still exists is handed back instead of
+    being rebuilt.
+    """
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or settings.QUEUE_DB_PATH
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite serialises writers across processes"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def enqueue(self, match_url: str, match_id: str, format: str) -> Dict:
+        """Add a job, or return the job already building (or recently built)
+        this report"""
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            existing = conn.execute(
+                f"""SELECT * FROM jobs WHERE match_url = ? AND format = ?
+                    AND status IN ({','.join('?' * len(ACTIVE_STATUSES))})
+                    ORDER BY created_at LIMIT 1""",
+                (match_url, format, *ACTIVE_STATUSES)
+            ).fetchone()
+            if existing:
+                conn.execute("COMMIT")
+                return {**_to_task(existing), "deduplicated": True}
+
+            built = conn.execute(
+                """SELECT * FROM jobs WHERE match_url = ? AND format = ?
+                   AND status = 'completed' AND updated_at >= ?
+                   ORDER BY updated_at DESC LIMIT 1""",
+                (match_url, format, now - settings.QUEUE_REUSE_SECONDS)
+            ).fetchone()
+            if built and built["file_path"] and os.path.exists(built["file_path"]):
+                conn.execute("COMMIT")
+                return {**_to_task(built), "deduplicated": True, "reused": True}
+
+            waiting = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = 'queued'"
+            ).fetchone()[0]
+            if waiting >= settings.QUEUE_MAX_PENDING:
+                raise QueueFull(f"Report queue is full ({waiting} jobs waiting)")
+
+            job_id = str(uuid.uuid4())
+            conn.execute(
+                """INSERT INTO jobs (job_id, match_url, match_id, format, status, progress,
+                   message, max_attempts, next_run_at, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, 'queued', 0, 'Waiting for a worker...', ?, ?, ?, ?)""",
+                (job_id, match_url, match_id, format,
+                 settings.SCRAPER_MAX_RETRIES + 1, now, now, now)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return {**self.get(job_id), "deduplicated": False}
+
+    def lease(self, worker_id: str, lease_seconds: float = None) -> Optional[Dict]:
+        """Claim the oldest runnable job (or one whose lease has expired)"""
+        lease_seconds = lease_seconds or settings.QUEUE_LEASE_SECONDS
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Jobs whose worker died on their final attempt are not retried
+            conn.execute(
+                """UPDATE jobs SET status = 'error', progress = 100, lease_owner = NULL,
+                   message = 'Worker lost while generating report', updated_at = ?
+                   WHERE status = 'running' AND lease_expires_at < ? AND attempts >= max_attempts""",
+                (now, now)
+            )
+            row = conn.execute(
+                """SELECT job_id FROM jobs
+                   WHERE (status = 'queued' AND next_run_at <= ?)
+                      OR (status = 'running' AND lease_expires_at < ?)
+                   ORDER BY next_run_at LIMIT 1""",
+                (now, now)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                """UPDATE jobs SET status = 'running', lease_owner = ?, lease_expires_at = ?,
+                   attempts = attempts + 1, updated_at = ? WHERE job_id = ?""",
+                (worker_id, now + lease_seconds, now, row["job_id"])
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        progress_broker.publish(row["job_id"])
+        return self.get(row["job_id"])
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float = None) -> bool:
+        """Extend a lease; False means the job now belongs to someone else"""
+        lease_seconds = lease_seconds or settings.QUEUE_LEASE_SECONDS
+        cursor = self._conn().execute(
+            """UPDATE jobs SET lease_expires_at = ? WHERE job_id = ?
+               AND lease_owner = ? AND status = 'running'""",
+            (time.time() + lease_seconds, job_id, worker_id)
+        )
+        return cursor.rowcount == 1
+
+    def update(self, job_id: str, worker_id: str, updates: Dict) -> bool:
+        """Record progress for a running job; False means the worker no longer holds it"""
+        updates = dict(updates)
+        if "status" in updates:
+            updates["stage"] = updates.pop("status")
+        fields = {k: v for k, v in updates.items() if k in UPDATABLE_FIELDS}
+        if not fields:
+            return True
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        cursor = self._conn().execute(
+            f"""UPDATE jobs SET {assignments}, updated_at = ? WHERE job_id = ?
+                AND lease_owner = ? AND status = 'running'""",
+            (*fields.values(), time.time(), job_id, worker_id)
+        )
+        if cursor.rowcount != 1:
+            return False
+        progress_broker.publish(job_id)
+        return True
+
+    def complete(self, job_id: str, worker_id: str, file_path: str,
+                 message: str = "Report generation complete") -> bool:
+        """Finish a job; False (and nothing recorded) when the worker's lease
+        was lost, e.g. it expired and the job was leased again"""
+        cursor = self._conn().execute(
+            """UPDATE jobs SET status = 'completed', progress = 100, message = ?, file_path = ?,
+               error = NULL, lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+               WHERE job_id = ? AND lease_owner = ? AND status = 'running'""",
+            (message, file_path, time.time(), job_id, worker_id)
+        )
+        if cursor.rowcount != 1:
+            return False
+        progress_broker.publish(job_id)
+        return True
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """Mark an attempt as failed; returns True when the job will be retried.
+
+        Does nothing (and returns False) unless the worker still holds the job.
+        """
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            job = conn.execute(
+                """SELECT attempts, max_attempts FROM jobs WHERE job_id = ?
+                   AND lease_owner = ? AND status = 'running'""",
+                (job_id, worker_id)
+            ).fetchone()
+            if job is None:
+                conn.execute("COMMIT")
+                return False
+            retrying = job["attempts"] < job["max_attempts"]
+            if retrying:
+                delay = settings.QUEUE_RETRY_DELAY * (settings.SCRAPER_BACKOFF_FACTOR ** (job["attempts"] - 1))
+                conn.execute(
+                    """UPDATE jobs SET status = 'queued', error = ?, lease_owner = NULL,
+                       lease_expires_at = NULL, next_run_at = ?, updated_at = ?,
+                       message = ? WHERE job_id = ?""",
+                    (error, now + delay, now,
+                     f"Attempt {job['attempts']} failed, retrying in {delay:.0f}s", job_id)
+                )
+            else:
+                conn.execute(
+                    """UPDATE jobs SET status = 'error', progress = 100, error = ?, message = ?,
+                       lease_owner = NULL, lease_expires_at = NULL, updated_at = ? WHERE job_id = ?""",
+                    (error, f"Error generating report: {error}", now, job_id)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        progress_broker.publish(job_id)
+        return retrying
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        row = self._conn().execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return _to_task(row) if row else None
+
+    def list_jobs(self, status: str = None, limit: int = 100) -> List[Dict]:
+        if status:
+            rows = self._conn().execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?", (status, limit)
+            ).fetchall()
+        else:
+            rows = self._conn().execute(
+                "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [_to_task(row) for row in rows]
+
+    def stats(self) -> Dict:
+        rows = self._conn().execute(
+            "SELECT status, COUNT(*) AS count FROM jobs GROUP BY status"
+        ).fetchall()
+        return {row["status"]: row["count"] for row in rows}
+
+
+def _to_task(row: sqlite3.Row) -> Dict:
+    """Job row in the same shape TaskManager tasks use"""
+    job = dict(row)
+    job["task_id"] = job["job_id"]
+    return job
+
+
+_job_queue: Optional[JobQueue] = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Process-wide job queue"""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            _job_queue = JobQueue()
+        return _job_queue
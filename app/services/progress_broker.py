@@ -0,0 +1,51 @@
+import asyncio
+import threading
+from typing import Dict, Set, Tuple
+
+
+class ProgressBroker:
+    """Wakes progress stream subscribers when a task changes.
+
+    Publishers may run on any thread (scrape executor, embedded workers);
+    each subscriber owns an asyncio.Event on its event loop that is set
+    thread-safely. Subscribers re-read the task themselves, so a wake-up
+    carries no payload and coalesces naturally.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, task_id: str) -> asyncio.Event:
+        """Register the calling coroutine's event loop for updates of a task"""
+        event = asyncio.Event()
+        entry = (asyncio.get_running_loop(), event)
+        with self._lock:
+            self._subscribers.setdefault(task_id, set()).add(entry)
+        return event
+
+    def unsubscribe(self, task_id: str, event: asyncio.Event):
+        with self._lock:
+            entries = self._subscribers.get(task_id)
+            if not entries:
+                return
+            entries.difference_update({entry for entry in entries if entry[1] is event})
+            if not entries:
+                del self._subscribers[task_id]
+
+    def publish(self, task_id: str):
+        with self._lock:
+            entries = list(self._subscribers.get(task_id, ()))
+        for loop, event in entries:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Subscriber's loop already closed
+                self.unsubscribe(task_id, event)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(entries) for entries in self._subscribers.values())
+
+
+progress_broker = ProgressBroker()
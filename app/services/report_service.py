@@ -0,0 +1,87 @@
+import os
+import time
+from typing import Callable, Dict
+
+from app.config import settings
+from app.exporter.formats import get_format
+from app.scraper.core import FBrefScraper
+from app.utils.logger import get_logger
+from app.utils.metrics import REPORT_SECONDS, collect_spans, span, stage_summary
+
+# Receives partial task updates such as {"progress": 60, "message": "..."}
+ProgressSink = Callable[[Dict], None]
+
+logger = get_logger(__name__)
+
+
+class ReportProgress:
+    """Progress as the share of a report's pages and files that are done.
+
+    A report is the match page plus the export, plus one unit per player
+    page once players are known to be crawled; the percentage never reaches
+    100 before the job queue marks the job completed.
+    """
+
+    def __init__(self, sink: ProgressSink):
+        self.sink = sink
+        self.done = 0
+        self.total = 2
+
+    def add_units(self, count: int):
+        self.total += count
+
+    def advance(self, count: int = 1):
+        self.done += count
+
+    def report(self, **updates):
+        self.sink({"progress": min(int(self.done / self.total * 100), 99), **updates})
+
+
+def run_report(task_id: str, match_url: str, match_id: str, format: str,
+               progress: ProgressSink) -> str:
+    """Scrape a match and build its report file in the requested format;
+    returns the file path.
+
+    Raises when the match page yields no data so the job queue can retry.
+    """
+    export_format = get_format(format)
+    started = time.perf_counter()
+    outcome = "error"
+    with collect_spans() as spans:
+        try:
+            file_path = _build_report(task_id, match_url, export_format, ReportProgress(progress))
+            outcome = "ok"
+            return file_path
+        finally:
+            REPORT_SECONDS.labels(export_format.name, outcome).observe(time.perf_counter() - started)
+            logger.info("report %s %s in %.2fs, stages (ms): %s", task_id, outcome,
+                        time.perf_counter() - started, stage_summary(spans))
+
+
+def _build_report(task_id: str, match_url: str, export_format, tracker: ReportProgress) -> str:
+    scraper = FBrefScraper()
+
+    tracker.report(status="scraping_teams", message="Scraping team statistics...")
+    match_data = scraper.scrape_match_data(match_url)
+    if not match_data:
+        raise Exception(f"No match data scraped from {match_url}")
+    tracker.advance()
+
+    player_data = {}
+    if settings.SCRAPER_INCLUDE_PLAYERS and match_data.get('players'):
+        tracker.add_units(len(match_data['players']))
+        tracker.report(status="scraping_players", message="Scraping player pages...")
+
+        def report_player_progress(completed: int, total: int, player: Dict):
+            tracker.advance()
+            tracker.report(message=f"Scraped player {completed}/{total}: {player.get('name', '')}")
+
+        player_data = scraper.scrape_player_data(match_data, report_player_progress)
+
+    tracker.report(status="building_file", message=f"Building {export_format.name} file...")
+    with span("export", format=export_format.name) as export:
+        file_path = export_format.exporter().export_match_report(match_data, player_data, task_id)
+        export.set(bytes=os.path.getsize(file_path), tables=len(match_data.get('home_team', {}))
+                   + len(match_data.get('away_team', {})) + sum(len(tables) for tables in player_data.values()))
+    tracker.advance()
+    return file_path
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict
+
+from app.config import settings
+
+
+class ExecutorSaturated(Exception):
+    """Raised when the scrape executor's queue is full"""
+
+
+class ScrapeExecutor:
+    """Bounded thread pool that keeps blocking scrape work off the event loop.
+
+    At most ``max_workers`` jobs run at once and at most ``max_queue`` more
+    wait; anything beyond that is rejected immediately so the API can answer
+    with back-pressure instead of piling up work.
+    """
+
+    def __init__(self, max_workers: int = None, max_queue: int = None):
+        self.max_workers = max_workers or settings.SCRAPER_WORKERS
+        self.max_queue = max_queue if max_queue is not None else settings.SCRAPER_MAX_QUEUE
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="scrape")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._rejected = 0
+        self._completed = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        with self._lock:
+            if self._pending >= self.capacity:
+                self._rejected += 1
+                raise ExecutorSaturated(
+                    f"Scrape queue is full ({self._pending}/{self.capacity} jobs)"
+                )
+            self._pending += 1
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._job_done)
+        return future
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        """Run fn on the executor and await its result from the event loop"""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "running": min(self._pending, self.max_workers),
+                "queued": max(self._pending - self.max_workers, 0),
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _job_done(self, future):
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
@@ -1,10 +1,16 @@
 import time
 from typing import Dict, Optional, List
+from app.services.progress_broker import progress_broker
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 class TaskManager:
     def __init__(self):
         self.tasks: Dict[str, Dict] = {}
         self.task_timeout = 3600  # 1 hour
+        self.cleanup_interval = 60  # seconds between expiry scans
+        self._last_cleanup = 0.0
     
     def create_task(self, task_id: str, initial_data: Dict):
         """Create a new task with required default fields"""
@@ -19,7 +25,7 @@ class TaskManager:
     
     def get_task(self, task_id: str) -> Optional[Dict]:
         """Get task by ID, cleaning up old tasks first"""
-        self._cleanup_old_tasks()
+        self._maybe_cleanup()
         task = self.tasks.get(task_id)
         if task:
             # Return a copy to prevent accidental modification
@@ -31,6 +37,7 @@ class TaskManager:
         if task_id in self.tasks:
             self.tasks[task_id].update(updates)
             self.tasks[task_id]["updated_at"] = time.time()
+            progress_broker.publish(task_id)
     
     def get_all_tasks(self) -> List[Dict]:
         """Get all active tasks (for debugging/monitoring)"""
@@ -40,19 +47,25 @@ class TaskManager:
             for task_id, task in self.tasks.items()
         ]
     
+    def _maybe_cleanup(self):
+        """Run the O(n) expiry scan at most once per cleanup_interval"""
+        if time.time() - self._last_cleanup >= self.cleanup_interval:
+            self._cleanup_old_tasks()
+    
     def _cleanup_old_tasks(self):
         """Remove tasks that haven't been updated within timeout"""
         current_time = time.time()
+        self._last_cleanup = current_time
         expired_tasks = [
             task_id for task_id, task in self.tasks.items()
             if current_time - task.get("updated_at", 0) > self.task_timeout
         ]
         
         for task_id in expired_tasks:
-            print(f"Cleaning up expired task: {task_id}")
+            logger.info("Cleaning up expired task: %s", task_id)
             del self.tasks[task_id]
     
     def cleanup(self):
         """Clean up all tasks (called on shutdown)"""
-        print(f"Cleaning up {len(self.tasks)} tasks")
+        logger.info("Cleaning up %d tasks", len(self.tasks))
         self.tasks.clear()
\ No newline at end of file
@@ -0,0 +1,437 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from io import StringIO
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from app.config import settings
+
+FIXTURE_FIELDS = ("league", "league_id", "date", "time", "home_team", "away_team", "score",
+                  "home_team_url", "away_team_url", "match_url", "match_id")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fixtures (
+    date TEXT NOT NULL,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    league TEXT,
+    league_id TEXT,
+    time TEXT,
+    score TEXT,
+    home_team_url TEXT,
+    away_team_url TEXT,
+    match_url TEXT,
+    match_id TEXT NOT NULL,
+    position INTEGER NOT NULL DEFAULT 0,
+    fingerprint TEXT,
+    state TEXT,
+    change_seq INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (date, home_team, away_team)
+);
+CREATE INDEX IF NOT EXISTS idx_fixtures_league ON fixtures (league_id, date);
+CREATE INDEX IF NOT EXISTS idx_fixtures_home ON fixtures (home_team, date);
+CREATE INDEX IF NOT EXISTS idx_fixtures_away ON fixtures (away_team, date);
+CREATE INDEX IF NOT EXISTS idx_fixtures_match_id ON fixtures (match_id);
+
+CREATE TABLE IF NOT EXISTS fixture_scrapes (
+    date TEXT NOT NULL,
+    league_id TEXT NOT NULL,
+    fixture_count INTEGER NOT NULL,
+    scraped_at REAL NOT NULL,
+    PRIMARY KEY (date, league_id)
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    match_id TEXT PRIMARY KEY,
+    match_url TEXT NOT NULL,
+    date TEXT,
+    league_id TEXT,
+    home_team TEXT,
+    away_team TEXT,
+    match_info TEXT NOT NULL,
+    players TEXT NOT NULL,
+    scraped_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_matches_url ON matches (match_url);
+CREATE INDEX IF NOT EXISTS idx_matches_date ON matches (date);
+CREATE INDEX IF NOT EXISTS idx_matches_home ON matches (home_team, date);
+CREATE INDEX IF NOT EXISTS idx_matches_away ON matches (away_team, date);
+
+CREATE TABLE IF NOT EXISTS checkpoints (
+    run_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS match_tables (
+    match_id TEXT NOT NULL,
+    side TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    dtypes TEXT NOT NULL,
+    attrs TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (match_id, side, table_name)
+);
+"""
+
+# Columns added to fixtures after the first release, created on older databases
+_FIXTURE_COLUMNS = {
+    "fingerprint": "TEXT",
+    "state": "TEXT",
+    "change_seq": "INTEGER NOT NULL DEFAULT 0",
+}
+
+# Marker league_id for a fixtures scrape that covered every league
+ALL_LEAGUES = ""
+
+
+def fixture_fingerprint(fixture: Dict) -> str:
+    """Digest of the parts of a fixture row that change as the match is played"""
+    key = f"{fixture.get('score') or ''}|{fixture.get('time') or ''}|{fixture.get('match_url') or ''}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def fixture_state(fixture: Dict) -> str:
+    """scheduled, live (score but no match report yet) or finished"""
+    if not fixture.get("score"):
+        return "scheduled"
+    match_url = fixture.get("match_url") or ""
+    return "finished" if "/en/matches/" in match_url else "live"
+
+
+def has_team_tables(match_data: Dict) -> bool:
+    """Whether scraped match data holds at least one non-empty team table; an
+    error or challenge page parses to match info without any"""
+    return any(
+        isinstance(table, pd.DataFrame) and not table.empty
+        for side in ("home_team", "away_team")
+        for table in match_data.get(side, {}).values()
+    )
+
+
+def _scraped_after_day(date: Optional[str], scraped_at: float) -> bool:
+    """Whether a scrape of a date's page ran after that (local) day was over.
+
+    Only such a scrape is final: one taken on match day can hold a missing or
+    half-time score and must expire like today's pages.
+    """
+    if not date:
+        return False
+    return scraped_at >= (datetime.fromisoformat(date) + timedelta(days=1)).timestamp()
+
+
+class Warehouse:
+    """Local SQLite store of scraped fixtures and match reports.
+
+    Fixtures are keyed by (date, home_team, away_team) so a row keeps its
+    identity when its match report link appears; each date (and league
+    filter) scrape is recorded so repeat lookups can be answered without
+    fetching while they are fresh under the page-cache TTL rules. Match team
+    tables keep their dtypes and FBref column labels.
+    """
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or settings.WAREHOUSE_DB_PATH
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        self._migrate(conn)
+
+    def _migrate(self, conn: sqlite3.Connection):
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(fixtures)")}
+        for name, definition in _FIXTURE_COLUMNS.items():
+            if name not in columns:
+                conn.execute(f"ALTER TABLE fixtures ADD COLUMN {name} {definition}")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_fixtures_change ON fixtures (change_seq)")
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite serialises writers across processes"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    # Fixtures
+
+    def upsert_fixtures(self, date: str, league_id: Optional[str], fixtures: List[Dict]) -> List[Dict]:
+        """Store a date's scraped fixtures and mark the (date, league) scrape as done.
+
+        Rows whose fingerprint (score, time, match report link) is new or
+        different get the next change sequence number; those rows are
+        returned with their `state` and `previous_state` (None when new).
+        """
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            dates = {fixture.get("date") or date for fixture in fixtures}
+            existing = {
+                (row["date"], row["home_team"], row["away_team"]): row
+                for row in conn.execute(
+                    f"""SELECT date, home_team, away_team, fingerprint, state, change_seq FROM fixtures
+                        WHERE date IN ({','.join('?' * len(dates))})""",
+                    tuple(dates)
+                )
+            }
+            seq = conn.execute("SELECT COALESCE(MAX(change_seq), 0) FROM fixtures").fetchone()[0]
+
+            rows, changed = [], []
+            for position, fixture in enumerate(fixtures):
+                row = {**{field: fixture.get(field) for field in FIXTURE_FIELDS},
+                       "date": fixture.get("date") or date, "position": position, "updated_at": now,
+                       "fingerprint": fixture_fingerprint(fixture), "state": fixture_state(fixture)}
+                previous = existing.get((row["date"], row["home_team"], row["away_team"]))
+                if previous is None or previous["fingerprint"] != row["fingerprint"]:
+                    seq += 1
+                    row["change_seq"] = seq
+                    changed.append({**{field: row[field] for field in FIXTURE_FIELDS},
+                                    "state": row["state"], "change_seq": seq,
+                                    "previous_state": previous["state"] if previous else None})
+                else:
+                    row["change_seq"] = previous["change_seq"]
+                rows.append(row)
+
+            conn.executemany(
+                """INSERT INTO fixtures (date, home_team, away_team, league, league_id, time, score,
+                   home_team_url, away_team_url, match_url, match_id, position, fingerprint, state,
+                   change_seq, updated_at)
+                   VALUES (:date, :home_team, :away_team, :league, :league_id, :time, :score,
+                   :home_team_url, :away_team_url, :match_url, :match_id, :position, :fingerprint,
+                   :state, :change_seq, :updated_at)
+                   ON CONFLICT (date, home_team, away_team) DO UPDATE SET
+                   league = excluded.league, league_id = excluded.league_id, time = excluded.time,
+                   score = excluded.score, home_team_url = excluded.home_team_url,
+                   away_team_url = excluded.away_team_url, match_url = excluded.match_url,
+                   match_id = excluded.match_id, position = excluded.position,
+                   fingerprint = excluded.fingerprint, state = excluded.state,
+                   change_seq = excluded.change_seq, updated_at = excluded.updated_at""",
+                rows
+            )
+            conn.execute(
+                """INSERT OR REPLACE INTO fixture_scrapes (date, league_id, fixture_count, scraped_at)
+                   VALUES (?, ?, ?, ?)""",
+                (date, league_id or ALL_LEAGUES, len(fixtures), now)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return changed
+
+    def fixture_changes(self, date: str, league_id: Optional[str] = None, cursor: int = 0) -> Dict:
+        """Fixtures of a date that changed after `cursor`, plus the cursor to pass next time"""
+        where, params = _filters("", date, date, league_id)
+        conn = self._conn()
+        # Bounded by the latest sequence read first, so a change committed
+        # in between is returned next time rather than skipped
+        latest = conn.execute("SELECT COALESCE(MAX(change_seq), 0) FROM fixtures").fetchone()[0]
+        rows = conn.execute(
+            f"SELECT * FROM fixtures{where} AND change_seq > ? AND change_seq <= ? ORDER BY change_seq",
+            (*params, cursor, latest)
+        ).fetchall()
+        return {
+            "fixtures": [
+                {**{field: row[field] for field in FIXTURE_FIELDS},
+                 "state": row["state"], "change_seq": row["change_seq"]}
+                for row in rows
+            ],
+            "cursor": max(latest, cursor),
+        }
+
+    def fresh_fixtures(self, date: str, league_id: Optional[str] = None) -> Optional[List[Dict]]:
+        """Stored fixtures for a date when a fresh enough scrape covered it, else None"""
+        scrape = self._conn().execute(
+            """SELECT scraped_at FROM fixture_scrapes WHERE date = ? AND league_id IN (?, ?)
+               ORDER BY scraped_at DESC LIMIT 1""",
+            (date, league_id or ALL_LEAGUES, ALL_LEAGUES)
+        ).fetchone()
+        if scrape is None:
+            return None
+        if not _scraped_after_day(date, scrape["scraped_at"]):
+            # Imported here: the scraper package itself depends on the warehouse
+            from app.scraper.page_cache import ttl_for
+            ttl = ttl_for(f"/en/matches/{date}", "fixtures")
+            if ttl is None:
+                # A past date, but scraped before it was over
+                ttl = settings.CACHE_TTL_TODAY
+            if time.time() - scrape["scraped_at"] > ttl:
+                return None
+        return self.query_fixtures(date=date, league_id=league_id, limit=None)
+
+    def query_fixtures(self, date: str = None, date_from: str = None, date_to: str = None,
+                       league_id: str = None, team: str = None, limit: Optional[int] = 500) -> List[Dict]:
+        where, params = _filters("", date_from or date, date_to or date, league_id, team)
+        sql = f"SELECT * FROM fixtures{where} ORDER BY date, position"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        rows = self._conn().execute(sql, params).fetchall()
+        return [{field: row[field] for field in FIXTURE_FIELDS} for row in rows]
+
+    # Matches
+
+    def upsert_match(self, match_data: Dict) -> bool:
+        """Store a scraped match report and its team tables; match data without
+        team tables is refused (False) so the match is scraped again later"""
+        match_info = match_data.get("match_info", {})
+        match_id = match_info.get("match_id")
+        if not match_id or not has_team_tables(match_data):
+            return False
+        conn = self._conn()
+        fixture = conn.execute(
+            "SELECT date, league_id, home_team, away_team FROM fixtures WHERE match_id = ? LIMIT 1",
+            (match_id,)
+        ).fetchone()
+        home_team = fixture["home_team"] if fixture else match_info.get("team_1")
+        away_team = fixture["away_team"] if fixture else match_info.get("team_2")
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                """INSERT OR REPLACE INTO matches (match_id, match_url, date, league_id, home_team,
+                   away_team, match_info, players, scraped_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (match_id, match_info.get("url", ""), fixture["date"] if fixture else None,
+                 fixture["league_id"] if fixture else None, home_team, away_team,
+                 json.dumps(match_info, default=str), json.dumps(match_data.get("players", [])),
+                 time.time())
+            )
+            conn.execute("DELETE FROM match_tables WHERE match_id = ?", (match_id,))
+            for side in ("home_team", "away_team"):
+                for table_name, table in match_data.get(side, {}).items():
+                    if not isinstance(table, pd.DataFrame) or table.empty:
+                        continue
+                    conn.execute(
+                        """INSERT INTO match_tables (match_id, side, table_name, row_count,
+                           dtypes, attrs, data) VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                        (match_id, side, table_name, len(table),
+                         json.dumps({str(c): str(t) for c, t in table.dtypes.items()}),
+                         json.dumps(table.attrs, default=str),
+                         table.to_json(orient="split", index=False, double_precision=15))
+                    )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return True
+
+    def fresh_match(self, match_url: str) -> Optional[Dict]:
+        """Stored match data in scraper shape when it cannot have changed since it
+        was scraped (scraped after match day) or is recent enough, else None"""
+        row = self._conn().execute(
+            "SELECT * FROM matches WHERE match_url = ?", (match_url,)
+        ).fetchone()
+        if row is None:
+            return None
+        final = _scraped_after_day(row["date"], row["scraped_at"])
+        if not final and time.time() - row["scraped_at"] > settings.CACHE_TTL_TODAY:
+            return None
+        return self.get_match(row["match_id"])
+
+    def get_match(self, match_id: str) -> Optional[Dict]:
+        """Match data as the scraper returns it, team tables as typed DataFrames"""
+        conn = self._conn()
+        row = conn.execute("SELECT * FROM matches WHERE match_id = ?", (match_id,)).fetchone()
+        if row is None:
+            return None
+        match_data = {
+            "match_info": json.loads(row["match_info"]),
+            "home_team": {},
+            "away_team": {},
+            "players": json.loads(row["players"]),
+        }
+        for table in conn.execute(
+            "SELECT * FROM match_tables WHERE match_id = ? ORDER BY rowid", (match_id,)
+        ):
+            match_data[table["side"]][table["table_name"]] = _table_frame(table)
+        return match_data
+
+    def query_matches(self, date_from: str = None, date_to: str = None, league_id: str = None,
+                      team: str = None, limit: int = 500) -> List[Dict]:
+        where, params = _filters("m.", date_from, date_to, league_id, team)
+        rows = self._conn().execute(
+            f"""SELECT m.match_id, m.match_url, m.date, m.league_id, m.home_team, m.away_team,
+                m.scraped_at, COUNT(t.table_name) AS tables
+                FROM matches m LEFT JOIN match_tables t ON t.match_id = m.match_id{where}
+                GROUP BY m.match_id ORDER BY m.date, m.match_id LIMIT ?""",
+            (*params, limit)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def has_match(self, match_id: str) -> bool:
+        row = self._conn().execute("SELECT 1 FROM matches WHERE match_id = ?", (match_id,)).fetchone()
+        return row is not None
+
+    # Checkpoints of long-running jobs such as backfills
+
+    def load_checkpoint(self, run_id: str) -> Optional[Dict]:
+        row = self._conn().execute("SELECT state FROM checkpoints WHERE run_id = ?", (run_id,)).fetchone()
+        return json.loads(row["state"]) if row else None
+
+    def save_checkpoint(self, run_id: str, state: Dict):
+        self._conn().execute(
+            "INSERT OR REPLACE INTO checkpoints (run_id, state, updated_at) VALUES (?, ?, ?)",
+            (run_id, json.dumps(state), time.time())
+        )
+
+    def stats(self) -> Dict:
+        conn = self._conn()
+        return {
+            "db_path": self.db_path,
+            "fixtures": conn.execute("SELECT COUNT(*) FROM fixtures").fetchone()[0],
+            "fixture_dates": conn.execute("SELECT COUNT(DISTINCT date) FROM fixture_scrapes").fetchone()[0],
+            "matches": conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0],
+            "tables": conn.execute("SELECT COUNT(*) FROM match_tables").fetchone()[0],
+        }
+
+
+def _filters(prefix: str, date_from: str = None, date_to: str = None,
+             league_id: str = None, team: str = None):
+    """WHERE clause and parameters shared by the fixture and match queries"""
+    clauses, params = [], []
+    if date_from:
+        clauses.append(f"{prefix}date >= ?")
+        params.append(date_from)
+    if date_to:
+        clauses.append(f"{prefix}date <= ?")
+        params.append(date_to)
+    if league_id:
+        clauses.append(f"{prefix}league_id = ?")
+        params.append(league_id)
+    if team:
+        clauses.append(f"({prefix}home_team = ? OR {prefix}away_team = ?)")
+        params.extend((team, team))
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def _table_frame(row: sqlite3.Row) -> pd.DataFrame:
+    dtypes = json.loads(row["dtypes"])
+    df = pd.read_json(StringIO(row["data"]), orient="split", dtype=False,
+                      convert_dates=False, precise_float=True)
+    df.columns = list(dtypes)
+    df = df.astype(dtypes)
+    df.attrs.update(json.loads(row["attrs"]))
+    return df
+
+
+_warehouse: Optional[Warehouse] = None
+_warehouse_lock = threading.Lock()
+
+
+def get_warehouse() -> Warehouse:
+    """Process-wide warehouse"""
+    global _warehouse
+    with _warehouse_lock:
+        if _warehouse is None:
+            _warehouse = Warehouse()
+        return _warehouse
@@ -1,18 +1,112 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+import threading
+from typing import Optional, Union
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Records beyond this many waiting for the writer thread are dropped, not blocked on
+QUEUE_SIZE = 10000
+
+# Every logger from get_logger() sits under this one, which owns the handler
+ROOT_NAME = "app"
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to the background writer without ever blocking the caller"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _Pipeline:
+    """The queue, its handler on the app logger and the listener thread writing records out"""
+
+    def __init__(self):
+        self.handler: Optional[DroppingQueueHandler] = None
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        log_queue = queue.Queue(QUEUE_SIZE)
+        stream = logging.StreamHandler()
+        stream.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        root = logging.getLogger(ROOT_NAME)
+        if self.handler:
+            root.removeHandler(self.handler)
+        self.handler = DroppingQueueHandler(log_queue)
+        root.addHandler(self.handler)
+        root.propagate = False
+        if root.level == logging.NOTSET:
+            root.setLevel(logging.INFO)
+
+        self.listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+        self.listener.start()
+
+    def ensure_started(self):
+        if self.listener is None:
+            with self.lock:
+                if self.listener is None:
+                    self.start()
+
+    def stop(self):
+        with self.lock:
+            if self.listener is not None:
+                self.listener.stop()
+                self.listener = None
+
+    def restart_in_child(self):
+        # A forked child inherits the queue but not the listener thread draining it
+        self.listener = None
+        self.lock = threading.Lock()
+        if self.handler is not None:
+            self.start()
+
+
+_pipeline = _Pipeline()
+atexit.register(_pipeline.stop)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_pipeline.restart_in_child)
+
 
 def setup_logger(name: str) -> logging.Logger:
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
-    
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-    
-    return logger
+    _pipeline.ensure_started()
+    if name != ROOT_NAME and not name.startswith(ROOT_NAME + "."):
+        name = f"{ROOT_NAME}.{name}"
+    return logging.getLogger(name)
+
 
 def get_logger(name: str) -> logging.Logger:
-    return setup_logger(name)
\ No newline at end of file
+    """Logger under the app hierarchy, written out by a background thread.
+
+    Use lazy %-style arguments, and guard work done only for a log line
+    with logger.isEnabledFor(logging.DEBUG).
+    """
+    return setup_logger(name)
+
+
+def configure_logging(level: Union[str, int] = "INFO"):
+    """Set the level for every app logger"""
+    _pipeline.ensure_started()
+    logging.getLogger(ROOT_NAME).setLevel(level.upper() if isinstance(level, str) else level)
+
+
+def shutdown_logging():
+    """Write out queued records and stop the writer thread"""
+    _pipeline.stop()
+
+
+def dropped_records() -> int:
+    """Records dropped because the writer thread fell behind"""
+    return _pipeline.handler.dropped if _pipeline.handler else 0
@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+
+from app.utils.logger import get_logger
+
+logger = get_logger("app.metrics")
+
+# Stage latencies run from milliseconds (parsing) to minutes (a report with player pages)
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+STAGE_SECONDS = Histogram(
+    "fbref_stage_duration_seconds", "Time spent in each scrape/report stage",
+    ["stage", "outcome"], buckets=STAGE_BUCKETS
+)
+STAGE_BYTES = Counter("fbref_stage_bytes_total", "Bytes handled by each stage", ["stage"])
+STAGE_TABLES = Counter("fbref_stage_tables_total", "Tables produced by each stage", ["stage"])
+REPORT_SECONDS = Histogram(
+    "fbref_report_duration_seconds", "End-to-end report generation time",
+    ["format", "outcome"], buckets=STAGE_BUCKETS
+)
+
+# The active collect_spans() list. A context variable rather than a thread
+# local, so work handed to a pool with contextvars.copy_context().run (player
+# pages) still reports into the list of the report that started it.
+_collected: ContextVar[Optional[List["Span"]]] = ContextVar("collected_spans", default=None)
+_collected_lock = threading.Lock()
+
+
+class Span:
+    """One timed stage; attributes such as bytes and tables can be set while it runs"""
+
+    def __init__(self, stage: str, attrs: Dict):
+        self.stage = stage
+        self.attrs = attrs
+        self.outcome = "ok"
+        self.duration: Optional[float] = None
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def as_dict(self) -> Dict:
+        return {"stage": self.stage, "outcome": self.outcome,
+                "duration_ms": round((self.duration or 0) * 1000, 1), **self.attrs}
+
+
+@contextmanager
+def span(stage: str, **attrs) -> Iterator[Span]:
+    """Time a stage into the stage histogram and add its bytes/tables to the counters.
+
+    Spans finished in this context (including pool threads running a copy
+    of it) are also appended to the active collect_spans() list, if any.
+    """
+    current = Span(stage, attrs)
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException:
+        current.outcome = "error"
+        raise
+    finally:
+        current.duration = time.perf_counter() - started
+        STAGE_SECONDS.labels(stage, current.outcome).observe(current.duration)
+        if current.attrs.get("bytes"):
+            STAGE_BYTES.labels(stage).inc(current.attrs["bytes"])
+        if current.attrs.get("tables"):
+            STAGE_TABLES.labels(stage).inc(current.attrs["tables"])
+        collected = _collected.get()
+        if collected is not None:
+            with _collected_lock:
+                collected.append(current)
+        # Every page load and parse ends here; build the dict only when it is logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("span %s", current.as_dict())
+
+
+@contextmanager
+def collect_spans() -> Iterator[List[Span]]:
+    """Gather the spans finished in this context, e.g. for a per-report breakdown"""
+    spans: List[Span] = []
+    token = _collected.set(spans)
+    try:
+        yield spans
+    finally:
+        _collected.reset(token)
+
+
+def stage_summary(spans: List[Span]) -> Dict[str, float]:
+    """Total milliseconds per stage"""
+    totals: Dict[str, float] = {}
+    for item in spans:
+        totals[item.stage] = round(totals.get(item.stage, 0.0) + (item.duration or 0) * 1000, 1)
+    return totals
+
+
+def render_metrics() -> bytes:
+    """Prometheus text exposition of every registered metric"""
+    return generate_latest()
+
@@ -0,0 +1,136 @@
+"""Report worker: leases jobs from the durable queue and builds reports.
+
+    python -m app.worker --processes 4
+"""
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Optional
+
+from prometheus_client import start_http_server
+
+from app.config import settings
+from app.services.job_queue import JobQueue, get_job_queue
+from app.services.report_service import run_report
+from app.utils.logger import get_logger, shutdown_logging
+
+logger = get_logger(__name__)
+
+
+class ReportWorker:
+    """Lease-run-complete loop for one worker thread or process"""
+
+    def __init__(self, queue: JobQueue = None, worker_id: str = None,
+                 stop_event: threading.Event = None):
+        self.queue = queue or get_job_queue()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+        self.stop_event = stop_event or threading.Event()
+
+    def run_forever(self):
+        logger.info("Report worker %s started", self.worker_id)
+        while not self.stop_event.is_set():
+            try:
+                job = self.queue.lease(self.worker_id)
+            except Exception as e:
+                logger.error("Worker %s failed to lease a job: %s", self.worker_id, e)
+                job = None
+            if job is None:
+                self.stop_event.wait(settings.QUEUE_POLL_INTERVAL)
+                continue
+            self.run_job(job)
+        logger.info("Report worker %s stopped", self.worker_id)
+
+    def run_job(self, job: dict):
+        job_id = job["job_id"]
+        heartbeat_stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job_id, heartbeat_stop), daemon=True)
+        heartbeat.start()
+        try:
+            file_path = run_report(
+                job_id, job["match_url"], job["match_id"], job["format"],
+                lambda updates: self.queue.update(job_id, self.worker_id, updates)
+            )
+            if not self.queue.complete(job_id, self.worker_id, file_path):
+                logger.warning("Lost lease on job %s before it completed; result discarded", job_id)
+        except Exception as e:
+            logger.error("Error generating report for job %s: %s", job_id, e)
+            retrying = self.queue.fail(job_id, self.worker_id, str(e))
+            if retrying:
+                logger.info("Job %s will be retried", job_id)
+        finally:
+            heartbeat_stop.set()
+            heartbeat.join()
+
+    def _heartbeat(self, job_id: str, stop: threading.Event):
+        interval = max(settings.QUEUE_LEASE_SECONDS / 3, 1)
+        while not stop.wait(interval):
+            if not self.queue.heartbeat(job_id, self.worker_id):
+                logger.warning("Lost lease on job %s", job_id)
+                return
+
+
+def start_embedded_workers(count: int, stop_event: threading.Event):
+    """Run workers as daemon threads inside the API process (for development)"""
+    threads = []
+    for i in range(count):
+        worker = ReportWorker(stop_event=stop_event)
+        thread = threading.Thread(target=worker.run_forever, name=f"report-worker-{i}", daemon=True)
+        thread.start()
+        threads.append(thread)
+    return threads
+
+
+def _worker_process(stop_event, metrics_port: Optional[int] = None):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if metrics_port:
+        # Worker processes have their own registries; each one is scraped separately
+        start_http_server(metrics_port)
+    from app.scraper.driver_pool import driver_pool
+    driver_pool.start()
+    try:
+        ReportWorker(stop_event=stop_event).run_forever()
+    finally:
+        driver_pool.shutdown()
+        # Worker processes exit without running atexit hooks
+        shutdown_logging()
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Run report worker processes")
+    parser.add_argument("--processes", type=int, default=settings.QUEUE_WORKER_PROCESSES,
+                        help="number of scraper processes to run")
+    parser.add_argument("--metrics-port", type=int,
+                        help="serve each process's Prometheus metrics on this port plus its index")
+    args = parser.parse_args(argv)
+
+    stop_event = multiprocessing.Event()
+    processes = [
+        multiprocessing.Process(
+            target=_worker_process,
+            args=(stop_event, args.metrics_port + i if args.metrics_port else None),
+            name=f"report-worker-{i}"
+        )
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    def request_stop(signum, frame):
+        logger.info("Stopping report workers...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    while any(process.is_alive() for process in processes):
+        for process in processes:
+            process.join(timeout=1)
+        time.sleep(0.1)
+
+
+if __name__ == "__main__":
+    main()
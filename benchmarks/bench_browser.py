@@ -0,0 +1,153 @@
+"""Compare Chrome profiles on the mock site: time-to-table, browser memory and
+the asset requests the browser makes.
+
+    python -m benchmarks.bench_browser [--repeat 5] [--latency 0.1] [--output browser.json]
+
+Each profile gets its own driver from selenium_driver.get_driver and loads a
+fixtures, a match and a player page from benchmarks/mock_fbref.py --repeat
+times. Time-to-table runs from driver.get until wait_until_ready finds the
+page type's table. Memory is the resident set of the Chrome process tree
+(read from /proc, so Linux only), sampled after every page; the peak is
+reported. Asset requests are the images, fonts, media, css and js the mock
+served during the profile's run.
+
+Profiles:
+  baseline  page load strategy "normal", no resource blocking, no lean flags
+  lean      the configured selenium settings (eager, blocked resources, lean flags)
+"""
+import argparse
+import json
+import os
+import statistics
+import threading
+import time
+from typing import Dict, List
+
+from app.config import settings
+from app.scraper import selenium_driver
+from app.scraper.readiness import wait_until_ready
+from benchmarks.corpus import load_corpus, warn_if_synthetic
+from benchmarks.mock_fbref import MockFBref, make_server
+
+PAGES = [
+    ("fixtures", "/en/matches/2024-10-05"),
+    ("match", "/en/matches/abcdef12/Home-FC-Away-United"),
+    ("player", "/en/players/1234abcd/Some-Player"),
+]
+
+# Settings each profile runs with; None keeps the configured value
+PROFILES = {
+    "baseline": {"SELENIUM_PAGE_LOAD_STRATEGY": "normal", "SELENIUM_BLOCK_RESOURCES": [],
+                 "SELENIUM_BLOCK_URLS": [], "LEAN_ARGUMENTS": ()},
+    "lean": {},
+}
+
+
+def _children() -> Dict[int, List[int]]:
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces; fields resume after ")"
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def tree_rss_mb(pid: int) -> float:
+    """Resident memory of pid's descendants (Chrome under ChromeDriver) in MB"""
+    children = _children()
+    total_kb = 0
+    pending = list(children.get(pid, []))
+    while pending:
+        child = pending.pop()
+        pending.extend(children.get(child, []))
+        try:
+            with open(f"/proc/{child}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total_kb / 1024
+
+
+def run_profile(name: str, overrides: Dict, base_url: str, mock: MockFBref, repeat: int) -> Dict:
+    saved = {}
+    for key, value in overrides.items():
+        owner = selenium_driver if key == "LEAN_ARGUMENTS" else settings
+        saved[key] = (owner, getattr(owner, key))
+        setattr(owner, key, value)
+    assets_before = mock.stats()["pages"].get("asset", 0)
+    driver = selenium_driver.get_driver(headless=True)
+    try:
+        timings: Dict[str, List[float]] = {page_type: [] for page_type, _ in PAGES}
+        not_ready = 0
+        peak_mb = tree_rss_mb(driver.service.process.pid)
+        for _ in range(repeat):
+            for page_type, path in PAGES:
+                started = time.perf_counter()
+                driver.get(base_url + path)
+                if wait_until_ready(driver, page_type) != "found":
+                    not_ready += 1
+                timings[page_type].append((time.perf_counter() - started) * 1000)
+                peak_mb = max(peak_mb, tree_rss_mb(driver.service.process.pid))
+    finally:
+        driver.quit()
+        for key, (owner, value) in saved.items():
+            setattr(owner, key, value)
+    return {
+        "profile": name,
+        "time_to_table_ms": {page_type: round(statistics.median(samples), 1)
+                             for page_type, samples in timings.items()},
+        "peak_rss_mb": round(peak_mb, 1),
+        "asset_requests": mock.stats()["pages"].get("asset", 0) - assets_before,
+        "not_ready": not_ready,
+    }
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="loads of each page per profile")
+    parser.add_argument("--latency", type=float, default=0.1, help="mock delay per request in seconds")
+    parser.add_argument("--profile", action="append", choices=sorted(PROFILES),
+                        help="profiles to run (default: all)")
+    parser.add_argument("--output", help="also write the results as JSON here")
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus()
+    warn_if_synthetic(corpus)
+    mock = MockFBref(latency=args.latency, jitter=0.0, corpus=corpus, seed=0)
+    server = make_server(mock, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    results = []
+    try:
+        for name in args.profile or list(PROFILES):
+            results.append(run_profile(name, PROFILES[name], base_url, mock, args.repeat))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    page_types = [page_type for page_type, _ in PAGES]
+    print(f"{'profile':<10}" + "".join(f"{page_type + ' ms':>14}" for page_type in page_types)
+          + f"{'peak MB':>10}{'assets':>8}{'not ready':>11}")
+    for result in results:
+        print(f"{result['profile']:<10}"
+              + "".join(f"{result['time_to_table_ms'][page_type]:>14.1f}" for page_type in page_types)
+              + f"{result['peak_rss_mb']:>10.1f}{result['asset_requests']:>8}{result['not_ready']:>11}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"repeat": args.repeat, "latency": args.latency, "results": results}, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Compare the legacy BeautifulSoup/html.parser path with the lxml
+parse-once document model and typed, columnar table extraction on the
+offline corpus, and the Big-5-only fixtures parser with the table-driven
+one on matchday pages (including a large synthetic one).
+
+    python -m benchmarks.bench_parse [--repeat 5]
+"""
+import argparse
+import math
+import statistics
+import time
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from app.exporter.headers import header_rows
+
+from app.scraper.fetchers import PageFetcher
+from app.scraper.fixtures import FixtureScraper
+from app.scraper.match_data import MatchDataScraper
+from benchmarks import legacy_parse
+from benchmarks.corpus import load_corpus, synthetic_matchday_page, warn_if_synthetic
+
+MATCH_URL = "/en/matches/abcdef12/Home-FC-Away-United"
+DATE = "2024-10-05"
+
+
+def _time(fn, repeat: int) -> float:
+    """Median wall time of fn over repeat runs"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def _cells(values) -> List[str]:
+    """A row as comparable strings: blank for missing, numbers without dtype
+    noise ("1,234", 1234 and 1234.0 compare equal), trailing blanks dropped"""
+    cells = []
+    for value in values:
+        if value is None or value is pd.NA or (isinstance(value, float) and math.isnan(value)):
+            value = ""
+        text = str(value)
+        try:
+            text = repr(float(text.replace(",", ""))) if text else text
+        except ValueError:
+            pass
+        cells.append(text)
+    while cells and cells[-1] == "":
+        cells.pop()
+    return cells
+
+
+def _table_diff(name: str, old_records: List[Dict], new: pd.DataFrame) -> Optional[str]:
+    """How a typed table differs from the legacy parser's records, if at all.
+
+    The legacy parser kept header rows as data and positional cells, so its
+    rows are compared cell by cell against the new over-header groups,
+    column labels and values (in column order).
+    """
+    old_rows = [_cells(record.values()) for record in old_records]
+    header = header_rows(new)
+    labels = _cells(header[-1])
+    if labels not in old_rows:
+        return f"{name}: column labels {header[-1]} not found in the legacy table"
+    label_at = old_rows.index(labels)
+    if len(header) > 1:
+        groups = [group for group in dict.fromkeys(header[0]) if group]
+        legacy_groups = [cell for cell in old_rows[label_at - 1] if cell] if label_at else []
+        if groups != legacy_groups:
+            return f"{name}: over-header groups {groups} != legacy {legacy_groups}"
+    old_data = old_rows[label_at + 1:]
+    new_data = [_cells(row) for row in new.itertuples(index=False, name=None)]
+    if len(old_data) != len(new_data):
+        return f"{name}: {len(new_data)} rows != legacy {len(old_data)}"
+    for i, (old_row, new_row) in enumerate(zip(old_data, new_data)):
+        if old_row != new_row:
+            return f"{name}: row {i} {new_row} != legacy {old_row}"
+    return None
+
+
+def _diff(old, new) -> Optional[str]:
+    """First difference between legacy and new parser output, or None"""
+    if isinstance(old, list):
+        return None if old == new else "fixtures differ"
+    if "match_info" in old:
+        for key in ("match_info", "players"):
+            if old[key] != new[key]:
+                return f"{key} differs"
+        tables = [(f"{side}/{name}", old[side][name], new[side].get(name))
+                  for side in ("home_team", "away_team") for name in old[side]]
+        if any(sorted(old[side]) != sorted(new[side]) for side in ("home_team", "away_team")):
+            return "team tables differ"
+    else:
+        if sorted(old) != sorted(new):
+            return "player tables differ"
+        tables = [(name, old[name], new[name]) for name in old]
+    for name, old_table, new_table in tables:
+        problem = _table_diff(name, old_table, new_table)
+        if problem:
+            return problem
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    scraper = MatchDataScraper(fetcher=PageFetcher())
+    fixture_scraper = FixtureScraper(fetcher=PageFetcher())
+    corpus = load_corpus()
+    warn_if_synthetic(corpus)
+    fixture_pages = corpus["fixtures"] + [("synthetic_matchday", synthetic_matchday_page())]
+    cases = [
+        # The legacy parser only knows the Big 5, so only those fixtures are compared
+        ("fixtures", page, lambda html: legacy_parse.parse_fixtures(html, DATE),
+         lambda html: [f for f in fixture_scraper.parse_fixtures(html, DATE) if f["league_id"] in legacy_parse.BIG5_LEAGUES])
+        for page in fixture_pages
+    ] + [
+        ("match", page, lambda html: legacy_parse.parse_match(html, MATCH_URL),
+         lambda html: scraper.parse_match(html, MATCH_URL))
+        for page in corpus["match"]
+    ] + [
+        ("player", page, legacy_parse.parse_player, scraper.parse_player)
+        for page in corpus["player"]
+    ]
+
+    print(f"{'page':<32} {'size':>9} {'legacy ms':>10} {'new ms':>9} {'speedup':>8}")
+    for kind, (name, html), old, new in cases:
+        problem = _diff(old(html), new(html))
+        if problem:
+            raise SystemExit(f"{name}: output differs from the legacy parser: {problem}")
+        old_time = _time(lambda: old(html), args.repeat)
+        new_time = _time(lambda: new(html), args.repeat)
+        print(f"{kind + '/' + name:<32} {len(html):>9} {old_time * 1000:>10.1f} "
+              f"{new_time * 1000:>9.1f} {old_time / new_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
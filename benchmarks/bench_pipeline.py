@@ -0,0 +1,198 @@
+"""Time each stage of the scrape-to-report pipeline on the offline corpus and
+write the results as JSON so runs can be compared across commits.
+
+    python -m benchmarks.bench_pipeline [--repeat 5] [--output results.json]
+    python -m benchmarks.bench_pipeline --compare benchmarks/results/<old>.json
+
+Stages: FixtureScraper.parse_fixtures (whole matchday page, including a
+large synthetic one), FixtureScraper._parse_league_section (per league table),
+MatchDataScraper._extract_team_data (home and away), MatchDataScraper.
+_extract_tables_from_html (player pages) and ExcelExporter.export_match_report.
+Wall time is the median of --repeat runs; peak memory is measured in a
+separate tracemalloc run so tracing does not distort the timings.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+
+from app.exporter.excel_exporter import ExcelExporter
+from app.scraper.fetchers import PageFetcher
+from app.scraper.fixtures import SCHEDULE_CONTAINERS, STATS_TABLE, FixtureScraper
+from app.scraper.match_data import MatchDataScraper
+from app.scraper.parser import parse_document
+from benchmarks.corpus import load_corpus, synthetic_matchday_page, warn_if_synthetic
+
+MATCH_URL = "/en/matches/abcdef12/Home-FC-Away-United"
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# (name, input size in bytes, work) for every benchmarked call
+Case = Tuple[str, int, Callable[[], object]]
+
+
+def _quiet(fn: Callable[[], object]) -> Callable[[], object]:
+    """Run fn with its debug prints discarded (they still cost what they cost)"""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn()
+    return run
+
+
+def build_cases(corpus: Dict[str, List[Tuple[str, str]]], output_dir: str) -> List[Case]:
+    fixture_scraper = FixtureScraper(fetcher=PageFetcher())
+    match_scraper = MatchDataScraper(fetcher=PageFetcher())
+    exporter = ExcelExporter(output_dir=output_dir)
+    cases: List[Case] = []
+
+    for name, html in corpus["fixtures"] + [("synthetic_matchday", synthetic_matchday_page())]:
+        cases.append((
+            f"fixtures.parse_fixtures/{name}", len(html),
+            lambda html=html: fixture_scraper.parse_fixtures(html, "2024-10-05")
+        ))
+
+    for name, html in corpus["fixtures"]:
+        # Section parsing is timed on its own, on tables already located in the page
+        tables = [
+            table for container in SCHEDULE_CONTAINERS(parse_document(html))
+            for table in STATS_TABLE(container)[:1]
+        ]
+        cases.append((
+            f"fixtures._parse_league_section/{name}", len(html),
+            _quiet(lambda tables=tables: [
+                fixture_scraper._parse_league_section(table, "League", "2024-10-05") for table in tables
+            ])
+        ))
+
+    for name, html in corpus["match"]:
+        root = parse_document(html)
+        cases.append((
+            f"match._extract_team_data/{name}", len(html),
+            lambda root=root: (match_scraper._extract_team_data(root, "home"),
+                               match_scraper._extract_team_data(root, "away"))
+        ))
+        match_data = match_scraper.parse_match(html, MATCH_URL)
+        cases.append((
+            f"excel.export_match_report/{name}", len(html),
+            lambda match_data=match_data: os.remove(exporter.export_match_report(match_data, {}, "bench"))
+        ))
+
+    for name, html in corpus["player"]:
+        cases.append((
+            f"player._extract_tables_from_html/{name}", len(html),
+            lambda html=html: match_scraper._extract_tables_from_html(html)
+        ))
+
+    return cases
+
+
+def measure(case: Case, repeat: int) -> Dict:
+    name, size, fn = case
+    fn()  # warm-up: imports, caches, first-call allocations
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(samples)
+    return {
+        "input_bytes": size,
+        "median_ms": round(median * 1000, 3),
+        "min_ms": round(min(samples) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3),
+        "ops_per_sec": round(1 / median, 2),
+        "mb_per_sec": round(size / median / 1e6, 2),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def commit_hash() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Names of stages whose median time or peak memory grew by more than threshold"""
+    regressions = []
+    print(f"\nvs {baseline.get('commit', '?')} ({baseline.get('timestamp', '?')})")
+    print(f"{'stage':<60} {'time':>8} {'memory':>8}")
+    for name, result in current["results"].items():
+        old = baseline.get("results", {}).get(name)
+        if not old:
+            print(f"{name:<60} {'new':>8} {'new':>8}")
+            continue
+        time_change = result["median_ms"] / old["median_ms"] - 1 if old["median_ms"] else 0.0
+        memory_change = result["peak_kb"] / old["peak_kb"] - 1 if old["peak_kb"] else 0.0
+        flag = ""
+        if time_change > threshold or memory_change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<60} {time_change:>+7.0%} {memory_change:>+7.0%}{flag}")
+    return regressions
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="JSON file to write (default: benchmarks/results/<commit>.json, git-ignored)")
+    parser.add_argument("--compare", help="earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown or memory growth reported as a regression")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        corpus = load_corpus()
+        warn_if_synthetic(corpus)
+        cases = build_cases(corpus, output_dir)
+        results = {}
+        print(f"{'stage':<60} {'size':>9} {'median ms':>10} {'ops/s':>8} {'peak KiB':>9}")
+        for case in cases:
+            result = measure(case, args.repeat)
+            results[case[0]] = result
+            print(f"{case[0]:<60} {result['input_bytes']:>9} {result['median_ms']:>10.2f} "
+                  f"{result['ops_per_sec']:>8.1f} {result['peak_kb']:>9.1f}")
+
+    report = {
+        "commit": commit_hash(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['commit']}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.threshold):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
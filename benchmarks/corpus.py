@@ -0,0 +1,274 @@
+"""Offline corpus of FBref-shaped pages for benchmarks.
+
+Real pages saved from fbref.com can be dropped into ``benchmarks/corpus/``
+as ``fixtures_*.html``, ``match_*.html`` or ``player_*.html`` and are picked
+up automatically. When a kind has no saved page, a deterministic synthetic
+page with the same structure (``all_sched_*`` containers, ``data-stat``
+cells, two-level headers, commented-out tables, and FBref's id shapes such
+as 8-hex squad ids and ``stats_<squad_id>_summary`` team tables) is
+generated instead. Synthetic pages are only as faithful as that imitation;
+benchmark on recorded pages before trusting a number.
+"""
+import glob
+import os
+import random
+import re
+import zlib
+from typing import Dict, List, Tuple
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+LEAGUES = [
+    ("9", "Premier League"), ("12", "La Liga"), ("11", "Serie A"),
+    ("20", "Bundesliga"), ("13", "Ligue 1"), ("10", "Championship"),
+    ("23", "Eredivisie"), ("32", "Primeira Liga"), ("8", "Champions League"),
+    ("22", "Major League Soccer"),
+]
+
+STAT_COLUMNS = [
+    ("", "player", "Player"), ("", "shirtnumber", "#"), ("", "nationality", "Nation"),
+    ("", "position", "Pos"), ("", "age", "Age"), ("", "minutes", "Min"),
+    ("Performance", "goals", "Gls"), ("Performance", "assists", "Ast"),
+    ("Performance", "pens_made", "PK"), ("Performance", "shots", "Sh"),
+    ("Performance", "shots_on_target", "SoT"), ("Performance", "cards_yellow", "CrdY"),
+    ("Expected", "xg", "xG"), ("Expected", "npxg", "npxG"), ("Expected", "xg_assist", "xAG"),
+    ("Passes", "passes_completed", "Cmp"), ("Passes", "passes", "Att"),
+    ("Passes", "passes_pct", "Cmp%"), ("Carries", "progressive_carries", "PrgC"),
+]
+
+
+def page_slug(url: str) -> str:
+    """File-name slug for a page URL or path, shared by the recorder and the mock server"""
+    return re.sub(r"[^A-Za-z0-9]+", "-", url.split("/en/", 1)[-1]).strip("-")[:80]
+
+
+def _squad_id(team: str) -> str:
+    """FBref-shaped 8-hex squad id, stable for a team name"""
+    return f"{zlib.crc32(team.encode()):08x}"
+
+
+def _squad_link(team: str) -> str:
+    return f"<a href=\"/en/squads/{_squad_id(team)}/{team.replace(' ', '-')}-Stats\">{team}</a>"
+
+
+def _rng(seed: str) -> random.Random:
+    return random.Random(seed)
+
+
+def _page(body: str, title: str) -> str:
+    return (
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\">"
+        f"<title>{title} | FBref.com</title>"
+        "<link rel=\"stylesheet\" href=\"/css/site.css\"><script src=\"/js/site.js\"></script>"
+        "<link rel=\"preload\" as=\"font\" href=\"/fonts/site.woff2?v=2\" crossorigin>"
+        "</head><body><div id=\"wrap\"><div id=\"header\">"
+        "<img src=\"/req/images/logo.png?v=3\" alt=\"FBref\"><img src=\"/req/images/sprite.svg?v=3\" alt=\"\">"
+        "<nav><ul>"
+        + "".join(f"<li><a href=\"/en/comps/{lid}/\">{name}</a></li>" for lid, name in LEAGUES)
+        + "</ul></nav></div><div id=\"content\" role=\"main\">"
+        + body
+        + "</div><div id=\"footer\"><p>Data provided by Opta</p></div></div></body></html>"
+    )
+
+
+def _stats_table(table_id: str, rng: random.Random, rows: int, caption: str) -> str:
+    over_headers = []
+    for group in dict.fromkeys(col[0] for col in STAT_COLUMNS):
+        span = sum(1 for col in STAT_COLUMNS if col[0] == group)
+        over_headers.append(
+            f"<th aria-label=\"\" data-stat=\"header_{group.lower() or 'blank'}\" "
+            f"colspan=\"{span}\" class=\" over_header center\">{group}</th>"
+        )
+    headers = "".join(
+        f"<th aria-label=\"{label}\" data-stat=\"{stat}\" scope=\"col\" class=\" poptip center\">{label}</th>"
+        for _, stat, label in STAT_COLUMNS
+    )
+    body = []
+    for r in range(rows):
+        cells = []
+        for _, stat, _ in STAT_COLUMNS:
+            if stat == "player":
+                pid = f"{rng.getrandbits(32):08x}"
+                cells.append(
+                    f"<th scope=\"row\" class=\"left\" data-append-csv=\"{pid}\" data-stat=\"player\">"
+                    f"<a href=\"/en/players/{pid}/Player-{pid}\">Player {pid}</a></th>"
+                )
+            elif stat == "nationality":
+                cells.append(
+                    f"<td class=\"left\" data-stat=\"nationality\"><a href=\"/en/country/ENG/\">"
+                    f"<span class=\"f-i f-eng\">eng</span> ENG</a></td>"
+                )
+            elif stat == "position":
+                cells.append(f"<td class=\"center\" data-stat=\"position\">{rng.choice(['FW', 'MF', 'DF', 'GK'])}</td>")
+            elif stat == "age":
+                cells.append(f"<td class=\"center\" data-stat=\"age\">{rng.randint(18, 36)}-{rng.randint(0, 364):03d}</td>")
+            elif stat in ("xg", "npxg", "xg_assist"):
+                cells.append(f"<td class=\"right\" data-stat=\"{stat}\">{rng.random():.1f}</td>")
+            elif stat == "passes_pct":
+                cells.append(f"<td class=\"right\" data-stat=\"{stat}\">{rng.uniform(50, 100):.1f}</td>")
+            elif stat == "minutes":
+                cells.append(f"<td class=\"right\" data-stat=\"{stat}\">{rng.randint(1, 90)}</td>")
+            else:
+                cells.append(f"<td class=\"right\" data-stat=\"{stat}\">{rng.randint(0, 60)}</td>")
+        body.append("<tr>" + "".join(cells) + "</tr>")
+    return (
+        f"<table class=\"stats_table sortable min_width\" id=\"{table_id}\" data-cols-to-freeze=\",1\">"
+        f"<caption>{caption}</caption>"
+        f"<thead><tr class=\"over_header\">{''.join(over_headers)}</tr><tr>{headers}</tr></thead>"
+        f"<tbody>{''.join(body)}</tbody>"
+        f"<tfoot><tr><th scope=\"row\" data-stat=\"player\">{rows} Players</th></tr></tfoot>"
+        "</table>"
+    )
+
+
+def _competitions(count: int) -> List[Tuple[str, str]]:
+    """The named leagues, then made-up competitions once those run out"""
+    extra = [(str(1000 + i), f"Competition {i}") for i in range(max(count - len(LEAGUES), 0))]
+    return (LEAGUES + extra)[:count]
+
+
+def synthetic_fixtures_page(leagues: int = 10, matches_per_league: int = 10, seed: str = "fixtures") -> str:
+    rng = _rng(seed)
+    sections = []
+    for lid, name in _competitions(leagues):
+        rows = []
+        for m in range(matches_per_league):
+            match_id = f"{rng.getrandbits(32):08x}"
+            home, away = f"{name} Home {m}", f"{name} Away {m}"
+            finished = rng.random() < 0.6
+            score = f"{rng.randint(0, 4)}&ndash;{rng.randint(0, 4)}" if finished else ""
+            report = (
+                f"<a href=\"/en/matches/{match_id}/{home.replace(' ', '-')}-{away.replace(' ', '-')}\">Match Report</a>"
+                if finished else
+                f"<a href=\"/en/stathead/matchup/teams/{match_id}/x\">Head-to-Head</a>"
+            )
+            rows.append(
+                "<tr>"
+                f"<th scope=\"row\" class=\"left\" data-stat=\"round\">Matchweek {m + 1}</th>"
+                f"<td class=\"left\" data-stat=\"dayofweek\">Sat</td>"
+                f"<td class=\"right\" data-stat=\"start_time\"><span class=\"venuetime\">{12 + m % 9}:00</span></td>"
+                f"<td class=\"right\" data-stat=\"home_team\">{_squad_link(home)}</td>"
+                f"<td class=\"right\" data-stat=\"home_xg\">{rng.random() * 3:.1f}</td>"
+                f"<td class=\"center\" data-stat=\"score\"><a href=\"/en/matches/{match_id}/\">{score}</a></td>"
+                f"<td class=\"right\" data-stat=\"away_xg\">{rng.random() * 3:.1f}</td>"
+                f"<td class=\"left\" data-stat=\"away_team\">{_squad_link(away)}</td>"
+                f"<td class=\"right\" data-stat=\"attendance\">{rng.randint(5, 80)},{rng.randint(100, 999)}</td>"
+                f"<td class=\"left\" data-stat=\"venue\">Stadium {m}</td>"
+                f"<td class=\"left\" data-stat=\"referee\">Referee {m}</td>"
+                f"<td class=\"left\" data-stat=\"match_report\">{report}</td>"
+                f"<td class=\"left\" data-stat=\"notes\"></td>"
+                "</tr>"
+            )
+            if m and m % 5 == 0:
+                rows.append("<tr class=\"spacer partial_table\"><td colspan=\"13\"></td></tr>")
+        table = (
+            f"<table class=\"stats_table sortable min_width\" id=\"sched_2024-2025_{lid}_1\">"
+            "<thead><tr>"
+            + "".join(
+                f"<th data-stat=\"{stat}\" scope=\"col\">{label}</th>" for stat, label in [
+                    ("round", "Round"), ("dayofweek", "Day"), ("start_time", "Time"),
+                    ("home_team", "Home"), ("home_xg", "xG"), ("score", "Score"),
+                    ("away_xg", "xG"), ("away_team", "Away"), ("attendance", "Attendance"),
+                    ("venue", "Venue"), ("referee", "Referee"), ("match_report", "Match Report"),
+                    ("notes", "Notes"),
+                ]
+            )
+            + "</tr></thead><tbody>" + "".join(rows) + "</tbody></table>"
+        )
+        sections.append(
+            f"<div id=\"all_sched_2024-2025_{lid}_1\" class=\"table_wrapper\">"
+            f"<div class=\"section_heading\"><h2><a href=\"/en/comps/{lid}/\">{name}</a></h2></div>"
+            f"<div class=\"table_container\" id=\"div_sched_2024-2025_{lid}_1\">{table}</div></div>"
+        )
+    return _page("<h1>Football Scores &amp; Fixtures</h1>" + "".join(sections), "Football Scores & Fixtures")
+
+
+def synthetic_match_page(seed: str = "match", players_per_side: int = 16) -> str:
+    rng = _rng(seed)
+    scorebox = (
+        "<div class=\"scorebox\">"
+        f"<div><strong>{_squad_link('Home FC')}</strong>"
+        f"<div class=\"scores\"><div class=\"score\">{rng.randint(0, 4)}</div></div></div>"
+        f"<div><strong>{_squad_link('Away United')}</strong>"
+        f"<div class=\"scores\"><div class=\"score\">{rng.randint(0, 4)}</div></div></div>"
+        "<div class=\"scorebox_meta\"><span class=\"venuetime\" data-venue-date=\"2024-08-17\" "
+        "data-venue-time=\"15:00\">15:00</span></div></div>"
+    )
+    sections = [scorebox]
+    for team in ("Home FC", "Away United"):
+        squad_id = _squad_id(team)
+        for kind in ("summary", "passing", "passing_types", "defense", "possession", "misc"):
+            table_id = f"stats_{squad_id}_{kind}"
+            table = _stats_table(table_id, rng, players_per_side, f"{team} Player Stats Table")
+            wrapper = f"<div class=\"table_wrapper\" id=\"all_{table_id}\"><div class=\"table_container\" id=\"div_{table_id}\">"
+            if kind == "summary":
+                sections.append(wrapper + table + "</div></div>")
+            else:
+                sections.append(wrapper + f"<!--\n{table}\n-->" + "</div></div>")
+        sections.append(
+            f"<div id=\"all_keeper_stats_{squad_id}\"><!--\n"
+            + _stats_table(f"keeper_stats_{squad_id}", rng, 1, f"{team} Goalkeeper Stats Table")
+            + "\n--></div>"
+        )
+    sections.append(
+        "<div id=\"all_shots\"><!--\n" + _stats_table("shots_all", rng, 25, "Shots Table")
+        + "".join(_stats_table(f"shots_{_squad_id(team)}", rng, 12, f"{team} Shots Table")
+                  for team in ("Home FC", "Away United"))
+        + "\n--></div>"
+    )
+    return _page("".join(sections), "Home FC vs. Away United Match Report")
+
+
+def synthetic_player_page(seed: str = "player", seasons: int = 10) -> str:
+    rng = _rng(seed)
+    sections = [
+        "<div id=\"meta\"><h1><span>Player Name</span></h1>"
+        "<p><strong>Position:</strong> FW</p></div>",
+        "<div class=\"table_wrapper\" id=\"all_stats_standard\">"
+        + _stats_table("stats_standard_dom_lg", rng, seasons, "Standard Stats") + "</div>",
+    ]
+    for kind in ("shooting", "passing", "passing_types", "gca", "defense", "possession", "playing_time", "misc"):
+        sections.append(
+            f"<div class=\"table_wrapper\" id=\"all_stats_{kind}\"><!--\n"
+            + _stats_table(f"stats_{kind}_dom_lg", rng, seasons, kind.title())
+            + "\n--></div>"
+        )
+    return _page("".join(sections), "Player Name Stats")
+
+
+def synthetic_matchday_page() -> str:
+    """A busy Saturday: 60 competitions with 20 matches each"""
+    return synthetic_fixtures_page(leagues=60, matches_per_league=20, seed="matchday")
+
+
+_GENERATORS = {
+    "fixtures": synthetic_fixtures_page,
+    "match": synthetic_match_page,
+    "player": synthetic_player_page,
+}
+
+
+def synthetic_kinds(corpus: Dict[str, List[Tuple[str, str]]]) -> List[str]:
+    """Page kinds with no saved real page, benchmarked on generated pages only"""
+    return [kind for kind, pages in corpus.items() if all(name.startswith("synthetic_") for name, _ in pages)]
+
+
+def warn_if_synthetic(corpus: Dict[str, List[Tuple[str, str]]]):
+    kinds = synthetic_kinds(corpus)
+    if kinds:
+        print(f"note: no saved {'/'.join(kinds)} pages in {CORPUS_DIR}; those results come from "
+              "synthetic pages (python -m benchmarks.record saves real ones)\n")
+
+
+def load_corpus() -> Dict[str, List[Tuple[str, str]]]:
+    """Pages by kind as (name, html) pairs, preferring saved real pages"""
+    corpus = {}
+    for kind, generator in _GENERATORS.items():
+        pages = []
+        for path in sorted(glob.glob(os.path.join(CORPUS_DIR, f"{kind}_*.html"))):
+            with open(path, encoding="utf-8") as f:
+                pages.append((os.path.basename(path), f.read()))
+        if not pages:
+            pages.append((f"synthetic_{kind}", generator()))
+        corpus[kind] = pages
+    return corpus
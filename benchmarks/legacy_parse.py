@@ -0,0 +1,184 @@
+"""The BeautifulSoup/html.parser extraction path the scrapers used before
+the lxml parse-once document model, and the Big-5-only fixtures parser with
+per-cell row lookups, kept as benchmark baselines."""
+import re
+from typing import Dict, List, Optional
+
+import pandas as pd
+from bs4 import BeautifulSoup, Comment
+
+
+BIG5_LEAGUES = {
+    "9": "Premier League", "12": "La Liga", "11": "Serie A",
+    "20": "Bundesliga", "13": "Ligue 1"
+}
+
+
+def parse_fixtures(html_content: str, date: str, league: Optional[str] = None) -> List[Dict]:
+    soup = BeautifulSoup(html_content, 'lxml')
+    fixtures = []
+    for container in soup.find_all('div', id=lambda x: x and x.startswith('all_sched_')):
+        container_id = container.get('id', '')
+        league_id = None
+        for lid in BIG5_LEAGUES.keys():
+            if f"_{lid}" in container_id.split("sched_")[-1]:
+                league_id = lid
+                break
+        if not league_id:
+            header = container.find('h2')
+            if header:
+                header_text = header.get_text(strip=True)
+                for lid, name in BIG5_LEAGUES.items():
+                    if name.lower() in header_text.lower():
+                        league_id = lid
+                        break
+        if not league_id or (league and league != league_id):
+            continue
+        table = container.find('table', class_='stats_table')
+        if not table or not table.find('tbody'):
+            continue
+        for row in table.find('tbody').find_all('tr'):
+            fixture = _parse_fixture_row(row, BIG5_LEAGUES[league_id], date)
+            if fixture:
+                fixture['league_id'] = league_id
+                fixtures.append(fixture)
+    return fixtures
+
+
+def _parse_fixture_row(row, league_name: str, date: str) -> Optional[Dict]:
+    time_cell = row.find('td', {'data-stat': 'start_time'})
+    home_cell = row.find('td', {'data-stat': 'home_team'})
+    away_cell = row.find('td', {'data-stat': 'away_team'})
+    score_cell = row.find('td', {'data-stat': 'score'})
+    match_report_cell = row.find('td', {'data-stat': 'match_report'})
+    match_time = time_cell.get_text(strip=True) if time_cell else ''
+    home_team, home_url = _team(home_cell)
+    away_team, away_url = _team(away_cell)
+    score = score_cell.get_text(strip=True) if score_cell else ''
+    if not home_team or not away_team or home_team == 'Home' or away_team == 'Away':
+        return None
+    match_url = None
+    if match_report_cell:
+        report_link = match_report_cell.find('a')
+        if report_link and report_link.get('href'):
+            href = report_link['href']
+            if href and ('/matches/' in href or '/stathead/matchup' in href):
+                match_url = href
+    return {
+        'league': league_name, 'date': date, 'time': match_time,
+        'home_team': home_team, 'away_team': away_team, 'score': score,
+        'home_team_url': home_url, 'away_team_url': away_url, 'match_url': match_url,
+        'match_id': match_url.split('/')[-2] if match_url else f"{home_team}_{away_team}_{date}".replace(' ', '_')
+    }
+
+
+def _team(cell):
+    if not cell:
+        return '', None
+    link = cell.find('a')
+    if link:
+        return link.get_text(strip=True), link.get('href')
+    return cell.get_text(strip=True), None
+
+
+def parse_match(html_content: str, match_url: str) -> Dict:
+    soup = BeautifulSoup(html_content, 'html.parser')
+    return {
+        'match_info': _extract_match_info(soup, match_url),
+        'home_team': _extract_team_data(soup, 'home'),
+        'away_team': _extract_team_data(soup, 'away'),
+        'players': _extract_player_ids(soup)
+    }
+
+
+def parse_player(html_content: str) -> Dict:
+    BeautifulSoup(html_content, 'html.parser')
+    player_data = {}
+    for i, table_df in enumerate(extract_tables_from_html(html_content)):
+        if not table_df.empty:
+            player_data[f"player_table_{i}"] = table_df.to_dict('records')
+    return player_data
+
+
+def _extract_match_info(soup: BeautifulSoup, match_url: str) -> Dict:
+    match_info = {'url': match_url, 'match_id': match_url.split('/')[-2]}
+    teams = []
+    for element in soup.find_all('a', href=re.compile(r'/en/squads/')):
+        team_name = element.get_text(strip=True)
+        if team_name and team_name not in teams:
+            teams.append(team_name)
+            match_info[f'team_{len(teams)}'] = team_name
+            match_info[f'team_{len(teams)}_url'] = element.get('href')
+    return match_info
+
+
+def _extract_team_data(soup: BeautifulSoup, team_side: str) -> Dict:
+    # Sides are told apart by squad id, as the scraper does (FBref has no _home/_away ids)
+    team_data = {}
+    scorebox = soup.find('div', class_='scorebox') or soup
+    squad_ids = []
+    for link in scorebox.find_all('a', href=re.compile(r'/en/squads/[0-9a-f]{8}(/|$)')):
+        squad_id = link['href'].split('/')[3]
+        if squad_id not in squad_ids:
+            squad_ids.append(squad_id)
+    index = 0 if team_side == 'home' else 1
+    if index >= len(squad_ids):
+        return team_data
+    team_tables = soup.find_all('table', id=re.compile(f'(^|_){squad_ids[index]}(_|$)'))
+    for i, table in enumerate(team_tables):
+        table_id = table.get('id', f'unknown_{i}')
+        for j, table_df in enumerate(extract_tables_from_html(str(table))):
+            if not table_df.empty:
+                team_data[f"{team_side}_{table_id}_{j}"] = table_df.to_dict('records')
+    return team_data
+
+
+def _extract_player_ids(soup: BeautifulSoup) -> List[Dict]:
+    players = []
+    for link in soup.find_all('a', href=re.compile(r'/en/players/')):
+        href = link.get('href')
+        if href and 'matchlogs' not in href:
+            player_id = href.split('/')[-2]
+            player_name = link.get_text(strip=True)
+            if (player_id and player_name and
+                    player_id not in [p['id'] for p in players] and
+                    len(player_name) > 1):
+                players.append({'id': player_id, 'name': player_name, 'url': href})
+    return players[:22]
+
+
+def extract_tables_from_html(html_content: str) -> List[pd.DataFrame]:
+    soup = BeautifulSoup(html_content, 'html.parser')
+    tables_data = []
+    for table in soup.find_all('table'):
+        df = _parse_html_table(table)
+        if df is not None and not df.empty:
+            tables_data.append(df)
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment_soup = BeautifulSoup(comment, 'html.parser')
+        for table in comment_soup.find_all('table'):
+            df = _parse_html_table(table)
+            if df is not None and not df.empty:
+                tables_data.append(df)
+    return tables_data
+
+
+def _parse_html_table(table) -> pd.DataFrame:
+    headers = []
+    header_row = table.find('thead')
+    if header_row:
+        for th in header_row.find_all('th'):
+            header_text = th.get_text(strip=True)
+            if header_text:
+                headers.append(header_text)
+    rows = []
+    for tr in table.find_all('tr'):
+        cells = tr.find_all(['td', 'th'])
+        if cells:
+            rows.append([cell.get_text(strip=True) for cell in cells])
+    if headers and rows:
+        max_cols = max(len(row) for row in rows)
+        if len(headers) < max_cols:
+            headers.extend([f'Unnamed_{i}' for i in range(len(headers), max_cols)])
+        return pd.DataFrame(rows, columns=headers[:max_cols])
+    return pd.DataFrame()
@@ -0,0 +1,143 @@
+"""Drive the running API at several concurrency levels and report latency
+percentiles and throughput.
+
+    python -m benchmarks.load_test --api http://127.0.0.1:8000 \\
+        --scenario report --concurrency 1,4,16 --requests 40
+
+Run the API against benchmarks/mock_fbref.py, not fbref.com. The fixtures
+scenario requests /api/fixtures for a distinct date each time, so every
+request scrapes a page instead of hitting the warehouse or single-flight.
+The report scenario posts /api/generate-report for a fresh match id and
+polls /api/progress until the job finishes; its latency is submit to
+completion, and throughput is finished jobs per minute.
+"""
+import argparse
+import json
+import math
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date as date_cls, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+
+FINISHED_STATUSES = ("completed", "error", "stopped")
+
+# (succeeded, outcome label) of one request or job
+Outcome = Tuple[bool, str]
+
+
+def percentile(samples: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class LoadTest:
+    def __init__(self, api: str, timeout: float = 600, poll_interval: float = 0.5,
+                 export_format: Optional[str] = None, start_date: str = "2024-10-05"):
+        self.api = api.rstrip("/")
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.export_format = export_format
+        self.start_date = date_cls.fromisoformat(start_date)
+        self.session = requests.Session()
+        self._dates_used = 0
+
+    def fixtures_request(self, index: int) -> Outcome:
+        day = self.start_date - timedelta(days=self._dates_used + index)
+        response = self.session.get(f"{self.api}/api/fixtures", params={"date": day.isoformat()},
+                                    timeout=self.timeout)
+        if response.status_code != 200:
+            return False, f"http {response.status_code}"
+        return True, response.json().get("source", "scrape")
+
+    def report_job(self, index: int) -> Outcome:
+        match_id = secrets.token_hex(4)
+        body = {"match_url": f"/en/matches/{match_id}/Load-Test-Match", "match_id": match_id}
+        if self.export_format:
+            body["format"] = self.export_format
+        response = self.session.post(f"{self.api}/api/generate-report", json=body, timeout=30)
+        if response.status_code != 200:
+            return False, f"http {response.status_code}"
+
+        task_id = response.json()["task_id"]
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            progress = self.session.get(f"{self.api}/api/progress/{task_id}", timeout=30).json()
+            if progress["status"] in FINISHED_STATUSES:
+                return progress["status"] == "completed", progress["status"]
+        return False, "timeout"
+
+    def run_level(self, work: Callable[[int], Outcome], concurrency: int, count: int) -> Dict:
+        def timed(index: int) -> Tuple[float, Outcome]:
+            started = time.monotonic()
+            try:
+                outcome = work(index)
+            except requests.RequestException as e:
+                outcome = (False, type(e).__name__)
+            return time.monotonic() - started, outcome
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(timed, range(count)))
+        wall = time.monotonic() - started
+        self._dates_used += count
+
+        latencies = [elapsed for elapsed, (ok, _) in results if ok]
+        outcomes: Dict[str, int] = {}
+        for _, (_, label) in results:
+            outcomes[label] = outcomes.get(label, 0) + 1
+        return {
+            "concurrency": concurrency,
+            "requests": count,
+            "succeeded": len(latencies),
+            "outcomes": outcomes,
+            "wall_seconds": round(wall, 2),
+            "p50_ms": _ms(percentile(latencies, 50)),
+            "p95_ms": _ms(percentile(latencies, 95)),
+            "p99_ms": _ms(percentile(latencies, 99)),
+            "per_minute": round(len(latencies) / wall * 60, 2),
+        }
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--api", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenario", choices=("fixtures", "report"), default="report")
+    parser.add_argument("--concurrency", default="1,4,16", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=40, help="requests or jobs per level")
+    parser.add_argument("--format", help="report format for the report scenario")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds before a job counts as timed out")
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    test = LoadTest(args.api, timeout=args.timeout, export_format=args.format)
+    work = test.fixtures_request if args.scenario == "fixtures" else test.report_job
+    unit = "req/min" if args.scenario == "fixtures" else "jobs/min"
+
+    levels = []
+    print(f"{'conc':>5} {'ok':>9} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {unit:>10}  outcomes")
+    for concurrency in (int(level) for level in args.concurrency.split(",")):
+        result = test.run_level(work, concurrency, args.requests)
+        levels.append(result)
+        print(f"{concurrency:>5} {result['succeeded']:>4}/{result['requests']:<4} "
+              f"{result['p50_ms'] or 0:>10.1f} {result['p95_ms'] or 0:>10.1f} {result['p99_ms'] or 0:>10.1f} "
+              f"{result['per_minute']:>10.2f}  {result['outcomes']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"api": args.api, "scenario": args.scenario, "levels": levels}, f, indent=2)
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Local stand-in for fbref.com that replays corpus pages for load tests.
+
+    python -m benchmarks.mock_fbref --port 8001 --latency 0.3 --jitter 0.1 \\
+        --error-rate 0.02 --throttle-rate 0.02 --requests-per-minute 600
+
+Point the app at it with ``scraper.base_url: "http://127.0.0.1:8001"`` in
+config/settings.yaml. Paths are routed by page type (date fixtures pages,
+match reports, player pages); a page recorded for the exact path with
+benchmarks/record.py is served when present, otherwise a corpus page of the
+same type is picked deterministically from the path. Every response is
+delayed by latency +/- jitter seconds; error-rate and throttle-rate inject
+random 500 and 429 responses, and requests beyond requests-per-minute get
+429 with Retry-After like the real site. Static asset paths (images, fonts,
+media, css, js) get a filler body after the same delay and are counted as
+"asset", so browser runs show what resource blocking saves. GET /__stats
+returns counters.
+"""
+import argparse
+import json
+import mimetypes
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.corpus import CORPUS_DIR, load_corpus, page_slug
+
+# Page type served for each FBref path shape
+ROUTES = [
+    (re.compile(r"^/en/matches/\d{4}-\d{2}-\d{2}/?$"), "fixtures"),
+    (re.compile(r"^/en/matches/[0-9a-f]{8}(/|$)"), "match"),
+    (re.compile(r"^/en/players/[0-9a-f]{8}(/|$)"), "player"),
+]
+
+# Static assets: served (after the same latency) so a browser that does not
+# block them really waits for them, and counted so blocking can be verified
+ASSET_RE = re.compile(r"\.(css|js|png|jpe?g|gif|svg|webp|ico|woff2?|ttf|otf|mp4|webm)$")
+ASSET_BYTES = 20_000
+
+NOT_FOUND_PAGE = "<html><head><title>Page Not Found | FBref.com</title></head><body>404</body></html>"
+ERROR_PAGE = "<html><head><title>Error | FBref.com</title></head><body>Internal error</body></html>"
+THROTTLED_PAGE = "<html><head><title>Too Many Requests</title></head><body>Rate limited</body></html>"
+
+
+class MockFBref:
+    """Routing, fault injection and counters behind the mock server"""
+
+    def __init__(self, corpus: Dict[str, List[Tuple[str, str]]] = None, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, throttle_rate: float = 0.0,
+                 requests_per_minute: float = 0, retry_after: int = 60, seed: Optional[int] = None):
+        self.corpus = corpus or load_corpus()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.requests_per_minute = requests_per_minute
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.statuses = Counter()
+        self.kinds = Counter()
+        self._recent = deque()
+        self._lock = threading.Lock()
+
+    def page_for(self, path: str) -> Tuple[Optional[str], Optional[str]]:
+        """(page type, html) for a request path; (None, None) when it is not routed"""
+        for pattern, kind in ROUTES:
+            if pattern.match(path):
+                recorded = os.path.join(CORPUS_DIR, f"{kind}_{page_slug(path)}.html")
+                if os.path.exists(recorded):
+                    with open(recorded, encoding="utf-8") as f:
+                        return kind, f.read()
+                pages = self.corpus[kind]
+                return kind, pages[zlib.crc32(path.encode()) % len(pages)][1]
+        return None, None
+
+    def _over_budget(self) -> bool:
+        if not self.requests_per_minute:
+            return False
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] > 60:
+            self._recent.popleft()
+        if len(self._recent) >= self.requests_per_minute:
+            return True
+        self._recent.append(now)
+        return False
+
+    def respond(self, path: str) -> Tuple[int, Dict[str, str], str]:
+        """Status, extra headers and body for a request path"""
+        with self._lock:
+            delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+            roll = self.random.random()
+            over_budget = self._over_budget()
+        time.sleep(delay)
+
+        if over_budget or roll < self.throttle_rate:
+            status, headers, body = 429, {"Retry-After": str(self.retry_after)}, THROTTLED_PAGE
+        elif roll < self.throttle_rate + self.error_rate:
+            status, headers, body = 500, {}, ERROR_PAGE
+        else:
+            kind, html = self.page_for(path)
+            if html is None and ASSET_RE.search(path):
+                kind, html = "asset", " " * ASSET_BYTES
+            if html is None:
+                status, headers, body = 404, {}, NOT_FOUND_PAGE
+            else:
+                status, headers, body = 200, {}, html
+                with self._lock:
+                    self.kinds[kind] += 1
+
+        with self._lock:
+            self.statuses[status] += 1
+        return status, headers, body
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "requests": sum(self.statuses.values()),
+                "statuses": dict(self.statuses),
+                "pages": dict(self.kinds),
+            }
+
+
+class MockFBrefHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    verbose = False
+
+    def do_GET(self):
+        mock: MockFBref = self.server.mock
+        path = self.path.split("?", 1)[0]
+        if path == "/__stats":
+            status, headers, body = 200, {}, json.dumps(mock.stats())
+            content_type = "application/json"
+        else:
+            status, headers, body = mock.respond(path)
+            content_type = "text/html; charset=utf-8"
+            if status == 200 and ASSET_RE.search(path):
+                content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(mock: MockFBref, host: str = "127.0.0.1", port: int = 8001) -> ThreadingHTTPServer:
+    """Threaded HTTP server for the mock; port 0 picks a free port"""
+    server = ThreadingHTTPServer((host, port), MockFBrefHandler)
+    server.daemon_threads = True
+    server.mock = mock
+    return server
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.2, help="mean response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.1, help="+/- seconds around the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of requests answered 429")
+    parser.add_argument("--requests-per-minute", type=float, default=0,
+                        help="budget beyond which requests get 429 (0 = unlimited)")
+    parser.add_argument("--retry-after", type=int, default=60)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    MockFBrefHandler.verbose = args.verbose
+    mock = MockFBref(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                     throttle_rate=args.throttle_rate, requests_per_minute=args.requests_per_minute,
+                     retry_after=args.retry_after, seed=args.seed)
+    server = make_server(mock, args.host, args.port)
+    print(f"Mock FBref serving {', '.join(f'{k}: {len(v)}' for k, v in mock.corpus.items())} "
+          f"pages on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(mock.stats()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Save live FBref pages into the benchmark corpus.
+
+    python -m benchmarks.record fixtures /en/matches/2024-10-05
+    python -m benchmarks.record match /en/matches/cc5b4244/Arsenal-Southampton-October-5-2024-Premier-League
+    python -m benchmarks.record player /en/players/bc7dc64d/Bukayo-Saka
+
+Pages are fetched through the scraper's normal fetcher (rate limit, page
+cache, Selenium fallback) and written to benchmarks/corpus/<kind>_<slug>.html,
+where load_corpus() picks them up instead of the synthetic pages and the
+mock server (benchmarks/mock_fbref.py) replays them for the same path.
+"""
+import argparse
+import os
+
+from app.config import settings
+from app.scraper.fetchers import get_fetcher
+from benchmarks.corpus import CORPUS_DIR, page_slug
+
+KINDS = ("fixtures", "match", "player")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("kind", choices=KINDS)
+    parser.add_argument("path", help="FBref path or full URL")
+    parser.add_argument("--base-url", default=settings.SCRAPER_BASE_URL)
+    args = parser.parse_args(argv)
+
+    url = args.path if args.path.startswith("http") else f"{args.base_url}{args.path}"
+    page = get_fetcher().fetch(url, page_type=args.kind)
+
+    slug = page_slug(url)
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    path = os.path.join(CORPUS_DIR, f"{args.kind}_{slug}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(page.html)
+    print(f"Saved {len(page.html)} chars via {page.engine} to {path}")
+
+
+if __name__ == "__main__":
+    main()
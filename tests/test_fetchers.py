@@ -0,0 +1,88 @@
+import pytest
+
+from app.scraper import fetchers
+from app.scraper.rate_limit import HostRateLimiter
+from app.scraper.fetchers import FallbackFetcher, FetchResult, HttpFetcher, HttpStatusError, PageFetcher
+
+PAGE = "<html><body><div id=\"content\"><table></table></div></body></html>"
+
+
+class FakeResponse:
+    def __init__(self, status, text=PAGE, headers=None):
+        self.status_code = status
+        self.text = text
+        self.content = text.encode()
+        self.headers = headers or {}
+
+
+class FakeSession:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls += 1
+        return FakeResponse(self.statuses.pop(0))
+
+
+@pytest.fixture
+def http(monkeypatch):
+    # A private, unthrottled limiter: no waiting, no effect on the shared one
+    monkeypatch.setattr(fetchers, "rate_limiter", HostRateLimiter(requests_per_minute=60000, burst=100))
+    fetcher = HttpFetcher()
+    monkeypatch.setattr(fetcher.anti_bot, "exponential_backoff", lambda attempt: None)
+    return fetcher
+
+
+def test_ok_response_is_returned(http):
+    http.session = FakeSession([200])
+    result = http.fetch("https://fbref.test/en/matches/2024-10-05", "fixtures")
+    assert result.status == 200 and result.html == PAGE
+
+
+@pytest.mark.parametrize("status", [403, 404, 410])
+def test_client_errors_raise(http, status):
+    http.session = FakeSession([status])
+    with pytest.raises(HttpStatusError) as raised:
+        http.fetch("https://fbref.test/en/matches/missing", "match")
+    assert raised.value.status == status
+    assert http.session.calls == 1
+
+
+def test_retryable_status_raises_once_retries_are_used_up(http):
+    http.session = FakeSession([503] * (http.anti_bot.max_retries + 1))
+    with pytest.raises(HttpStatusError):
+        http.fetch("https://fbref.test/en/matches/busy", "match")
+    assert http.session.calls == http.anti_bot.max_retries + 1
+
+
+def test_retryable_status_recovers(http):
+    http.session = FakeSession([429, 200])
+    assert http.fetch("https://fbref.test/en/matches/ok", "match").status == 200
+
+
+class Browser(PageFetcher):
+    engine = "selenium"
+
+    def __init__(self):
+        self.calls = 0
+
+    def fetch(self, url, page_type="page", headers=None):
+        self.calls += 1
+        return FetchResult(url=url, html=PAGE, engine=self.engine)
+
+
+def test_fallback_takes_over_after_a_challenge_status(http):
+    http.session = FakeSession([403])
+    result = FallbackFetcher(primary=http, fallback=Browser()).fetch("https://fbref.test/en/x", "match")
+    assert result.engine == "selenium"
+
+
+@pytest.mark.parametrize("status", [404, 410])
+def test_fallback_is_skipped_for_other_error_statuses(http, status):
+    http.session = FakeSession([status])
+    browser = Browser()
+    with pytest.raises(HttpStatusError) as raised:
+        FallbackFetcher(primary=http, fallback=browser).fetch("https://fbref.test/en/gone", "match")
+    assert raised.value.status == status
+    assert browser.calls == 0
@@ -0,0 +1,84 @@
+import pytest
+
+from app.scraper.fetchers import PageFetcher
+from app.scraper.fixtures import CONTAINER_ID_RE, FixtureScraper
+from app.scraper.parser import parse_document
+from benchmarks.corpus import synthetic_fixtures_page
+
+DATE = "2024-10-05"
+
+
+@pytest.fixture
+def scraper():
+    return FixtureScraper(fetcher=PageFetcher(), base_url="https://fbref.test")
+
+
+def _section(container_id: str, heading: str, rows: int = 1) -> str:
+    body = "".join(
+        f"<tr><td data-stat=\"start_time\">15:00</td>"
+        f"<td data-stat=\"home_team\"><a href=\"/en/squads/h{i}/\">Home {i}</a></td>"
+        f"<td data-stat=\"score\">1&ndash;0</td>"
+        f"<td data-stat=\"away_team\"><a href=\"/en/squads/a{i}/\">Away {i}</a></td>"
+        f"<td data-stat=\"match_report\"><a href=\"/en/matches/m{i}{container_id[-3:]}/x\">Match Report</a></td></tr>"
+        for i in range(rows)
+    )
+    return (f"<div id=\"{container_id}\"><div class=\"section_heading\"><h2>{heading}</h2></div>"
+            f"<table class=\"stats_table\"><tbody>{body}</tbody></table></div>")
+
+
+def _page(*sections: str) -> str:
+    return f"<html><body><div id=\"content\">{''.join(sections)}</div></body></html>"
+
+
+@pytest.mark.parametrize("container_id, league_id", [
+    ("all_sched_2024-2025_9_1", "9"),
+    ("all_sched_2025_22_1", "22"),
+    ("all_sched_9_1", "9"),
+    ("all_sched_9", "9"),
+    ("all_sched_882", "882"),
+])
+def test_container_id_shapes(container_id, league_id):
+    assert CONTAINER_ID_RE.match(container_id).group(1) == league_id
+
+
+@pytest.mark.parametrize("container_id", ["all_sched_", "all_sched_results", "sched_2024-2025_9_1"])
+def test_container_ids_without_a_league(container_id):
+    assert CONTAINER_ID_RE.match(container_id) is None
+
+
+def test_league_from_heading_link_when_the_id_has_none(scraper):
+    section = _section("all_sched_odd", "<a href=\"/en/comps/12/La-Liga-Stats\">La Liga</a>")
+    container = parse_document(_page(section)).get_element_by_id("all_sched_odd")
+    assert scraper._extract_league_id(container) == "12"
+
+
+def test_league_from_heading_name_when_there_is_no_link(scraper):
+    section = _section("all_sched_odd", "2024-2025 Premier League")
+    container = parse_document(_page(section)).get_element_by_id("all_sched_odd")
+    assert scraper._extract_league_id(container) == "9"
+
+
+def test_unknown_competition_is_named_after_its_heading(scraper):
+    html = _page(_section("all_sched_2024-2025_9999_1", "2024-2025 Some Cup", rows=2))
+    fixtures = scraper.parse_fixtures(html, DATE)
+    assert [(f["league_id"], f["league"]) for f in fixtures] == [("9999", "Some Cup")] * 2
+
+
+def test_big5_fixture_discovery(scraper):
+    fixtures = scraper.parse_fixtures(synthetic_fixtures_page(), DATE)
+    leagues = {f["league"] for f in fixtures}
+    assert {"Premier League", "La Liga", "Serie A", "Bundesliga", "Ligue 1"} <= leagues
+    # Competitions beyond the Big 5 are returned too
+    assert "Champions League" in leagues and len(fixtures) == 100
+
+    premier = scraper.parse_fixtures(synthetic_fixtures_page(), DATE, league="9")
+    assert len(premier) == 10 and {f["league_id"] for f in premier} == {"9"}
+    first = premier[0]
+    assert first["home_team"] == "Premier League Home 0" and first["time"] == "12:00"
+    assert first["date"] == DATE and first["match_id"]
+
+
+def test_rows_without_teams_are_skipped(scraper):
+    html = _page(_section("all_sched_2024-2025_9_1", "Premier League", rows=1).replace(
+        "<tbody>", "<tbody><tr class=\"spacer\"><td colspan=\"5\"></td></tr>"))
+    assert len(scraper.parse_fixtures(html, DATE)) == 1
@@ -0,0 +1,112 @@
+import time
+
+import pytest
+
+from app.config import settings
+from app.services.job_queue import JobQueue
+
+MATCH_URL = "/en/matches/abcdef12/Home-FC-Away-United"
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "QUEUE_RETRY_DELAY", 0)
+    monkeypatch.setattr(settings, "SCRAPER_MAX_RETRIES", 1)
+    return JobQueue(db_path=str(tmp_path / "jobs.db"))
+
+
+def _expire(queue, job_id):
+    queue._conn().execute("UPDATE jobs SET lease_expires_at = ? WHERE job_id = ?",
+                          (time.time() - 1, job_id))
+
+
+def test_lease_and_complete(queue):
+    job = queue.enqueue(MATCH_URL, "abcdef12", "xlsx")
+    leased = queue.lease("w1")
+    assert leased["job_id"] == job["job_id"]
+    assert leased["status"] == "running" and leased["attempts"] == 1
+    assert queue.lease("w2") is None
+
+    assert queue.update(job["job_id"], "w1", {"status": "scraping", "progress": 40})
+    assert queue.complete(job["job_id"], "w1", "/tmp/report.xlsx")
+    done = queue.get(job["job_id"])
+    assert done["status"] == "completed"
+    assert done["stage"] == "scraping"
+    assert done["file_path"] == "/tmp/report.xlsx"
+    assert done["lease_owner"] is None
+
+
+def test_expired_lease_is_released_to_another_worker(queue):
+    job = queue.enqueue(MATCH_URL, "abcdef12", "xlsx")
+    queue.lease("w1")
+    _expire(queue, job["job_id"])
+
+    released = queue.lease("w2")
+    assert released["job_id"] == job["job_id"]
+    assert released["lease_owner"] == "w2" and released["attempts"] == 2
+
+    # The first worker finishes late: none of its writes may land
+    assert not queue.heartbeat(job["job_id"], "w1")
+    assert not queue.update(job["job_id"], "w1", {"progress": 90})
+    assert not queue.complete(job["job_id"], "w1", "/tmp/stale.xlsx")
+    assert not queue.fail(job["job_id"], "w1", "boom")
+    current = queue.get(job["job_id"])
+    assert current["status"] == "running" and current["lease_owner"] == "w2"
+    assert current["file_path"] is None and current["error"] is None
+
+    assert queue.complete(job["job_id"], "w2", "/tmp/report.xlsx")
+    assert queue.get(job["job_id"])["file_path"] == "/tmp/report.xlsx"
+
+
+def test_failed_attempt_is_retried_then_gives_up(queue):
+    job = queue.enqueue(MATCH_URL, "abcdef12", "xlsx")
+    queue.lease("w1")
+    assert queue.fail(job["job_id"], "w1", "timeout")
+    retried = queue.get(job["job_id"])
+    assert retried["status"] == "queued" and retried["lease_owner"] is None
+    assert retried["error"] == "timeout"
+
+    assert queue.lease("w2")["attempts"] == 2
+    assert not queue.fail(job["job_id"], "w2", "timeout again")
+    failed = queue.get(job["job_id"])
+    assert failed["status"] == "error" and failed["error"] == "timeout again"
+    assert queue.lease("w3") is None
+
+
+def test_retry_waits_for_backoff(queue, monkeypatch):
+    monkeypatch.setattr(settings, "QUEUE_RETRY_DELAY", 60)
+    job = queue.enqueue(MATCH_URL, "abcdef12", "xlsx")
+    queue.lease("w1")
+    assert queue.fail(job["job_id"], "w1", "timeout")
+    assert queue.get(job["job_id"])["next_run_at"] > time.time() + 30
+    assert queue.lease("w2") is None
+
+
+def test_worker_lost_on_final_attempt_marks_error(queue):
+    job = queue.enqueue(MATCH_URL, "abcdef12", "xlsx")
+    queue.lease("w1")
+    _expire(queue, job["job_id"])
+    queue.lease("w2")
+    _expire(queue, job["job_id"])
+
+    assert queue.lease("w3") is None
+    assert queue.get(job["job_id"])["status"] == "error"
+    assert not queue.complete(job["job_id"], "w2", "/tmp/late.xlsx")
+
+
+def test_stopped_job_is_not_completed_or_requeued(queue):
+    job = queue.enqueue(MATCH_URL, "abcdef12", "xlsx")
+    queue.lease("w1")
+    queue._conn().execute("UPDATE jobs SET status = 'stopped' WHERE job_id = ?", (job["job_id"],))
+
+    assert not queue.complete(job["job_id"], "w1", "/tmp/report.xlsx")
+    assert not queue.fail(job["job_id"], "w1", "interrupted")
+    assert queue.get(job["job_id"])["status"] == "stopped"
+    assert queue.lease("w2") is None
+
+
+def test_enqueue_deduplicates_active_jobs(queue):
+    first = queue.enqueue(MATCH_URL, "abcdef12", "xlsx")
+    second = queue.enqueue(MATCH_URL, "abcdef12", "xlsx")
+    assert second["deduplicated"] and second["job_id"] == first["job_id"]
+    assert not queue.enqueue(MATCH_URL, "abcdef12", "csv")["deduplicated"]
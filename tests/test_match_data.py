@@ -0,0 +1,42 @@
+from app.scraper.fetchers import PageFetcher
+from app.scraper.match_data import MatchDataScraper
+
+MATCH_URL = "/en/matches/cc5b4244/Arsenal-Southampton-October-5-2024-Premier-League"
+ARSENAL, SOUTHAMPTON = "18bb7c10", "33c895d4"
+
+
+def _table(table_id, player):
+    return (
+        f"<table id=\"{table_id}\"><thead><tr><th data-stat=\"player\">Player</th>"
+        "<th data-stat=\"minutes\">Min</th></tr></thead>"
+        f"<tbody><tr><th data-stat=\"player\">{player}</th><td data-stat=\"minutes\">90</td></tr></tbody></table>"
+    )
+
+
+# Real FBref id shapes: squad links in the scorebox, team tables keyed by squad id
+PAGE = (
+    "<html><body>"
+    "<div id=\"header\"><a href=\"/en/squads/ffffffff/Elsewhere-Stats\">Elsewhere</a></div>"
+    "<div class=\"scorebox\">"
+    f"<div><strong><a href=\"/en/squads/{ARSENAL}/Arsenal-Stats\">Arsenal</a></strong></div>"
+    f"<div><strong><a href=\"/en/squads/{SOUTHAMPTON}/Southampton-Stats\">Southampton</a></strong></div>"
+    "</div>"
+    + _table(f"stats_{ARSENAL}_summary", "Bukayo Saka")
+    + _table(f"keeper_stats_{ARSENAL}", "David Raya")
+    + _table(f"stats_{SOUTHAMPTON}_summary", "Tyler Dibling")
+    + _table("shots_all", "Bukayo Saka")
+    + "</body></html>"
+)
+
+
+def test_team_tables_are_assigned_by_scorebox_squad_id():
+    match = MatchDataScraper(fetcher=PageFetcher()).parse_match(PAGE, MATCH_URL)
+    assert list(match["home_team"]) == [f"home_stats_{ARSENAL}_summary_0", f"home_keeper_stats_{ARSENAL}_0"]
+    assert list(match["away_team"]) == [f"away_stats_{SOUTHAMPTON}_summary_0"]
+    assert match["away_team"][f"away_stats_{SOUTHAMPTON}_summary_0"]["player"].tolist() == ["Tyler Dibling"]
+
+
+def test_page_without_scorebox_has_no_team_tables():
+    page = "<html><body><h1>Page Not Found</h1>" + _table("stats_home_summary", "Nobody") + "</body></html>"
+    match = MatchDataScraper(fetcher=PageFetcher()).parse_match(page, MATCH_URL)
+    assert match["home_team"] == {} and match["away_team"] == {}
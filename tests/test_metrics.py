@@ -0,0 +1,30 @@
+from app.scraper.player_crawler import PlayerCrawler
+from app.utils.metrics import collect_spans, span, stage_summary
+
+
+class FakeMatchScraper:
+    def scrape_player_data(self, url):
+        with span("page_load", page_type="player"):
+            pass
+        with span("parse", page_type="player"):
+            pass
+        return {"url": url}
+
+
+def test_player_crawl_spans_reach_the_report_collector():
+    players = [{"id": str(i), "name": f"Player {i}", "url": f"/en/players/{i}/"} for i in range(6)]
+    with collect_spans() as spans:
+        with span("page_load", page_type="match"):
+            pass
+        PlayerCrawler(FakeMatchScraper(), max_workers=3).crawl(players)
+
+    assert sum(1 for item in spans if item.attrs.get("page_type") == "player") == 12
+    assert set(stage_summary(spans)) == {"page_load", "parse"}
+
+
+def test_spans_outside_a_collector_are_not_kept():
+    with collect_spans() as spans:
+        pass
+    with span("parse"):
+        pass
+    assert spans == []
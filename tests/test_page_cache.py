@@ -0,0 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from app.scraper.fetchers import CachingFetcher, FetchResult, PageFetcher
+from app.scraper.page_cache import PageCache
+
+PAST_FIXTURES = "https://fbref.com/en/matches/2020-01-01"
+PAGE = "<html><body><div id=\"content\"><table></table></div></body></html>"
+
+
+class StaticFetcher(PageFetcher):
+    engine = "http"
+
+    def fetch(self, url, page_type="page", headers=None):
+        return FetchResult(url=url, html=PAGE, engine=self.engine, status=200)
+
+
+def test_hits_and_misses_are_counted(tmp_path):
+    cache = PageCache(cache_dir=str(tmp_path))
+    fetcher = CachingFetcher(StaticFetcher(), cache)
+    for _ in range(3):
+        fetcher.fetch(PAST_FIXTURES, "fixtures")
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+
+
+def test_counts_are_exact_under_concurrent_fetch_threads(tmp_path):
+    cache = PageCache(cache_dir=str(tmp_path))
+    threads, per_thread = 16, 2000
+
+    def bump(_):
+        for _ in range(per_thread):
+            cache.count("hits")
+            cache.count("misses")
+
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(bump, range(threads)))
+    stats = cache.stats()
+    assert stats["hits"] == stats["misses"] == threads * per_thread
+    assert stats["revalidations"] == 0
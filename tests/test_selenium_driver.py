@@ -0,0 +1,34 @@
+import re
+
+import pytest
+
+from app.scraper.selenium_driver import BLOCK_PATTERNS
+
+
+def _blocked(url, patterns):
+    """Network.setBlockedURLs semantics: a pattern matches the whole URL and
+    "*" stands for any run of characters"""
+    return any(re.fullmatch(".*".join(map(re.escape, pattern.split("*"))), url) for pattern in patterns)
+
+
+@pytest.mark.parametrize("category, url", [
+    ("images", "https://fbref.com/req/images/logo.png"),
+    ("images", "https://fbref.com/req/images/logo.png?v=3"),
+    ("images", "https://cdn.ssref.net/req/202410/images/headshots/abc_2022.jpg?x=1&y=2"),
+    ("fonts", "https://fbref.com/fonts/site.woff2?v=2"),
+    ("fonts", "https://fonts.gstatic.com/s/roboto/v30/abc.woff2"),
+    ("media", "https://video.example.com/clip.mp4?token=abc"),
+])
+def test_asset_urls_are_blocked_with_or_without_query_string(category, url):
+    assert _blocked(url, BLOCK_PATTERNS[category])
+
+
+@pytest.mark.parametrize("url", [
+    "https://fbref.com/en/matches/2024-10-05",
+    "https://fbref.com/en/matches/abcdef12/Home-FC-Away-United",
+    "https://fbref.com/en/players/1234abcd/Some-Player",
+    "https://fbref.com/en/players/1234abcd/Some-Player?ref=png",
+    "https://fbref.com/css/site.css?v=3",
+])
+def test_pages_are_not_blocked(url):
+    assert not any(_blocked(url, patterns) for patterns in BLOCK_PATTERNS.values())
@@ -0,0 +1,64 @@
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from app.scraper.core import FBrefScraper
+from app.scraper.fetchers import PageFetcher
+from app.services.warehouse import Warehouse
+
+MATCH_URL = "/en/matches/abcdef12/Home-FC-Away-United"
+YESTERDAY = (date.today() - timedelta(days=1)).isoformat()
+FIXTURE = {"league": "Premier League", "league_id": "9", "date": YESTERDAY, "time": "15:00",
+           "home_team": "Home FC", "away_team": "Away United", "score": "", "match_url": MATCH_URL,
+           "match_id": "abcdef12"}
+
+
+def _at(day: str, hour: int) -> float:
+    return (datetime.fromisoformat(day) + timedelta(hours=hour)).timestamp()
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    store = Warehouse(db_path=str(tmp_path / "warehouse.db"))
+    store.upsert_fixtures(YESTERDAY, None, [FIXTURE])
+    store.upsert_match({
+        "match_info": {"match_id": "abcdef12", "url": MATCH_URL},
+        "home_team": {"summary": pd.DataFrame({"player": ["A. Player"], "goals": [1]})},
+        "away_team": {"summary": pd.DataFrame({"player": ["B. Player"], "goals": [0]})},
+        "players": [],
+    })
+    return store
+
+
+def _scraped_at(warehouse, scraped_at):
+    conn = warehouse._conn()
+    conn.execute("UPDATE matches SET scraped_at = ?", (scraped_at,))
+    conn.execute("UPDATE fixture_scrapes SET scraped_at = ?", (scraped_at,))
+
+
+def test_match_day_scrape_expires_the_day_after(warehouse):
+    # Scraped at half time yesterday, read back today
+    _scraped_at(warehouse, _at(YESTERDAY, 16))
+    assert warehouse.fresh_match(MATCH_URL) is None
+    assert warehouse.fresh_fixtures(YESTERDAY) is None
+
+
+def test_scrape_after_match_day_is_final(warehouse):
+    _scraped_at(warehouse, _at(YESTERDAY, 24))
+    match = warehouse.fresh_match(MATCH_URL)
+    assert match is not None and list(match["home_team"]) == ["summary"]
+    assert [fixture["match_id"] for fixture in warehouse.fresh_fixtures(YESTERDAY)] == ["abcdef12"]
+
+
+def test_match_without_team_tables_is_not_stored(tmp_path):
+    store = Warehouse(db_path=str(tmp_path / "warehouse.db"))
+    error_page = {"match_info": {"match_id": "abcdef12", "url": MATCH_URL},
+                  "home_team": {}, "away_team": {}, "players": []}
+    assert store.upsert_match(error_page) is False
+    assert not store.has_match("abcdef12")
+
+    scraper = FBrefScraper(fetcher=PageFetcher(), warehouse=store)
+    scraper.match_scraper.scrape_match = lambda match_url: error_page
+    assert scraper.scrape_match_data(MATCH_URL, refresh=True) == {}
+    assert not store.has_match("abcdef12")